@@ -0,0 +1,90 @@
+"""
+Генераторы тестовых задач. Каждая функция детерминирована по seed и возвращает словарь
+с ключами c, A, b, senses (задача на максимум) и bounds (None — все x >= 0).
+"""
+import random
+
+
+def random_dense(m, n, seed=0):
+    """Плотная задача c > 0, A >= 0, b > 0: допустима и ограничена."""
+    rng = random.Random(seed)
+    A = [[rng.randint(0, 9) for _ in range(n)] for _ in range(m)]
+    b = [rng.randint(10 * n, 50 * n) for _ in range(m)]
+    c = [rng.randint(1, 20) for _ in range(n)]
+    return {'c': c, 'A': A, 'b': b, 'senses': ['<='] * m, 'bounds': None}
+
+
+def transportation(sources, sinks, seed=0):
+    """
+    Транспортная задача: минимум стоимости перевозок (цель умножена на -1), запасы <= supply,
+    спрос >= demand. A — разреженная тройка CSR, в каждом столбце по две единицы.
+    """
+    rng = random.Random(seed)
+    demand = [rng.randint(5, 30) for _ in range(sinks)]
+    supply = [rng.randint(5, 30) for _ in range(sources)]
+    # total supply covers total demand
+    supply[0] += max(0, sum(demand) - sum(supply))
+    c = [-rng.randint(1, 20) for _ in range(sources * sinks)]
+    data, indices, indptr = [], [], [0]
+    for i in range(sources):
+        for j in range(sinks):
+            data.append(1)
+            indices.append(i * sinks + j)
+        indptr.append(len(data))
+    for j in range(sinks):
+        for i in range(sources):
+            data.append(1)
+            indices.append(i * sinks + j)
+        indptr.append(len(data))
+    return {
+        'c': c, 'A': (data, indices, indptr), 'b': supply + demand,
+        'senses': ['<='] * sources + ['>='] * sinks, 'bounds': None,
+    }
+
+
+def assignment(n, seed=0):
+    """Задача о назначениях n x n: максимум суммарной выгоды, равенства по строкам и столбцам."""
+    rng = random.Random(seed)
+    c = [rng.randint(1, 50) for _ in range(n * n)]
+    A = []
+    for i in range(n):
+        A.append([int(k // n == i) for k in range(n * n)])
+    for j in range(n):
+        A.append([int(k % n == j) for k in range(n * n)])
+    return {'c': c, 'A': A, 'b': [1] * (2 * n), 'senses': ['=='] * (2 * n), 'bounds': None}
+
+
+def knapsack(n, rows=1, seed=0):
+    """Многомерный рюкзак с целыми переменными 0/1."""
+    rng = random.Random(seed)
+    A = [[rng.randint(5, 40) for _ in range(n)] for _ in range(rows)]
+    b = [sum(row) // 2 for row in A]
+    c = [rng.randint(5, 60) for _ in range(n)]
+    return {'c': c, 'A': A, 'b': b, 'senses': ['<='] * rows, 'bounds': [(0, 1)] * n}
+
+
+def set_cover(universe, sets, seed=0):
+    """
+    Покрытие множествами: минимум стоимости (цель умножена на -1), каждый элемент покрыт
+    хотя бы одним выбранным множеством, переменные 0/1.
+    """
+    rng = random.Random(seed)
+    members = [set(rng.sample(range(universe), rng.randint(2, max(2, universe // 3)))) for _ in range(sets)]
+    # every element belongs to at least one set
+    for e in range(universe):
+        if not any(e in s for s in members):
+            members[rng.randrange(sets)].add(e)
+    A = [[int(e in s) for s in members] for e in range(universe)]
+    c = [-rng.randint(1, 10) for _ in range(sets)]
+    return {'c': c, 'A': A, 'b': [1] * universe, 'senses': ['>='] * universe, 'bounds': [(0, 1)] * sets}
+
+
+def klee_minty(n, seed=0):
+    """
+    Куб Кли — Минти: max sum 2^(n-j) x_j, 2 * sum_{j<i} 2^(i-j) x_j + x_i <= 5^i.
+    Правило Данцига проходит все 2^n вершин. seed не используется.
+    """
+    c = [2 ** (n - 1 - j) for j in range(n)]
+    A = [[2 ** (i - j + 1) if j < i else int(j == i) for j in range(n)] for i in range(n)]
+    b = [5 ** (i + 1) for i in range(n)]
+    return {'c': c, 'A': A, 'b': b, 'senses': ['<='] * n, 'bounds': None}
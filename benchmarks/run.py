@@ -0,0 +1,145 @@
+"""
+Набор бенчмарков: python -m benchmarks.run [--only NAME] [--save FILE] [--compare FILE].
+Для каждой задачи записываются время (лучшее из --repeat запусков), число пивотов
+(для solve_integer — число узлов) и пиковая память по tracemalloc. --compare сравнивает
+с сохранённым JSON и завершается с кодом 1 при регрессии.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from simplex import simplex, dual_simplex, solve_integer
+
+from . import generators as gen
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+# (имя, генератор, параметры, решатели)
+SUITE = [
+    ('dense-10x15', gen.random_dense, {'m': 10, 'n': 15}, ('simplex', 'dual_simplex')),
+    ('dense-25x40', gen.random_dense, {'m': 25, 'n': 40}, ('simplex', 'dual_simplex')),
+    ('transport-4x6', gen.transportation, {'sources': 4, 'sinks': 6}, ('simplex', 'dual_simplex')),
+    ('transport-8x10', gen.transportation, {'sources': 8, 'sinks': 10}, ('simplex',)),
+    ('assignment-6', gen.assignment, {'n': 6}, ('simplex', 'dual_simplex')),
+    ('klee-minty-6', gen.klee_minty, {'n': 6}, ('simplex', 'dual_simplex')),
+    ('knapsack-12', gen.knapsack, {'n': 12, 'rows': 2}, ('solve_integer',)),
+    ('set-cover-10x14', gen.set_cover, {'universe': 10, 'sets': 14}, ('solve_integer',)),
+]
+
+SOLVERS = {'simplex': simplex, 'dual_simplex': dual_simplex}
+
+
+def solve(solver, p):
+    """Один запуск; возвращает (status, objective, pivots, nodes)."""
+    if solver == 'solve_integer':
+        res, _ = solve_integer(p['c'], p['A'], p['b'], p['senses'], bounds=p['bounds'])
+        return res.status, res.objective, None, res.stats.nodes
+    res = SOLVERS[solver](p['c'], p['A'], p['b'], p['senses'], bounds=p['bounds'], record_history='none',
+                          pricing='dantzig')
+    return res.status, res.objective, res.stats.total_pivots, None
+
+
+def measure(solver, p, repeat=3):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        status, objective, pivots, nodes = solve(solver, p)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    # a separate run: tracemalloc slows the solver down and would distort the timing
+    tracemalloc.start()
+    try:
+        solve(solver, p)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        'status': status, 'objective': objective, 'pivots': pivots, 'nodes': nodes,
+        'time': round(best, 6), 'peak_kib': round(peak / 1024, 1),
+    }
+
+
+def run(only=None, repeat=3, seed=0):
+    """Результаты {'<задача>/<решатель>': {...}} для задач SUITE, имя которых содержит only."""
+    results = {}
+    for name, make, params, solvers in SUITE:
+        if only and only not in name:
+            continue
+        p = make(seed=seed, **params)
+        for solver in solvers:
+            results[f'{name}/{solver}'] = measure(solver, p, repeat)
+    return results
+
+
+def compare(current, baseline, tolerance=0.25, min_time=0.005):
+    """
+    Регрессии относительно baseline: другой статус или цель, больше пивотов или узлов,
+    время или память выше базовых более чем в (1 + tolerance) раз. Разница по времени
+    меньше min_time секунд считается шумом.
+    """
+    problems = []
+    for key, cur in current.items():
+        base = baseline.get(key)
+        if base is None:
+            continue
+        if cur['status'] != base['status'] or not _same(cur['objective'], base['objective']):
+            problems.append(f"{key}: result changed {base['status']} {base['objective']} -> "
+                            f"{cur['status']} {cur['objective']}")
+        for field in ('pivots', 'nodes'):
+            if base.get(field) is not None and cur[field] is not None and cur[field] > base[field]:
+                problems.append(f"{key}: {field} {base[field]} -> {cur[field]}")
+        if cur['time'] > base['time'] * (1 + tolerance) and cur['time'] - base['time'] > min_time:
+            problems.append(f"{key}: time {base['time']:.4f}s -> {cur['time']:.4f}s")
+        if cur['peak_kib'] > base['peak_kib'] * (1 + tolerance):
+            problems.append(f"{key}: peak memory {base['peak_kib']} KiB -> {cur['peak_kib']} KiB")
+    return problems
+
+
+def _same(a, b):
+    if a is None or b is None:
+        return a is b
+    return abs(a - b) <= 1e-6 * max(1.0, abs(b))
+
+
+def report(results, out=sys.stdout):
+    print(f"{'benchmark':32} {'status':10} {'objective':>14} {'pivots':>7} {'nodes':>6} "
+          f"{'time, s':>9} {'peak, KiB':>10}", file=out)
+    for key, r in results.items():
+        objective = '' if r['objective'] is None else f"{r['objective']:.6g}"
+        pivots = '' if r['pivots'] is None else r['pivots']
+        nodes = '' if r['nodes'] is None else r['nodes']
+        print(f"{key:32} {r['status']:10} {objective:>14} {pivots:>7} {nodes:>6} "
+              f"{r['time']:>9.4f} {r['peak_kib']:>10}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--only', help='run only benchmarks whose name contains this string')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--save', metavar='FILE', help='write the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='FILE', nargs='?', const=BASELINE,
+                        help=f'compare with a JSON baseline (default {BASELINE})')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args(argv)
+
+    results = run(args.only, args.repeat)
+    report(results)
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write('\n')
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        problems = compare(results, baseline, args.tolerance)
+        for line in problems:
+            print('REGRESSION', line)
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
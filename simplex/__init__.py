@@ -1,7 +1,13 @@
 from .base import simplex, SimplexResult
 from .bnb import solve_integer
 from .dual import dual_simplex
-# from .gomory import gomory_integer
+from .revised import revised_simplex
+from .batch import solve_batch
+from .hybrid import hybrid_simplex
+from .parametric import parametric_rhs, parametric_cost
+from .model import LPModel
+from .gomory import gomory_integer, gomory_cuts
+from .interior import interior_point
 # For backward compatibility with old UI code
 bnb = solve_integer
 
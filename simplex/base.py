@@ -1,14 +1,43 @@
 from copy import deepcopy
 from fractions import Fraction as F
 
+from .bounds import nonnegative_rhs
+from .history import Pivot, PhaseChange, new_history
+from .pricing import STALL_LIMIT, BlandPricing, get_pricing, get_dual_pricing
+from .sparse import is_sparse, to_dense
+from .stats import Monitor, SolveAborted, SolveStats
+
 class SimplexResult:
-    def __init__(self, status, x=None, objective=None, alternative=False, tableau=None, history=None):
+    def __init__(self, status, x=None, objective=None, alternative=False, tableau=None, history=None,
+                 basis=None, bounds=None, stats=None, bound=None):
         self.status = status
         self.x = x or []
         self.objective = float(objective) if objective is not None else None
         self.alternative = alternative
         self.tableau = tableau  # финальная таблица (после завершения)
-        self.history = history or []  # список таблиц по шагам
+        self.history = history if history is not None else []  # список таблиц (или журнал Pivot) по шагам
+        self.basis = basis  # номера базисных столбцов по строкам (для warm_start)
+        self.bounds = bounds  # состояние границ столбцов таблицы (Bounds), если заданы bounds
+        self.stats = stats if stats is not None else SolveStats()  # статистика решения (simplex.stats)
+        self.bound = float(bound) if bound is not None else None  # двойственная граница цели при остановке по лимиту
+        self.problem = None  # исходная задача (c, A, b, senses) для анализа чувствительности
+        self._sensitivity = None
+
+    @property
+    def sensitivity(self):
+        """Анализ чувствительности (simplex.sensitivity.Sensitivity), считается при первом обращении."""
+        if self._sensitivity is None:
+            from .sensitivity import sensitivity
+            self._sensitivity = sensitivity(self)
+        return self._sensitivity
+
+    @property
+    def duals(self):
+        return self.sensitivity.duals
+
+    @property
+    def reduced_costs(self):
+        return self.sensitivity.reduced_costs
 
 def pivot(tableau, basis, row, col):
     piv = tableau[row][col]
@@ -82,12 +111,11 @@ def build_tableau(c, A, b, senses, phase):
 
     # cost row
     if phase == 1:
-        total_cols = n + slack_count + art_count + 1
-        cost = [F(0)] * (n + slack_count) + [F(0)] * art_count + [F(0)]
-        # sum artificial rows
-        for i in range(m):
-            for j in range(len(cost)):
-                cost[j] -= tableau[i][j]
+        # sum of rows with an artificial ('<=' rows start from their slack, see phase1_basis);
+        # artificial columns keep zero cost so they never re-enter
+        rows = [row for row, s in zip(tableau, senses) if s != '<=']
+        cost = [-sum(col, F(0)) for col in zip(*rows)] if rows else [F(0)] * (n + slack_count + art_count + 1)
+        cost[n + slack_count:-1] = [F(0)] * art_count
         tableau.append(cost)
     else:
         cost = list(map(lambda v: -F(v), c)) + [F(0)] * slack_count + [F(0)]
@@ -104,55 +132,527 @@ def extract_solution(tableau, basis, n):
     return x
 
 
-def simplex(c, A, b, senses=None):
-    m, n = len(A), len(c)
-    if senses is None:
-        senses = ['<='] * m
-    history = []
-    # Phase I
-    T, slack_count, art_count = build_tableau(c, A, b, senses, phase=1)
-    basis = [n + slack_count + i for i in range(m)]  # artificials in basis
-    history.append(deepcopy(T))
-    # remove fake rows if slack-only
+class FractionBackend:
+    """Точная арифметика: таблица — список списков Fraction."""
+    name = 'fraction'
+    eps = 0
+
+    def build(self, c, A, b, senses, phase):
+        return build_tableau(c, to_dense(A, len(b), len(c)), b, senses, phase)
+
+    def pivot(self, T, basis, row, col):
+        pivot(T, basis, row, col)
+
+    def entering(self, T):
+        return bland_rule(T, T[-1])
+
+    def negative_costs(self, T, start=0, stop=None):
+        stop = len(T[-1]) - 1 if stop is None else stop
+        return [(j, v) for j, v in enumerate(T[-1][start:stop], start) if v < 0]
+
+    def width(self, T):
+        return len(T[-1]) - 1
+
+    def column_norms(self, T, cols):
+        return [sum(float(row[j]) ** 2 for row in T[:-1]) for j in cols]
+
+    def row_nonzeros(self, T, row):
+        return [(j, v) for j, v in enumerate(T[row][:-1]) if v != 0]
+
+    def leaving(self, T, basis, col):
+        return find_leaving_variable(T, basis, col)
+
+    def dual_leaving(self, T):
+        # most negative RHS
+        return min(
+            (i for i in range(len(T) - 1) if T[i][-1] < 0),
+            default=None,
+            key=lambda i: T[i][-1]
+        )
+
+    def negative_rhs(self, T):
+        return [(i, row[-1]) for i, row in enumerate(T[:-1]) if row[-1] < 0]
+
+    def row_norms(self, T, rows):
+        return [sum(float(v) ** 2 for v in T[i][:-1]) for i in rows]
+
+    def dual_ratios(self, T, row, ncols):
+        # (j, d_j, |a_rj|) over negative coefficients of the pivot row
+        return [(j, T[-1][j], -v) for j, v in enumerate(T[row][:ncols]) if v < 0]
+
+    def dual_entering(self, T, row, ncols):
+        # min ratio d_j / |a_rj| over negative coefficients of the pivot row
+        candidates = [
+            (j, T[-1][j] / -T[row][j])
+            for j in range(ncols) if T[row][j] < 0
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda t: (t[1], t[0]))[0]
+
+    def objective(self, T):
+        return T[-1][-1]
+
+    def is_zero(self, v):
+        return v == 0
+
+    def drop_columns(self, T, start, stop):
+        for row in T:
+            del row[start:stop]
+        return T
+
+    def set_cost(self, T, c, slack_count, basis):
+        n = len(c)
+        T[-1] = list(map(lambda v: -F(v), c)) + [F(0)] * slack_count + [F(0)]
+        for i, var in enumerate(basis):
+            if var < n + slack_count:
+                coef = T[-1][var]
+                if coef != 0:
+                    for j in range(len(T[0])):
+                        T[-1][j] -= coef * T[i][j]
+        return T
+
+    def add_row(self, T, basis, coeffs, rhs, ncols):
+        # new constraint coeffs·x + s = rhs, slack s becomes column ncols
+        for row in T:
+            row.insert(ncols, F(0))
+        new = [F(0)] * (ncols + 2)
+        new[:len(coeffs)] = map(F, coeffs)
+        new[ncols] = F(1)
+        new[-1] = F(rhs)
+        for i, var in enumerate(basis):
+            if var < ncols and new[var] != 0:
+                factor = new[var]
+                new = [a - factor * b for a, b in zip(new, T[i])]
+        T.insert(len(T) - 1, new)
+        basis.append(ncols)
+        return T
+
+    def add_column(self, T, col, values, coeffs):
+        # new column at index col: values are B^-1 a and the cost-row entry, coeffs are a and the cost
+        for row, v in zip(T, values):
+            row.insert(col, F(v))
+        return T
+
+    def remove_row(self, T, row):
+        del T[row]
+        return T
+
+    def shift(self, T, col, delta):
+        # substitute x_col = x_col' + delta
+        delta = F(delta)
+        for row in T:
+            row[-1] -= row[col] * delta
+
+    def add_rhs(self, T, delta):
+        # column of right-hand sides (the cost row included) moves by delta
+        for row, d in zip(T, delta):
+            row[-1] += F(d)
+
+    def complement(self, T, basis, col, bound):
+        # substitute x_col = bound - x_col'
+        self.shift(T, col, bound)
+        for row in T:
+            row[col] = -row[col]
+        if col in basis:
+            r = basis.index(col)
+            T[r] = [-v for v in T[r]]
+
+    def extract(self, T, basis, n):
+        return extract_solution(T, basis, n)
+
+    def snapshot(self, T):
+        return deepcopy(T)
+
+
+def get_backend(backend, A=None, m=None):
+    """
+    Возвращает движок арифметики по имени ('fraction', 'float', 'sparse', 'integer')
+    или сам объект движка.
+    При backend=None выбирается 'sparse' для разреженной A (m строк) и 'fraction' иначе.
+    """
+    if backend is None:
+        backend = 'sparse' if A is not None and is_sparse(A, m) else 'fraction'
+    if not isinstance(backend, str):
+        return backend
+    if backend == 'fraction':
+        return FractionBackend()
+    if backend == 'float':
+        from .floating import FloatBackend
+        return FloatBackend()
+    if backend == 'sparse':
+        from .sparse import SparseBackend
+        return SparseBackend()
+    if backend == 'integer':
+        from .integer import IntegerBackend
+        return IntegerBackend()
+    raise ValueError(f"Unknown backend: {backend!r}")
+
+
+def optimize(be, T, basis, history, pricing='bland', bounds=None):
+    """
+    Итерации прямого симплекса. Возвращает False, если ведущая строка не найдена.
+    После STALL_LIMIT вырожденных шагов подряд входящая переменная выбирается по Бланду,
+    пока не будет сделан невырожденный шаг.
+    bounds: верхние границы переменных (Bounds) — переменная, дошедшая до своей границы,
+    переводится в дополнение вместо пивота.
+    """
+    rule = get_pricing(pricing)
+    bland = BlandPricing()
+    stalled = 0
     while True:
-        col = bland_rule(T, T[-1])
+        col = (bland if stalled >= STALL_LIMIT else rule).select(be, T)
         if col is None:
-            break
-        row = find_leaving_variable(T, basis, col)
+            return True
+        if bounds is None:
+            row, upper = be.leaving(T, basis, col), False
+        else:
+            row, upper = bounds.leaving(be, T, basis, col)
         if row is None:
-            return SimplexResult("infeasible", tableau=deepcopy(T), history=history)
-        pivot(T, basis, row, col)
-        history.append(deepcopy(T))
-    if T[-1][-1] != 0:
-        return SimplexResult("infeasible", tableau=deepcopy(T), history=history)
-    # remove artificial columns and cost row
-    # strip artificial vars
-    for i in range(len(T)):
-        # remove columns n+slack_count to n+slack_count+art_count
-        del T[i][n+slack_count:n+slack_count+art_count]
-    # Phase II cost integration
-    T[-1] = list(map(lambda v: -F(v), c)) + [F(0)] * slack_count + [F(0)]
-    for i, var in enumerate(basis):
-        if var < n + slack_count:
-            coef = T[-1][var]
-            if coef != 0:
-                for j in range(len(T[0])):
-                    T[-1][j] -= coef * T[i][j]
-    history.append(deepcopy(T))
-    # Phase II
+            if not upper:
+                return False
+            bounds.flip(be, T, basis, col, history)
+            stalled = 0
+            continue
+        if upper:
+            bounds.flip(be, T, basis, basis[row], history)
+        stalled = stalled + 1 if be.is_zero(T[row][-1]) else 0
+        rule.update(be, T, basis, row, col)
+        history.check(T)
+        event = Pivot(row, col, col, basis[row])
+        be.pivot(T, basis, row, col)
+        history.record(T, event)
+
+
+def dual_optimize(be, T, basis, ncols, history, bounds=None, pricing='steepest'):
+    """
+    Итерации двойственного симплекса. Возвращает False, если задача несовместна.
+    pricing — правило выбора уходящей строки (DUAL_PRICING). С bounds тест отношений
+    длинный: столбцы с верхними границами на пройденных изломах переводятся в дополнение.
+    """
+    rule = get_dual_pricing(pricing)
     while True:
-        col = bland_rule(T, T[-1])
-        if col is None:
-            break
-        row = find_leaving_variable(T, basis, col)
+        if bounds is not None:
+            bounds.repair(be, T, basis, history)
+        row = rule.select(be, T)
         if row is None:
-            return SimplexResult("unbounded", tableau=deepcopy(T), history=history)
-        pivot(T, basis, row, col)
-        history.append(deepcopy(T))
-    x = extract_solution(T, basis, n)
-    obj = T[-1][-1]
-    alt_main = any(j < n and j not in basis and T[-1][j] == 0 for j in range(n))
+            return True
+        if bounds is None:
+            col = be.dual_entering(T, row, ncols)
+        else:
+            col = bounds.dual_entering(be, T, basis, row, ncols, history)
+        if col is None:
+            return False
+        history.check(T)
+        event = Pivot(row, col, col, basis[row])
+        be.pivot(T, basis, row, col)
+        history.record(T, event)
+
+
+def alternative_optimum(c, m, basis, reduced, is_zero):
+    """
+    Признак альтернативного оптимума: нулевая приведённая стоимость reduced[j] небазисной
+    структурной переменной, нулевая цель или избыточные строки (m > n при c > 0).
+    """
+    n = len(c)
+    alt_main = any(j not in basis and is_zero(reduced[j]) for j in range(n))
     alt_zero_c = all(ci == 0 for ci in c)
     alt_redundant = (m > n and all(ci > 0 for ci in c))
-    alternative = alt_main or alt_zero_c or alt_redundant
-    return SimplexResult("optimal", x, obj, alternative, tableau=deepcopy(T), history=history)
+    return alt_main or alt_zero_c or alt_redundant
+
+
+def finish(be, T, basis, c, m, n, history, bounds=None):
+    x = be.extract(T, basis, n)
+    obj = be.objective(T)
+    if bounds is not None:
+        x = bounds.values(x)
+        obj = obj + bounds.offset
+    alternative = alternative_optimum(c, m, basis, T[-1], be.is_zero)
+    return SimplexResult("optimal", x, obj, alternative, tableau=T, history=history, basis=list(basis),
+                         bounds=bounds)
+
+
+def end_phase1(be, T, basis, c, n, slack_count, art_count, history):
+    """Удаляет искусственные столбцы и строит строку цели Phase II."""
+    start, stop = n + slack_count, n + slack_count + art_count
+    T = be.drop_columns(T, start, stop)
+    T = be.set_cost(T, c, slack_count, basis)
+    history.record(T, PhaseChange(start, stop))
+    return T
+
+
+def phase1_basis(senses, n, slack_count):
+    """
+    Начальный базис Phase I: slack для строк '<=', для остальных — искусственная
+    переменная строки (фиктивный индекс n + slack_count + i).
+    """
+    basis, slack = [], n
+    for i, s in enumerate(senses):
+        basis.append(slack if s == '<=' else n + slack_count + i)
+        slack += s != '=='
+    return basis
+
+
+def crash(be, T, basis, ncols, history, bounds=None):
+    """
+    Crash-базис для Phase I: столбцы просматриваются от самых разреженных, и столбец
+    вводится в базис, если по тесту отношений уходит искусственная переменная — базис
+    остаётся допустимым, а каждый пивот снимает одну искусственную переменную.
+    """
+    left = sum(var >= ncols for var in basis)
+    if not left:
+        return
+    counts = [0] * ncols
+    for r in range(len(basis)):
+        for j, _ in be.row_nonzeros(T, r):
+            if j < ncols:
+                counts[j] += 1
+    in_basis = set(basis)
+    for j in sorted(range(ncols), key=lambda j: (counts[j], j)):
+        if not left:
+            return
+        if j in in_basis or not counts[j]:
+            continue
+        if bounds is None:
+            row, upper = be.leaving(T, basis, j), False
+        else:
+            row, upper = bounds.leaving(be, T, basis, j)
+        if row is None or upper or basis[row] < ncols:
+            continue
+        history.check(T)
+        event = Pivot(row, j, j, basis[row])
+        be.pivot(T, basis, row, j)
+        history.record(T, event)
+        in_basis.add(j)
+        left -= 1
+
+
+def drive_out_artificials(be, T, basis, ncols, history):
+    """
+    Выводит из базиса искусственные переменные, оставшиеся на нулевом уровне после Phase I,
+    вырожденными пивотами: иначе их строки перестают ограничивать небазисные столбцы.
+    """
+    for r, var in enumerate(basis):
+        if var < ncols or not be.is_zero(T[r][-1]):
+            continue
+        col = next((j for j, v in be.row_nonzeros(T, r) if j < ncols and j not in basis), None)
+        if col is not None:
+            event = Pivot(r, col, col, var)
+            be.pivot(T, basis, r, col)
+            history.record(T, event)
+
+
+def set_phase(monitor, name):
+    if monitor is not None:
+        monitor.phase(name)
+
+
+def watch(monitor, basis, n, bounds=None):
+    """Сообщает монитору базис текущей таблицы: по нему собирается результат при остановке."""
+    if monitor is not None:
+        monitor.state = (basis, n, bounds)
+
+
+def stopped_result(be, exc, monitor):
+    """
+    Результат прерванного решения. Если текущий базис прямо допустим (после Phase I),
+    x и objective — лучшая найденная точка; если двойственно допустим, bound — верхняя
+    граница цели.
+    """
+    T = exc.tableau
+    res = SimplexResult(exc.status, tableau=T)
+    if T is None or monitor.state is None or monitor.current in (None, 'phase1'):
+        return res
+    basis, n, bounds = monitor.state
+    value = be.objective(T) + (bounds.offset if bounds is not None else 0)
+    if be.entering(T) is None:
+        res.bound = float(value)
+    feasible = be.dual_leaving(T) is None and (bounds is None or all(
+        bounds.width(var) is None or T[i][-1] <= bounds.width(var) + be.eps for i, var in enumerate(basis)
+    ))
+    if feasible:
+        x = be.extract(T, basis, n)
+        res.x = bounds.values(x) if bounds is not None else x
+        res.objective = float(value)
+        res.basis = list(basis)
+    return res
+
+
+def monitored(be, monitor, solve):
+    """
+    Запускает solve() и прикрепляет к результату статистику монитора. Если решение
+    прервано callback или лимитом, возвращается stopped_result.
+    """
+    try:
+        res = solve()
+    except SolveAborted as exc:
+        res = stopped_result(be, exc, monitor)
+    # the callback is not kept in the result (it may not be picklable)
+    if getattr(res.history, 'monitor', None) is not None:
+        res.history.monitor = None
+    res.stats = monitor.finish()
+    return res
+
+
+def install_basis(be, T, basis, target, ncols, history):
+    """
+    Вводит в базис столбцы target (< ncols) поочерёдными пивотами. Строки, для которых
+    не нашлось столбца, сохраняют фиктивный индекс >= ncols.
+    """
+    m = len(basis)
+    for k, var in enumerate(target):
+        if not 0 <= var < ncols or var in basis:
+            continue
+        rows = [r for r in range(m) if basis[r] >= ncols and not be.is_zero(T[r][var])]
+        if not rows:
+            continue
+        row = max(rows, key=lambda r: (r == k, abs(T[r][var])))
+        event = Pivot(row, var, var, basis[row])
+        be.pivot(T, basis, row, var)
+        history.record(T, event)
+
+
+def warm_solve(be, c, A, b, senses, warm_start, record_history, pricing, monitor=None, dual_pricing='steepest'):
+    """
+    Решение из заданного базиса без Phase I. Прямо допустимый базис сразу идёт в Phase II,
+    двойственно допустимый — в двойственную фазу. Возвращает None, если базис непригоден
+    (тогда вызывающий решает задачу с нуля).
+    """
+    m, n = len(b), len(c)
+    T, slack_count, _ = be.build(c, A, b, senses, phase=2)
+    ncols = n + slack_count
+    basis = [ncols + i for i in range(m)]
+    history = new_history(record_history, be, (c, A, b, senses), basis, phase=2, monitor=monitor)
+    set_phase(monitor, 'warm')
+    watch(monitor, basis, n)
+    history.start(T)
+    install_basis(be, T, basis, warm_start, ncols, history)
+    # complete the basis with any usable column
+    install_basis(be, T, basis, range(ncols), ncols, history)
+    if any(basis[r] >= ncols and not be.is_zero(T[r][-1]) for r in range(m)):
+        return None
+
+    if be.dual_leaving(T) is not None:
+        if be.entering(T) is not None:
+            return None
+        set_phase(monitor, 'dual')
+        if not dual_optimize(be, T, basis, ncols, history, pricing=dual_pricing):
+            return SimplexResult("infeasible", tableau=T, history=history)
+    set_phase(monitor, 'phase2')
+    if not optimize(be, T, basis, history, pricing):
+        return SimplexResult("unbounded", tableau=T, history=history, basis=list(basis))
+    return finish(be, T, basis, c, m, n, history)
+
+
+def bounded_solve(be, c, A, b, senses, bounds, record_history, pricing, dual=False, monitor=None):
+    """
+    Двухфазный симплекс с границами переменных. dual — с двойственной фазой: True или
+    правило выбора уходящей строки (см. dual_optimize).
+    """
+    from .bounds import bounded_problem
+    m, n = len(b), len(c)
+    A, b, senses, state = bounded_problem(c, A, b, senses, bounds)
+    if not state.feasible():
+        return SimplexResult("infeasible")
+    T, slack_count, art_count = be.build(c, A, b, senses, phase=1)
+    basis = phase1_basis(senses, n, slack_count)
+    history = new_history(record_history, be, (c, A, b, senses), basis, monitor=monitor)
+    set_phase(monitor, 'phase1')
+    watch(monitor, basis, n, state)
+    history.start(T)
+    crash(be, T, basis, n + slack_count, history, state)
+    if not optimize(be, T, basis, history, pricing, state):
+        return SimplexResult("infeasible", tableau=T, history=history)
+    if not be.is_zero(be.objective(T)):
+        return SimplexResult("infeasible", tableau=T, history=history)
+    T = end_phase1(be, T, basis, state.cost(c), n, slack_count, art_count, history)
+    drive_out_artificials(be, T, basis, n + slack_count, history)
+    if dual:
+        set_phase(monitor, 'dual')
+        rule = 'steepest' if dual is True else dual
+        if not dual_optimize(be, T, basis, n + slack_count, history, state, rule):
+            return SimplexResult("infeasible", tableau=T, history=history)
+        set_phase(monitor, 'phase2')
+    if not optimize(be, T, basis, history, pricing, state):
+        return SimplexResult("unbounded", tableau=T, history=history, basis=list(basis))
+    return finish(be, T, basis, c, m, n, history, state)
+
+
+def simplex(c, A, b, senses=None, backend=None, record_history='full', pricing='bland',
+            warm_start=None, presolve=False, bounds=None, callback=None, time_limit=None,
+            iteration_limit=None, scaling=None):
+    """
+    record_history: 'full' — копия таблицы на каждом шаге, 'pivots' — журнал Pivot
+    (таблицы восстанавливаются через history.tableau(step)), 'none' — без истории.
+    pricing: 'bland', 'dantzig', 'partial', 'devex' или 'steepest'.
+    warm_start: базис прошлого решения (SimplexResult.basis) — Phase I пропускается,
+    если базис остаётся прямо или двойственно допустимым.
+    presolve: сначала упростить задачу (simplex.presolve) и решать уменьшенную;
+    x и objective возвращаются в исходных переменных.
+    bounds: границы переменных [(lower, upper), ...] (upper=None — без границы); учитываются
+    ограниченным симплексом без добавления строк. warm_start вместе с bounds не используется.
+    callback: callback(SolveEvent) на каждом пивоте и смене фазы (simplex.stats); истинное
+    возвращённое значение прерывает решение со статусом 'aborted'. Статистика — в result.stats.
+    time_limit (секунды), iteration_limit (пивоты и переходы к границе): при превышении
+    возвращается статус 'time_limit' или 'iteration_limit'; x и objective — текущая
+    допустимая точка, если она уже найдена, bound — двойственная граница, если известна.
+    scaling: масштабировать строки и столбцы A (simplex.scaling) перед решением; None —
+    только для backend='float' и плохо масштабированной A; точные бэкенды масштабируются
+    в Fraction. x, границы и двойственные цены результата — в исходных единицах, tableau
+    и history — масштабированной задачи.
+    """
+    if presolve:
+        from .presolve import solve_presolved
+        return solve_presolved(
+            lambda *p, **kw: simplex(*p, backend=backend, record_history=record_history, pricing=pricing,
+                                     callback=callback, time_limit=time_limit,
+                                     iteration_limit=iteration_limit, scaling=scaling, **kw),
+            c, A, b, senses, bounds=bounds
+        )
+    be = get_backend(backend, A, len(b))
+    if senses is None:
+        senses = ['<='] * len(b)
+    if scaling or (scaling is None and be.name == 'float'):
+        from .scaling import solve_scaled
+        res = solve_scaled(
+            lambda *p, **kw: simplex(*p, backend=be, record_history=record_history, pricing=pricing,
+                                     warm_start=warm_start, callback=callback, time_limit=time_limit,
+                                     iteration_limit=iteration_limit, scaling=False, **kw),
+            c, A, b, senses, bounds=bounds, exact=be.name != 'float'
+        )
+        res.problem = (c, A, b, senses)
+        return res
+    monitor = Monitor(be, callback, time_limit=time_limit, iteration_limit=iteration_limit)
+    res = monitored(be, monitor, lambda: primal_solve(be, c, A, b, senses, record_history, pricing,
+                                                      warm_start, bounds, monitor))
+    res.problem = (c, A, b, senses)
+    return res
+
+
+def primal_solve(be, c, A, b, senses, record_history, pricing, warm_start, bounds, monitor):
+    m, n = len(b), len(c)
+    if bounds is not None:
+        return bounded_solve(be, c, A, b, senses, bounds, record_history, pricing, monitor=monitor)
+    if warm_start is not None:
+        res = warm_solve(be, c, A, b, senses, warm_start, record_history, pricing, monitor)
+        if res is not None:
+            return res
+    # Phase I from the slack basis plus a crash over the artificial rows
+    A, b, senses = nonnegative_rhs(A, b, senses, n)
+    T, slack_count, art_count = be.build(c, A, b, senses, phase=1)
+    basis = phase1_basis(senses, n, slack_count)
+    history = new_history(record_history, be, (c, A, b, senses), basis, monitor=monitor)
+    set_phase(monitor, 'phase1')
+    watch(monitor, basis, n)
+    history.start(T)
+    crash(be, T, basis, n + slack_count, history)
+    if not optimize(be, T, basis, history, pricing):
+        return SimplexResult("infeasible", tableau=T, history=history)
+    if not be.is_zero(be.objective(T)):
+        return SimplexResult("infeasible", tableau=T, history=history)
+    T = end_phase1(be, T, basis, c, n, slack_count, art_count, history)
+    drive_out_artificials(be, T, basis, n + slack_count, history)
+    # Phase II
+    if not optimize(be, T, basis, history, pricing):
+        return SimplexResult("unbounded", tableau=T, history=history, basis=list(basis))
+    return finish(be, T, basis, c, m, n, history)
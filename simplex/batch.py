@@ -0,0 +1,177 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .base import SimplexResult, alternative_optimum, simplex, phase1_basis
+from .bounds import nonnegative_rhs
+from .floating import build_float_tableau
+
+
+def _problem(p):
+    c, A, b, *rest = p
+    senses = rest[0] if rest and rest[0] is not None else ['<='] * len(b)
+    return c, A, b, list(senses)
+
+
+def _batch_optimize(T, basis, active, eps):
+    """
+    Прямой симплекс (правило Бланда) сразу для стопки таблиц T (K, m+1, w).
+    Возвращает маску задач, для которых не нашлась ведущая строка.
+    """
+    K, rows, _ = T.shape
+    m = rows - 1
+    failed = np.zeros(K, dtype=bool)
+    active = active.copy()
+    while True:
+        neg = T[:, -1, :-1] < -eps
+        active &= neg.any(axis=1)
+        idx = np.flatnonzero(active)
+        if not idx.size:
+            return failed
+        col = neg[idx].argmax(axis=1)
+        column = T[idx, :m, col]
+        rhs = T[idx, :m, -1]
+        ok = column > eps
+        ratios = np.full(column.shape, np.inf)
+        ratios[ok] = rhs[ok] / column[ok]
+        ok &= ratios >= -eps
+        ratios[~ok] = np.inf
+        best = ratios.min(axis=1)
+        none = ~np.isfinite(best)
+        failed[idx[none]] = True
+        active[idx[none]] = False
+        keep = ~none
+        idx, col, ratios, best, ok = idx[keep], col[keep], ratios[keep], best[keep], ok[keep]
+        if not idx.size:
+            continue
+        # Bland tie-break: the largest basic index leaves
+        ties = ok & (ratios <= best[:, None] + eps)
+        row = np.where(ties, basis[idx], -1).argmax(axis=1)
+
+        prow = T[idx, row, :] / T[idx, row, col][:, None]
+        factor = T[idx, :, col].copy()
+        T[idx] -= factor[:, :, None] * prow[:, None, :]
+        T[idx, row, :] = prow
+        basis[idx, row] = col
+
+
+def _drive_out(T, basis, ncols, tol):
+    """
+    Выводит из базиса искусственные переменные, оставшиеся на нулевом уровне после Phase I
+    (как drive_out_artificials в base): иначе их строки перестают ограничивать остальные столбцы.
+    """
+    for k, r in zip(*np.nonzero(basis >= ncols)):
+        if abs(T[k, r, -1]) > tol:
+            continue
+        free = np.abs(T[k, r, :ncols]) > tol
+        free[basis[k][basis[k] < ncols]] = False
+        if not free.any():
+            continue
+        col = int(free.argmax())
+        T[k, r] /= T[k, r, col]
+        factor = T[k, :, col].copy()
+        factor[r] = 0.0
+        T[k] -= factor[:, None] * T[k, r]
+        basis[k, r] = col
+
+
+def solve_stacked(problems, tol=1e-9):
+    """
+    Решает задачи одинаковой формы (одинаковые m, n и знаки ограничений), сложенные
+    в один массив (K, m+1, w): выбор столбца, тест отношений и пивот векторизованы по K.
+    """
+    problems = [_problem(p) for p in problems]
+    c0, _, b0, _ = problems[0]
+    m, n = len(b0), len(c0)
+    K = len(problems)
+    C = np.array([np.asarray(c, dtype=float) for c, _, _, _ in problems])
+
+    # Phase I. Rows with b_i < 0 are negated per problem (nonnegative_rhs), which turns
+    # '<=' into '>=' and back; the slack count stays the same, so the tableaus are given
+    # an artificial column for every row to keep one shape. Unused ones stay zero.
+    T, basis = [], []
+    for c, A, b, senses in problems:
+        A, b, senses = nonnegative_rhs(A, b, senses, n)
+        t, slack_count, _ = build_float_tableau(c, A, b, senses, phase=2)
+        ncols = n + slack_count
+        art = np.zeros((m + 1, m))
+        rows = [i for i, sense in enumerate(senses) if sense != '<=']
+        art[rows, rows] = 1.0
+        T.append(np.hstack([t[:, :-1], art, t[:, -1:]]))
+        basis.append(phase1_basis(senses, n, slack_count))
+    T, basis = np.stack(T), np.array(basis)
+    T[:, -1, :] = -np.einsum('km,kmw->kw', (basis >= ncols).astype(float), T[:, :m, :])
+    T[:, -1, ncols:-1] = 0.0
+    active = np.ones(K, dtype=bool)
+    failed = _batch_optimize(T, basis, active, tol)
+    infeasible = failed | (np.abs(T[:, -1, -1]) > tol)
+    _drive_out(T, basis, ncols, tol)
+
+    # strip artificial vars, Phase II cost integration
+    T = np.delete(T, np.s_[ncols:ncols + m], axis=2)
+    T[:, -1, :] = 0.0
+    T[:, -1, :n] = -C
+    valid = basis < ncols
+    coefs = np.take_along_axis(T[:, -1, :], np.where(valid, basis, 0), axis=1) * valid
+    T[:, -1, :] -= np.einsum('km,kmw->kw', coefs, T[:, :m, :])
+
+    # Phase II
+    unbounded = _batch_optimize(T, basis, ~infeasible, tol)
+
+    results = []
+    for k in range(K):
+        if infeasible[k]:
+            results.append(SimplexResult("infeasible", tableau=T[k]))
+            continue
+        if unbounded[k]:
+            results.append(SimplexResult("unbounded", tableau=T[k], basis=basis[k].tolist()))
+            continue
+        x = [0] * n
+        for i, var in enumerate(basis[k]):
+            if var < n:
+                x[var] = float(T[k, i, -1])
+        alternative = alternative_optimum(problems[k][0], m, basis[k].tolist(), T[k, -1],
+                                          lambda v: abs(v) <= tol)
+        results.append(SimplexResult("optimal", x, T[k, -1, -1], alternative,
+                                     tableau=T[k], basis=basis[k].tolist()))
+    return results
+
+
+def _solve_one(args):
+    (c, A, b, senses), backend = args
+    return simplex(c, A, b, senses, backend=backend, record_history='none')
+
+
+def solve_batch(problems, backend='float', workers=None, tol=1e-9):
+    """
+    Решает много независимых задач (c, A, b) или (c, A, b, senses).
+
+    При backend='float' задачи одной формы складываются в трёхмерный массив и решаются
+    вместе (векторизованный float-симплекс). Остальные задачи, а при другом backend (в том
+    числе None — точный бэкенд, как в simplex) — все, решаются по одной через
+    simplex(backend=...), при workers > 1 — в ProcessPoolExecutor. Результаты возвращаются
+    в исходном порядке.
+    """
+    problems = [_problem(p) for p in problems]
+    groups = {}
+    for k, (c, A, b, senses) in enumerate(problems):
+        groups.setdefault((len(b), len(c), tuple(senses)), []).append(k)
+
+    results = [None] * len(problems)
+    single = []
+    for idx in groups.values():
+        if len(idx) == 1 or backend != 'float':
+            single.extend(idx)
+            continue
+        for k, res in zip(idx, solve_stacked([problems[k] for k in idx], tol)):
+            results[k] = res
+
+    tasks = [(problems[k], backend) for k in single]
+    if workers is not None and workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            solved = list(pool.map(_solve_one, tasks))
+    else:
+        solved = [_solve_one(t) for t in tasks]
+    for k, res in zip(single, solved):
+        results[k] = res
+    return results
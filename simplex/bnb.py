@@ -1,53 +1,377 @@
 # branch_and_bound.py
-from copy import deepcopy
-from .base import simplex, SimplexResult
+import heapq
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from .base import simplex, SimplexResult, get_backend, optimize, dual_optimize, set_phase
+from .history import NoHistory
+from .stats import Monitor, SolveAborted, SolveStats
 import math
 class BnBResult:
-    def __init__(self, status, x=None, objective=None):
-        self.status = status        # 'optimal', 'infeasible'
+    def __init__(self, status, x=None, objective=None, bound=None, gap=None, nodes=0, stats=None):
+        self.status = status        # 'optimal', 'infeasible' или статус остановки из STOPPED
         self.x = x or []
         self.objective = objective
+        self.bound = bound          # глобальная верхняя граница (max-задача)
+        self.gap = gap              # относительный разрыв между bound и objective
+        self.nodes = nodes          # число обработанных узлов
+        self.stats = stats          # SolveStats поиска
 
 
-def branch_and_bound(c, A, b, integer_indices=None, best=None):
-    lp = simplex(c, A, b)
+# узел дерева: оптимальная таблица релаксации, её базис, число столбцов без RHS и границы переменных
+Node = namedtuple('Node', 'tableau basis ncols x objective bounds')
+# состояние поиска, передаётся в on_progress после каждого узла
+BnBProgress = namedtuple('BnBProgress', 'nodes open incumbent bound gap')
+
+NODE_SELECTION = ('depth', 'best-bound', 'best-estimate', 'hybrid')
+# статусы прерванного поиска
+STOPPED = ('aborted', 'time_limit', 'iteration_limit', 'node_limit')
+INT_TOL = 1e-9
+# узлов в одном раунде параллельного режима; не зависит от workers, чтобы ответ был детерминирован
+ROUND_SIZE = 16
+
+
+def root_node(be, c, A, b, senses, bounds, monitor=None):
+    limits = {}
+    if monitor is not None:
+        limits = dict(callback=monitor.callback, time_limit=monitor.time_left(),
+                      iteration_limit=monitor.iteration_limit)
+    # the node tableau is reused by the children, so it must be of the unscaled problem
+    lp = simplex(c, A, b, senses, backend=be, record_history='none', bounds=bounds, scaling=False, **limits)
+    if monitor is not None:
+        monitor.merge(lp.stats)
+    if lp.status in STOPPED:
+        raise SolveAborted(lp.tableau, lp.status)
     if lp.status != 'optimal':
-        return best
-    x_relaxed, obj_relaxed = lp.x, lp.objective
+        return None
+    slack_count = sum(1 for s in senses if s in ('<=', '>='))
+    return Node(lp.tableau, lp.basis, len(c) + slack_count, lp.x, lp.objective, lp.bounds)
 
-    if best is not None and obj_relaxed <= best.objective:
-        return best
 
-    if integer_indices is None:
-        integer_indices = list(range(len(c)))
+def node_history(T, monitor):
+    """Журнал без таблиц, передающий пивоты и переходы к границе монитору поиска."""
+    history = NoHistory()
+    history.monitor = monitor
+    history.start(T)
+    return history
+
 
-    for i in integer_indices:
-        if abs(x_relaxed[i] - round(x_relaxed[i])) > 1e-9:
+def reoptimize(be, T, basis, ncols, bounds, monitor):
+    """Двойственный, затем прямой симплекс в таблице узла. False — узел несовместен."""
+    history = node_history(T, monitor)
+    set_phase(monitor, 'dual')
+    feasible = dual_optimize(be, T, basis, ncols, history, bounds)
+    if feasible:
+        set_phase(monitor, 'phase2')
+        feasible = optimize(be, T, basis, history, bounds=bounds)
+    set_phase(monitor, None)
+    return feasible
+
+
+def child_node(be, node, n, j, lower=None, upper=None, monitor=None):
+    """
+    Сужает границы переменной j в таблице родителя и восстанавливает допустимость
+    двойственным симплексом вместо решения задачи с нуля. Размер таблицы не меняется.
+    Пивоты и переходы к границе учитываются монитором поиска monitor.
+    """
+    T = be.snapshot(node.tableau)
+    basis = list(node.basis)
+    bounds = node.bounds.copy()
+    if not bounds.tighten(be, T, j, lower, upper):
+        return None
+    if not reoptimize(be, T, basis, node.ncols, bounds, monitor):
+        return None
+    x = bounds.values(be.extract(T, basis, n))
+    return Node(T, basis, node.ncols, x, float(be.objective(T) + bounds.offset), bounds)
+
+
+def separate(be, node, c, integer_indices, cuts, rounds, depth, slack_integral, monitor):
+    """
+    Раунды отсечений в узле: cuts(CutNode) возвращает список Cut, они добавляются строками
+    в таблицу узла, допустимость восстанавливается двойственным симплексом. Останавливается,
+    когда решение целое, отсечений нет или цель перестала уменьшаться. None — узел несовместен.
+    """
+    from .gomory import CutNode, add_cut, column_integrality
+    n = len(c)
+    integer = [j in integer_indices for j in range(n)]
+    T, basis, ncols, bounds = node.tableau, list(node.basis), node.ncols, node.bounds
+    for _ in range(rounds):
+        if not fractional(node.x, integer_indices):
+            break
+        integral = column_integrality(bounds, integer, slack_integral, ncols)
+        found = cuts(CutNode(be, T, basis, ncols, bounds, integral, node.x, depth))
+        if not found:
             break
-    else:
-        return BnBResult('optimal', [round(xx) for xx in x_relaxed], obj_relaxed)
+        for cut in found:
+            T = add_cut(be, T, basis, ncols, cut)
+            ncols += 1
+        monitor.stats.cuts += len(found)
+        if not reoptimize(be, T, basis, ncols, bounds, monitor):
+            return None
+        objective = float(be.objective(T) + bounds.offset)
+        stalled = node.objective - objective <= INT_TOL * max(1.0, abs(objective))
+        node = Node(T, basis, ncols, bounds.values(be.extract(T, basis, n)), objective, bounds)
+        if stalled:
+            break
+    return node
+
+
+def fractional(x, integer_indices):
+    return [i for i in integer_indices if abs(x[i] - round(x[i])) > INT_TOL]
+
+
+def estimate(node, c, frac):
+    # best-estimate: bound minus the cheapest rounding of every fractional variable
+    return node.objective - sum(
+        min(node.x[i] - math.floor(node.x[i]), math.ceil(node.x[i]) - node.x[i]) * abs(c[i])
+        for i in frac
+    )
+
+
+def expand(be, node, c, integer_indices, incumbent, monitor=None):
+    """
+    Обработка узла: None — отсечён по рекорду incumbent, BnBResult — целочисленное решение,
+    иначе список решённых потомков (ветвление по первой дробной переменной).
+    monitor учитывает пивоты при решении потомков.
+    """
+    if node is None or incumbent is not None and node.objective <= incumbent + INT_TOL:
+        return None
+    frac = fractional(node.x, integer_indices)
+    if not frac:
+        return BnBResult('optimal', [round(xx) for xx in node.x], node.objective)
+    n = len(c)
+    i = frac[0]
+    xi = node.x[i]
+    down = child_node(be, node, n, i, upper=math.floor(xi), monitor=monitor)
+    up = child_node(be, node, n, i, lower=math.ceil(xi), monitor=monitor)
+    # the floor child is pushed last, so depth-first explores it first
+    return [child for child in (up, down) if child is not None]
+
+
+def _expand_task(args):
+    """
+    Узел в процессе пула: пивоты считает свой монитор с оставшимися лимитами времени и
+    итераций. Возвращает (результат, статистика, статус остановки или None).
+    """
+    *task, limits = args
+    monitor = Monitor(task[0], **limits)
+    try:
+        return expand(*task, monitor), monitor.finish(), None
+    except SolveAborted as exc:
+        return None, monitor.finish(), exc.status
+
+
+def remaining_limits(monitor):
+    """Лимиты для узла в процессе пула: остаток времени и итераций поиска."""
+    iterations = None
+    if monitor.iteration_limit is not None:
+        iterations = monitor.iteration_limit - monitor.stats.total_pivots - monitor.stats.flips
+    return dict(time_limit=monitor.time_left(), iteration_limit=iterations)
+
+
+def relative_gap(bound, incumbent):
+    if incumbent is None:
+        return math.inf
+    return max(0.0, bound - incumbent) / max(1.0, abs(incumbent))
+
+
+def global_bound(queue, incumbent, pending=()):
+    """Наибольшая граница среди открытых узлов, узлов раунда pending и рекорда."""
+    values = [v for v in (queue.bound(), incumbent) if v is not None]
+    values += [node.objective for node, _ in pending if node is not None]
+    return max(values) if values else None
+
+
+class NodeQueue:
+    """
+    Открытые узлы с кучами по глубине, границе и оценке; закрытые узлы удаляются лениво,
+    поэтому политику выбора можно менять на ходу (hybrid).
+    """
+
+    def __init__(self):
+        self.heaps = {'depth': [], 'best-bound': [], 'best-estimate': []}
+        self.nodes = {}
+        self.seq = 0
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def push(self, node, depth, est):
+        self.seq += 1
+        self.nodes[self.seq] = (node, depth)
+        # ties at one depth pop the latest push first (last in, first out)
+        heapq.heappush(self.heaps['depth'], (-depth, -self.seq, self.seq))
+        heapq.heappush(self.heaps['best-bound'], (-node.objective, self.seq))
+        heapq.heappush(self.heaps['best-estimate'], (-est, self.seq))
+
+    def _top(self, policy):
+        heap = self.heaps[policy]
+        while heap and heap[0][-1] not in self.nodes:
+            heapq.heappop(heap)
+        return heap[0][-1] if heap else None
+
+    def pop(self, policy):
+        key = self._top(policy)
+        return self.nodes.pop(key)
+
+    def bound(self):
+        key = self._top('best-bound')
+        return None if key is None else self.nodes[key][0].objective
+
+
+def branch_and_bound(c, A, b, integer_indices=None, best=None, senses=None, backend=None,
+                     node_selection='best-bound', gap=0.0, on_progress=None, workers=None, bounds=None,
+                     callback=None, stats=None, time_limit=None, iteration_limit=None, node_limit=None,
+                     cuts=None, cut_rounds=5, cut_depth=0):
+    """
+    Итеративный метод ветвей и границ с явной очередью узлов. Ветвление сужает границы
+    переменной (x_i <= floor, x_i >= ceil) в таблице родителя, строки не добавляются.
+
+    node_selection: 'depth' (в глубину, сначала floor-ветвь), 'best-bound' (узел с лучшей
+    границей), 'best-estimate' (лучшая оценка целочисленного решения), 'hybrid' (в глубину
+    до первого допустимого решения, затем best-bound).
+    gap: поиск останавливается, когда относительный разрыв между глобальной границей
+    и рекордом не превосходит gap.
+    workers: узлы обрабатываются раундами по ROUND_SIZE (и в одном процессе), рекорд на
+    начало раунда передаётся всем узлам раунда для отсечения; при workers > 1 раунд
+    раздаётся ProcessPoolExecutor. Результат не зависит от числа процессов.
+    bounds: границы переменных [(lower, upper), ...], по умолчанию x >= 0.
+    callback: callback(SolveEvent) на пивотах корневой релаксации и потомков и на каждом узле;
+    истинное значение прерывает поиск, возвращается рекорд со статусом 'aborted'. При
+    workers > 1 пивоты узлов считаются в процессах пула, callback на них не вызывается.
+    stats: SolveStats для заполнения (узлы, отсечения, пивоты корня и всех узлов), иначе
+    создаётся новая.
+    time_limit (секунды), node_limit и iteration_limit (пивоты и переходы к границе во всём
+    поиске, включая решение потомков) останавливают поиск со статусом 'time_limit',
+    'node_limit' или 'iteration_limit', в том числе посреди решения узла: возвращается рекорд
+    (или BnBResult без x, если его нет) с глобальной границей bound и разрывом gap.
+    cuts: генератор отсечений cuts(CutNode) -> [Cut, ...] (например, simplex.gomory.gomory_cuts);
+    в узлах глубины <= cut_depth (0 — только корень) выполняется до cut_rounds раундов
+    отсечений перед ветвлением. Отсечения из таблицы узла действуют только в его поддереве.
+    """
+    if node_selection not in NODE_SELECTION:
+        raise ValueError(f"node_selection must be one of {NODE_SELECTION}, got {node_selection!r}")
+    be = get_backend(backend, A, len(b))
+    n = len(c)
+    if senses is None:
+        senses = ['<='] * len(b)
+    if integer_indices is None:
+        integer_indices = list(range(n))
+    if bounds is None:
+        bounds = [(0, None)] * n
+    if cuts is not None:
+        from .gomory import integral_rows
+        integer = [j in integer_indices for j in range(n)]
+        slack_integral = [ok for ok, s in zip(integral_rows(A, b, integer), senses) if s != '==']
+    incumbent = best
+    monitor = Monitor(be, callback, stats, time_limit=time_limit, iteration_limit=iteration_limit,
+                      node_limit=node_limit)
+    stopped = None
+
+    queue = NodeQueue()
+    nodes = 0
+    pool = ProcessPoolExecutor(max_workers=workers) if workers is not None and workers > 1 else None
 
-    i = i
-    xi = x_relaxed[i]
-    floor_val = math.floor(xi)
-    ceil_val = math.ceil(xi)
+    try:
+        root = root_node(be, c, A, b, senses, bounds, monitor)
+        if root is not None:
+            queue.push(root, 0, estimate(root, c, fractional(root.x, integer_indices)))
+        while queue:
+            inc_obj = incumbent.objective if incumbent is not None else None
+            if relative_gap(global_bound(queue, inc_obj), inc_obj) <= gap:
+                break
+            policy = node_selection
+            if policy == 'hybrid':
+                policy = 'depth' if incumbent is None else 'best-bound'
+            # the same rounds with and without a pool, so the tree is explored identically
+            batch = [queue.pop(policy) for _ in range(min(ROUND_SIZE, len(queue)))]
+            done = 0
+            try:
+                if cuts is not None:
+                    batch = [
+                        (separate(be, node, c, integer_indices, cuts, cut_rounds, depth, slack_integral, monitor)
+                         if depth <= cut_depth else node, depth)
+                        for node, depth in batch
+                    ]
+                tasks = [(be, node, c, integer_indices, inc_obj) for node, _ in batch]
+                if pool is not None:
+                    limits = remaining_limits(monitor)
+                    results = []
+                    for result, task_stats, task_stopped in pool.map(_expand_task, [t + (limits,) for t in tasks]):
+                        monitor.merge(task_stats)
+                        results.append((result, task_stopped))
 
-    A1, b1 = deepcopy(A), deepcopy(b)
-    row = [0]*len(c); row[i] = 1
-    A1.append(row); b1.append(floor_val)
-    best = branch_and_bound(c, A1, b1, integer_indices, best)
+                for k, (node, depth) in enumerate(batch):
+                    monitor.check_nodes()
+                    result, task_stopped = results[k] if pool is not None else (expand(*tasks[k], monitor), None)
+                    if task_stopped is not None:
+                        raise SolveAborted(status=task_stopped)
+                    nodes += 1
+                    if isinstance(result, BnBResult):
+                        if incumbent is None or result.objective > incumbent.objective:
+                            incumbent = result
+                    elif result:
+                        for child in result:
+                            queue.push(child, depth + 1, estimate(child, c, fractional(child.x, integer_indices)))
+                    done += 1
 
-    A2, b2 = deepcopy(A), deepcopy(b)
-    row = [0]*len(c); row[i] = -1
-    A2.append(row); b2.append(-ceil_val)
-    best = branch_and_bound(c, A2, b2, integer_indices, best)
+                    inc_obj = incumbent.objective if incumbent is not None else None
+                    bound = global_bound(queue, inc_obj, batch[done:])
+                    progress = BnBProgress(nodes, len(queue), inc_obj, bound, relative_gap(bound, inc_obj))
+                    if on_progress is not None:
+                        on_progress(progress)
+                    # a branched node has two children, the missing ones were infeasible
+                    infeasible = 2 - len(result) if isinstance(result, list) else 0
+                    monitor.node(progress, pruned=result is None, infeasible=infeasible)
+            except SolveAborted:
+                # nodes stopped mid-reoptimisation go back to the queue, so the bound stays valid
+                for node, depth in batch[done:]:
+                    if node is not None:
+                        queue.push(node, depth, estimate(node, c, fractional(node.x, integer_indices)))
+                raise
+    except SolveAborted as exc:
+        stopped = exc.status
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    stats = monitor.finish()
 
-    return best
+    if incumbent is None:
+        if stopped is None:
+            return None
+        return BnBResult(stopped, bound=global_bound(queue, None), nodes=nodes, stats=stats)
+    if stopped is not None:
+        incumbent.status = stopped
+    incumbent.bound = global_bound(queue, incumbent.objective)
+    incumbent.gap = relative_gap(incumbent.bound, incumbent.objective)
+    incumbent.nodes = nodes
+    incumbent.stats = stats
+    return incumbent
 
 
 # Удобная обёртка
-def solve_integer(c, A, b):
-    res = branch_and_bound(c, A, b)
+def solve_integer(c, A, b, senses=None, backend=None, node_selection='best-bound', gap=0.0,
+                  on_progress=None, workers=None, presolve=False, bounds=None, callback=None,
+                  time_limit=None, iteration_limit=None, node_limit=None, cuts=None, cut_rounds=5,
+                  cut_depth=0):
+    limits = dict(time_limit=time_limit, iteration_limit=iteration_limit, node_limit=node_limit)
+    cutting = dict(cuts=cuts, cut_rounds=cut_rounds, cut_depth=cut_depth)
+    if presolve:
+        from .presolve import solve_presolved
+        res = solve_presolved(
+            lambda *p, **kw: solve_integer(*p, backend=backend, node_selection=node_selection, gap=gap,
+                                           on_progress=on_progress, workers=workers, callback=callback,
+                                           **limits, **cutting, **kw)[0],
+            c, A, b, senses, bounds=bounds, integral=True
+        )
+        if not res.x:
+            return res, None
+        res.x = [round(v) for v in res.x]
+        return res, res.x
+    stats = SolveStats()
+    res = branch_and_bound(c, A, b, senses=senses, backend=backend, node_selection=node_selection,
+                           gap=gap, on_progress=on_progress, workers=workers, bounds=bounds,
+                           callback=callback, stats=stats, **limits, **cutting)
     if res is None:
-        return SimplexResult('infeasible'), None
-    return SimplexResult('optimal', res.x, res.objective), res.x
+        return SimplexResult('infeasible', stats=stats), None
+    x = res.x or None
+    return SimplexResult(res.status, x, res.objective, stats=stats, bound=res.bound), x
@@ -0,0 +1,193 @@
+from fractions import Fraction as F
+
+from .history import Flip
+from .sparse import is_sparse, csr_rows
+
+FLIP = {'<=': '>=', '>=': '<=', '==': '=='}
+
+
+def as_bound(v):
+    """Верхняя граница: None или inf — нет границы."""
+    return None if v is None or v == float('inf') else F(v)
+
+
+class Bounds:
+    """
+    Границы переменных в таблице. Столбец j хранит t_j = x_j - lower[j] или, если flipped[j],
+    t_j = upper[j] - x_j (небазисная переменная на верхней границе). Столбцы без записи
+    (slack и искусственные) имеют границы [0, inf). upper[j] is None — нет верхней границы.
+    offset — вклад границ в цель на момент построения строки цели Phase II.
+    """
+
+    def __init__(self, lower, upper):
+        self.lower = list(lower)
+        self.upper = list(upper)
+        self.flipped = [False] * len(self.lower)
+        self.offset = F(0)
+
+    def copy(self):
+        new = Bounds(self.lower, self.upper)
+        new.flipped = list(self.flipped)
+        new.offset = self.offset
+        return new
+
+    def feasible(self):
+        return all(u is None or l <= u for l, u in zip(self.lower, self.upper))
+
+    def width(self, j):
+        """Верхняя граница t_j (None — бесконечность)."""
+        if j >= len(self.lower) or self.upper[j] is None:
+            return None
+        return self.upper[j] - self.lower[j]
+
+    def cost(self, c):
+        """Цель в переменных t; постоянное слагаемое сохраняется в offset."""
+        self.offset = sum(
+            (F(cj) * (self.upper[j] if self.flipped[j] else self.lower[j]) for j, cj in enumerate(c)),
+            F(0)
+        )
+        return [-cj if self.flipped[j] else cj for j, cj in enumerate(c)]
+
+    def values(self, t):
+        """Значения x по значениям столбцов t."""
+        return [
+            float(self.upper[j] - F(v)) if self.flipped[j] else float(self.lower[j] + F(v))
+            for j, v in enumerate(t)
+        ]
+
+    def flip(self, be, T, basis, col, history):
+        """Замена t_col на (width - t_col): переменная переходит к другой своей границе."""
+        history.check(T)
+        bound = self.width(col)
+        be.complement(T, basis, col, bound)
+        self.flipped[col] = not self.flipped[col]
+        history.record(T, Flip(col, bound))
+
+    def leaving(self, be, T, basis, col):
+        """
+        Тест отношений с верхними границами. Возвращает (row, upper): row — ведущая строка,
+        upper — уходящая переменная встаёт на верхнюю границу. (None, True) — входящая
+        переменная сама дошла до своей верхней границы, (None, False) — луч неограничен.
+        """
+        eps = be.eps
+        best = self.width(col)
+        row, upper = None, best is not None
+        for i, var in enumerate(basis):
+            a = T[i][col]
+            if a > eps:
+                ratio, hits = T[i][-1] / a, False
+            elif a < -eps and self.width(var) is not None:
+                ratio, hits = (self.width(var) - T[i][-1]) / -a, True
+            else:
+                continue
+            if ratio < -eps:
+                continue
+            if (
+                best is None
+                or ratio < best - eps
+                or (ratio <= best + eps and row is not None and var > basis[row])
+            ):
+                best, row, upper = ratio, i, hits
+        return row, upper
+
+    def dual_entering(self, be, T, basis, row, ncols, history):
+        """
+        Длинный шаг двойственного симплекса (bound flipping): изломы d_j / |a_rj| проходятся
+        по возрастанию, пока строка row остаётся недопустимой после перевода столбца в
+        дополнение, — такие столбцы с конечной границей переводятся, первый непереводимый
+        входит в базис (среди изломов в пределах допуска — с наибольшим |a_rj|, как у Харриса).
+        Возвращает None, если строку нельзя сделать допустимой.
+        """
+        eps = be.eps
+        candidates = sorted(be.dual_ratios(T, row, ncols), key=lambda t: (t[1] / t[2], t[0]))
+        slope = -T[row][-1]
+        flips = []
+        for k, (j, d, alpha) in enumerate(candidates):
+            width = self.width(j)
+            if width is None or slope - alpha * width <= eps:
+                break
+            slope -= alpha * width
+            flips.append(j)
+        else:
+            return None
+        rest = candidates[k:]
+        bound = min((d + eps) / alpha for _, d, alpha in rest)
+        col = max((t for t in rest if t[1] / t[2] <= bound), key=lambda t: (t[2], -t[0]))[0]
+        for j in flips:
+            self.flip(be, T, basis, j, history)
+        return col
+
+    def tighten(self, be, T, j, lower=None, upper=None):
+        """
+        Сужает границы переменной j прямо в таблице (сдвиг RHS, размер таблицы не меняется).
+        Возвращает False, если границы стали противоречивыми.
+        """
+        if lower is not None and lower > self.lower[j]:
+            if not self.flipped[j]:
+                be.shift(T, j, lower - self.lower[j])
+            self.lower[j] = F(lower)
+        if upper is not None and (self.upper[j] is None or upper < self.upper[j]):
+            if self.flipped[j]:
+                be.shift(T, j, self.upper[j] - upper)
+            self.upper[j] = F(upper)
+        return self.upper[j] is None or self.lower[j] <= self.upper[j]
+
+    def repair(self, be, T, basis, history):
+        """
+        Базисные переменные выше верхней границы переводятся в дополнение: их RHS
+        становится отрицательным, и двойственный симплекс выводит их из базиса.
+        """
+        for i, var in enumerate(basis):
+            u = self.width(var)
+            if u is not None and T[i][-1] > u + be.eps:
+                self.flip(be, T, basis, var, history)
+
+
+def bounded_problem(c, A, b, senses, bounds):
+    """
+    Задача для таблицы с границами: x = lower + t, b' = b - A·lower; строки с b' < 0
+    умножаются на -1 (знак ограничения меняется). bounds — список пар (lower, upper),
+    None или inf в upper — нет границы. Возвращает (A', b', senses', Bounds).
+    """
+    n, m = len(c), len(b)
+    if len(bounds) != n:
+        raise ValueError(f"bounds must have {n} entries, got {len(bounds)}")
+    lower, upper = [], []
+    for lo, up in bounds:
+        if lo is None or lo == -float('inf'):
+            raise ValueError("lower bounds must be finite")
+        lower.append(F(lo))
+        upper.append(as_bound(up))
+    rows = csr_rows(A, m)
+    rhs, signs = [], []
+    for i, row in enumerate(rows):
+        v = F(b[i]) - sum((a * lower[j] for j, a in row.items()), F(0))
+        signs.append(-1 if v < 0 else 1)
+        rhs.append(abs(v))
+    new_senses = [FLIP[s] if sign < 0 else s for s, sign in zip(senses, signs)]
+    return _signed(A, rows, signs, n), rhs, new_senses, Bounds(lower, upper)
+
+
+def nonnegative_rhs(A, b, senses, n):
+    """
+    Строки с b_i < 0 умножаются на -1 (знак ограничения меняется), чтобы базис Phase I
+    был допустимым. Без таких строк задача возвращается как есть.
+    """
+    if all(bi >= 0 for bi in b):
+        return A, b, senses
+    signs = [-1 if bi < 0 else 1 for bi in b]
+    return (_signed(A, csr_rows(A, len(b)), signs, n), [abs(bi) for bi in b],
+            [FLIP[s] if sign < 0 else s for s, sign in zip(senses, signs)])
+
+
+def _signed(A, rows, signs, n):
+    """Матрица со строками rows, умноженными на signs, в формате A (CSR-тройка или плотная)."""
+    if is_sparse(A, len(rows)):
+        data, indices, indptr = [], [], [0]
+        for row, sign in zip(rows, signs):
+            for j, a in sorted(row.items()):
+                data.append(sign * a)
+                indices.append(j)
+            indptr.append(len(data))
+        return data, indices, indptr
+    return [[sign * row.get(j, F(0)) for j in range(n)] for row, sign in zip(rows, signs)]
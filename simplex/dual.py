@@ -1,107 +1,91 @@
+from .base import (SimplexResult, get_backend, optimize, dual_optimize, finish, end_phase1, warm_solve,
+                   bounded_solve, drive_out_artificials, monitored, set_phase, watch, phase1_basis, crash)
+from .bounds import nonnegative_rhs
+from .history import new_history
+from .stats import Monitor
 
-from .base import SimplexResult, pivot, bland_rule, find_leaving_variable, extract_solution, build_tableau
-from copy import deepcopy
-from fractions import Fraction as F
 
-def dual_simplex(c, A, b, senses=None):
-    m, n = len(A), len(c)
+def dual_simplex(c, A, b, senses=None, backend=None, record_history='full', pricing='bland',
+                 warm_start=None, presolve=False, bounds=None, callback=None, time_limit=None,
+                 iteration_limit=None, dual_pricing='steepest', scaling=None):
+    """
+    Симплекс с двойственной фазой: после Phase I недопустимые строки выводятся двойственным
+    симплексом, затем прямой доводит задачу до оптимума. dual_pricing — правило выбора
+    уходящей строки: 'steepest' (двойственное наискорейшее ребро) или 'dantzig'
+    (наиболее отрицательная правая часть). С bounds тест отношений длинный (bound flipping).
+    Остальные параметры — как у simplex (в том числе scaling).
+    """
+    if presolve:
+        from .presolve import solve_presolved
+        return solve_presolved(
+            lambda *p, **kw: dual_simplex(*p, backend=backend, record_history=record_history, pricing=pricing,
+                                          callback=callback, time_limit=time_limit,
+                                          iteration_limit=iteration_limit, dual_pricing=dual_pricing,
+                                          scaling=scaling, **kw),
+            c, A, b, senses, bounds=bounds
+        )
+    be = get_backend(backend, A, len(b))
     if senses is None:
-        senses = ['<='] * m
-    history = []
+        senses = ['<='] * len(b)
+    if scaling or (scaling is None and be.name == 'float'):
+        from .scaling import solve_scaled
+        res = solve_scaled(
+            lambda *p, **kw: dual_simplex(*p, backend=be, record_history=record_history, pricing=pricing,
+                                          warm_start=warm_start, callback=callback, time_limit=time_limit,
+                                          iteration_limit=iteration_limit, dual_pricing=dual_pricing,
+                                          scaling=False, **kw),
+            c, A, b, senses, bounds=bounds, exact=be.name != 'float'
+        )
+        res.problem = (c, A, b, senses)
+        return res
+    monitor = Monitor(be, callback, time_limit=time_limit, iteration_limit=iteration_limit)
+    res = monitored(be, monitor, lambda: dual_solve(be, c, A, b, senses, record_history, pricing,
+                                                    warm_start, bounds, monitor, dual_pricing))
+    res.problem = (c, A, b, senses)
+    return res
+
+
+def dual_solve(be, c, A, b, senses, record_history, pricing, warm_start, bounds, monitor,
+               dual_pricing='steepest'):
+    m, n = len(b), len(c)
+    if bounds is not None:
+        return bounded_solve(be, c, A, b, senses, bounds, record_history, pricing, dual=dual_pricing,
+                             monitor=monitor)
+    if warm_start is not None:
+        res = warm_solve(be, c, A, b, senses, warm_start, record_history, pricing, monitor, dual_pricing)
+        if res is not None:
+            return res
 
-    # Phase I: build tableau with artificials
-    T, slack_count, art_count = build_tableau(c, A, b, senses, phase=1)
-    # initial basis: slack or artificial
-    basis = []
-    for i, s in enumerate(senses):
-        if s == '<=':
-            # slack enters
-            slack_idx = n + sum(1 for t in senses[:i] if t in ('<=', '>='))
-            basis.append(slack_idx)
-        elif s == '>=' or s == '==':
-            # artificial enters
-            art_idx = n + slack_count + sum(1 for t in senses[:i] if t in ('>=','=='))
-            basis.append(art_idx)
-        else:
-            # default slack
-            slack_idx = n + sum(1 for t in senses[:i] if t in ('<=', '>='))
-            basis.append(slack_idx)
-    history.append(deepcopy(T))
+    # Phase I: slack basis for '<=' rows, crash over the artificial ones
+    A, b, senses = nonnegative_rhs(A, b, senses, n)
+    T, slack_count, art_count = be.build(c, A, b, senses, phase=1)
+    basis = phase1_basis(senses, n, slack_count)
+    history = new_history(record_history, be, (c, A, b, senses), basis, monitor=monitor)
+    set_phase(monitor, 'phase1')
+    watch(monitor, basis, n)
+    history.start(T)
+    crash(be, T, basis, n + slack_count, history)
 
     # Phase I simplex to get feasible
-    while True:
-        col = bland_rule(T, T[-1])
-        if col is None:
-            break
-        row = find_leaving_variable(T, basis, col)
-        if row is None:
-            return SimplexResult("infeasible", tableau=deepcopy(T), history=history)
-        pivot(T, basis, row, col)
-        history.append(deepcopy(T))
+    if not optimize(be, T, basis, history, pricing):
+        return SimplexResult("infeasible", tableau=T, history=history)
 
     # check feasibility
-    if T[-1][-1] != 0:
-        return SimplexResult("infeasible", tableau=deepcopy(T), history=history)
+    if not be.is_zero(be.objective(T)):
+        return SimplexResult("infeasible", tableau=T, history=history)
 
-    # remove artificial columns
-    for i in range(len(T)):
-        del T[i][n+slack_count:n+slack_count+art_count]
-    # update basis to remove art references
-    basis = [var for var in basis if var < n+slack_count]
-    # adjust basis indices > removed: reduce by art_count
-    for i, var in enumerate(basis):
-        if var >= n+slack_count:
-            basis[i] = var - art_count
-
-    # Phase II cost integration
-    # set cost row
-    T[-1] = list(map(lambda v: -F(v), c)) + [F(0)] * slack_count + [F(0)]
-    # eliminate non-zero costs for current basis
-    for i, var in enumerate(basis):
-        coef = T[-1][var]
-        if coef != 0:
-            for j in range(len(T[0])):
-                T[-1][j] -= coef * T[i][j]
-    history.append(deepcopy(T))
+    # remove artificial columns, Phase II cost integration
+    T = end_phase1(be, T, basis, c, n, slack_count, art_count, history)
+    drive_out_artificials(be, T, basis, n + slack_count, history)
 
     # Dual Phase: ensure RHS >=0
-    while True:
-        # find most negative RHS
-        row = min(
-            (i for i in range(m) if T[i][-1] < 0),
-            default=None,
-            key=lambda i: T[i][-1]
-        )
-        if row is None:
-            break
-        # choose pivot by min ratio for negative coefficients
-        candidates = [
-            (j, T[-1][j] / T[row][j])
-            for j in range(n + slack_count) if T[row][j] < 0
-        ]
-        if not candidates:
-            return SimplexResult("infeasible", tableau=deepcopy(T), history=history)
-        col = min(candidates, key=lambda t: (t[1], t[0]))[0]
-        pivot(T, basis, row, col)
-        history.append(deepcopy(T))
+    set_phase(monitor, 'dual')
+    if not dual_optimize(be, T, basis, n + slack_count, history, pricing=dual_pricing):
+        return SimplexResult("infeasible", tableau=T, history=history)
+    set_phase(monitor, 'phase2')
 
     # Primal Phase
-    while True:
-        col = bland_rule(T, T[-1])
-        if col is None:
-            break
-        row = find_leaving_variable(T, basis, col)
-        if row is None:
-            return SimplexResult("unbounded", tableau=deepcopy(T), history=history)
-        pivot(T, basis, row, col)
-        history.append(deepcopy(T))
-
-    x = extract_solution(T, basis, n)
-    obj = T[-1][-1]
-    # alternative flag
-    alt_main = any(j < n and j not in basis and T[-1][j] == 0 for j in range(n))
-    alt_zero_c = all(ci == 0 for ci in c)
-    alt_redundant = (m > n and all(ci > 0 for ci in c))
-    alternative = alt_main or alt_zero_c or alt_redundant
+    if not optimize(be, T, basis, history, pricing):
+        return SimplexResult("unbounded", tableau=T, history=history, basis=list(basis))
 
-    return SimplexResult("optimal", x, obj, alternative, tableau=deepcopy(T), history=history)
+    return finish(be, T, basis, c, m, n, history)
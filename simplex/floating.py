@@ -0,0 +1,181 @@
+import numpy as np
+
+from .sparse import is_sparse, to_dense
+
+
+def build_float_tableau(c, A, b, senses, phase):
+    m, n = len(b), len(c)
+    if hasattr(A, 'toarray'):
+        A = A.toarray()
+    elif is_sparse(A, m):
+        A = to_dense(A, m, n)
+    A = np.asarray(A, dtype=float).reshape(m, n)
+    has_slack = np.array([s in ('<=', '>=') for s in senses], dtype=bool)
+    has_art = np.array([s in ('>=', '==') for s in senses], dtype=bool)
+    slack_count = int(has_slack.sum())
+    art_count = int(has_art.sum())
+    width = n + slack_count + (art_count if phase == 1 else 0) + 1
+
+    T = np.zeros((m + 1, width))
+    T[:m, :n] = A
+    rows = np.flatnonzero(has_slack)
+    T[rows, n + np.arange(slack_count)] = [1.0 if senses[i] == '<=' else -1.0 for i in rows]
+    if phase == 1:
+        rows = np.flatnonzero(has_art)
+        T[rows, n + slack_count + np.arange(art_count)] = 1.0
+    T[:m, -1] = np.asarray(b, dtype=float)
+
+    if phase == 1:
+        # sum of rows with an artificial ('<=' rows start from their slack);
+        # artificial columns keep zero cost so they never re-enter
+        T[-1] = -T[:m][has_art].sum(axis=0)
+        T[-1, n + slack_count:-1] = 0.0
+    else:
+        T[-1, :n] = -np.asarray(c, dtype=float)
+    return T, slack_count, art_count
+
+
+class FloatBackend:
+    """Плотная таблица float64 (numpy) с допусками вместо точных сравнений."""
+    name = 'float'
+
+    def __init__(self, tol=1e-9):
+        self.eps = tol
+
+    def build(self, c, A, b, senses, phase):
+        return build_float_tableau(c, A, b, senses, phase)
+
+    def pivot(self, T, basis, row, col):
+        T[row] /= T[row, col]
+        factor = T[:, col].copy()
+        factor[row] = 0.0
+        # rank-1 update of all other rows
+        T -= np.outer(factor, T[row])
+        T[:, col] = 0.0
+        T[row, col] = 1.0
+        basis[row] = col
+
+    def entering(self, T):
+        neg = np.flatnonzero(T[-1, :-1] < -self.eps)
+        return int(neg[0]) if neg.size else None
+
+    def negative_costs(self, T, start=0, stop=None):
+        stop = T.shape[1] - 1 if stop is None else stop
+        d = T[-1, start:stop]
+        idx = np.flatnonzero(d < -self.eps)
+        return list(zip((idx + start).tolist(), d[idx].tolist()))
+
+    def width(self, T):
+        return T.shape[1] - 1
+
+    def column_norms(self, T, cols):
+        return (T[:-1, cols] ** 2).sum(axis=0).tolist()
+
+    def row_nonzeros(self, T, row):
+        r = T[row, :-1]
+        idx = np.flatnonzero(np.abs(r) > self.eps)
+        return list(zip(idx.tolist(), r[idx].tolist()))
+
+    def leaving(self, T, basis, col):
+        column, rhs = T[:-1, col], T[:-1, -1]
+        mask = column > self.eps
+        if not mask.any():
+            return None
+        ratios = np.full(column.shape, np.inf)
+        ratios[mask] = rhs[mask] / column[mask]
+        mask &= ratios >= -self.eps
+        if not mask.any():
+            return None
+        best = ratios[mask].min()
+        ties = np.flatnonzero(mask & (ratios <= best + self.eps))
+        # Bland tie-break: the largest basic index leaves
+        return int(max(ties, key=lambda i: basis[i]))
+
+    def dual_leaving(self, T):
+        rhs = T[:-1, -1]
+        row = int(np.argmin(rhs))
+        return row if rhs[row] < -self.eps else None
+
+    def negative_rhs(self, T):
+        rhs = T[:-1, -1]
+        idx = np.flatnonzero(rhs < -self.eps)
+        return list(zip(idx.tolist(), rhs[idx].tolist()))
+
+    def row_norms(self, T, rows):
+        return (T[rows, :-1] ** 2).sum(axis=1).tolist()
+
+    def dual_ratios(self, T, row, ncols):
+        entries = T[row, :ncols]
+        idx = np.flatnonzero(entries < -self.eps)
+        return list(zip(idx.tolist(), T[-1, idx].tolist(), (-entries[idx]).tolist()))
+
+    def dual_entering(self, T, row, ncols):
+        # Harris two-pass ratio test: relax the bound by the tolerance, then take
+        # the largest pivot among the columns inside it
+        entries = T[row, :ncols]
+        idx = np.flatnonzero(entries < -self.eps)
+        if not idx.size:
+            return None
+        alpha, d = -entries[idx], T[-1, idx]
+        bound = ((d + self.eps) / alpha).min()
+        inside = np.flatnonzero(d / alpha <= bound)
+        return int(idx[inside[np.argmax(alpha[inside])]])
+
+    def objective(self, T):
+        return T[-1, -1]
+
+    def is_zero(self, v):
+        return abs(v) <= self.eps
+
+    def drop_columns(self, T, start, stop):
+        return np.delete(T, np.s_[start:stop], axis=1)
+
+    def set_cost(self, T, c, slack_count, basis):
+        n = len(c)
+        T[-1] = 0.0
+        T[-1, :n] = -np.asarray(c, dtype=float)
+        rows = [i for i, var in enumerate(basis) if var < n + slack_count]
+        cols = [basis[i] for i in rows]
+        coefs = T[-1, cols].copy()
+        T[-1] -= coefs @ T[rows]
+        return T
+
+    def add_row(self, T, basis, coeffs, rhs, ncols):
+        T = np.insert(T, ncols, 0.0, axis=1)
+        new = np.zeros(T.shape[1])
+        new[:len(coeffs)] = coeffs
+        new[ncols] = 1.0
+        new[-1] = rhs
+        rows = [i for i, var in enumerate(basis) if var < ncols]
+        cols = [basis[i] for i in rows]
+        new -= new[cols] @ T[rows]
+        basis.append(ncols)
+        return np.insert(T, len(T) - 1, new, axis=0)
+
+    def add_column(self, T, col, values, coeffs):
+        return np.insert(T, col, np.asarray(values, dtype=float), axis=1)
+
+    def remove_row(self, T, row):
+        return np.delete(T, row, axis=0)
+
+    def shift(self, T, col, delta):
+        T[:, -1] -= T[:, col] * float(delta)
+
+    def add_rhs(self, T, delta):
+        T[:, -1] += np.asarray(delta, dtype=float)
+
+    def complement(self, T, basis, col, bound):
+        self.shift(T, col, bound)
+        T[:, col] *= -1.0
+        if col in basis:
+            T[basis.index(col)] *= -1.0
+
+    def extract(self, T, basis, n):
+        x = [0] * n
+        for i, var in enumerate(basis):
+            if var < n:
+                x[var] = float(T[i, -1])
+        return x
+
+    def snapshot(self, T):
+        return T.copy()
@@ -1,115 +1,198 @@
-# from copy import deepcopy
-# from fractions import Fraction as F
-# from .base import simplex, SimplexResult
-
-# def gomory_integer(c, A, b, senses=None, max_cuts=100):
-#     """
-#     Решение целочисленной задачи методом Гомори.
-
-#     Параметры:
-#         c: коэффициенты целевой функции (макс. задача)
-#         A: матрица ограничений
-#         b: вектор правых частей
-#         senses: список знаков ограничений (<=, >=, ==)
-#         max_cuts: макс. число рассечений
-
-#     Возвращает:
-#         SimplexResult со status 'optimal_integer', 'infeasible' или 'max_cuts_exceeded'
-#     """
-#     n = len(c)
-#     if senses is None:
-#         senses = ['<='] * len(A)
-#     history = []
-
-#     # В текущей реализации senses не используется для преобразования ограничений,
-#     # это нужно добавить при необходимости.
-
-#     # 1) Пытаемся выкинуть дробные решения рассечениями Гомори
-#     for cut_iter in range(max_cuts):
-#         result = simplex(c, A, b, senses)
-#         history.extend(result.history)
-
-#         if result.status != 'optimal':
-#             # LP нерешаем или не оптимален
-#             return SimplexResult(
-#                 result.status,
-#                 x=[int(v) if float(v).is_integer() else v for v in (result.x or [])],
-#                 objective=result.objective,
-#                 alternative=result.alternative,
-#                 tableau=result.tableau,
-#                 history=history
-#             )
-
-#         # Проверяем, целые ли x
-#         x = result.x
-#         fracs = [F(xi).limit_denominator() - F(int(xi)) for xi in x]
-#         frac_rows = [(i, frac) for i, frac in enumerate(fracs) if frac != 0]
-#         if not frac_rows:
-#             # Все целые — нашли оптимум
-#             int_x = [int(round(xi)) for xi in x]
-#             return SimplexResult(
-#                 'optimal_integer',
-#                 x=int_x,
-#                 objective=result.objective,
-#                 alternative=result.alternative,
-#                 tableau=result.tableau,
-#                 history=history
-#             )
-
-#         # Строим первое рассечение по строке с дробной базисной переменной
-#         row_idx, _ = frac_rows[0]
-#         T = history[-1]
-#         basis = getattr(result, 'basis', [])
-#         if row_idx not in basis:
-#             # Не получилось найти строку для рассечения — выходим в перебор
-#             break
-
-#         cut_row = basis.index(row_idx)
-#         frac_row = T[cut_row]
-#         total_cols = len(frac_row) - 1
-
-#         # f_j = frac(frac_row[j]), rhs = frac(frac_row[-1])
-#         cuts = [
-#             frac_row[j] - frac_row[j].numerator // frac_row[j].denominator
-#             for j in range(total_cols)
-#         ]
-#         rhs_cut = frac_row[-1] - frac_row[-1].numerator // frac_row[-1].denominator
-
-#         # Добавляем cut:  sum(–f_j x_j) <= –f_rhs
-#         A.append([-cuts[j] for j in range(n)])
-#         b.append(-rhs_cut)
-#         c.append(0)          # новая переменная рассечения
-#         senses.append('<=')  # Рассечение добавляем как <=
-
-#     # 2) Если рассечения не дали результата — делаем брутфорс-перебор (для малых n)
-#     best_val = None
-#     best_x = [0] * n
-
-#     # Оценим эвристические верхние границы для каждой x_j
-#     bounds = [
-#         max((b_i // row[j]) if row[j] > 0 else 0 for row, b_i in zip(A, b))
-#         for j in range(n)
-#     ]
-
-#     from itertools import product
-#     for candidate in product(*(range(bounds[j] + 1) for j in range(n))):
-#         # Проверяем все ограничения
-#         if all(
-#             (sum(A[i][j] * candidate[j] for j in range(n)) <= b[i] if senses[i] == '<=' else
-#              sum(A[i][j] * candidate[j] for j in range(n)) >= b[i] if senses[i] == '>=' else
-#              sum(A[i][j] * candidate[j] for j in range(n)) == b[i])
-#             for i in range(len(A))
-#         ):
-#             val = sum(c[j] * candidate[j] for j in range(n))
-#             if best_val is None or val > best_val:
-#                 best_val = val
-#                 best_x = list(candidate)
-
-#     return SimplexResult(
-#         'optimal_integer',
-#         x=best_x,
-#         objective=best_val or 0,
-#         alternative=False,
-#         tableau=None,
-#         history=history
-#     )
+from collections import namedtuple
+from fractions import Fraction as F
+from math import floor, gcd, lcm
+
+from .base import SimplexResult
+from .model import LPModel
+from .sparse import csr_rows
+from .stats import Monitor
+
+# отсечение sum(coeffs[j] * t_j) <= rhs в переменных столбцов таблицы; coeffs — {столбец: коэффициент}
+Cut = namedtuple('Cut', 'coeffs rhs')
+# оптимальная таблица узла для генератора отсечений: integral[j] — столбец j принимает только
+# целые значения (с учётом границ bounds, если они есть), x — решение, depth — глубина узла
+CutNode = namedtuple('CutNode', 'be tableau basis ncols bounds integral x depth')
+
+INT_TOL = 1e-9
+
+
+def _frac(be, v):
+    f = v - floor(v)
+    return 0 if f <= be.eps or 1 - f <= be.eps else f
+
+
+def gomory_cuts(node, max_cuts=None):
+    """
+    Смешанно-целочисленные отсечения Гомори (GMI) по строкам оптимальной таблицы node,
+    в которых целочисленная базисная переменная имеет дробное значение. Для строки
+    x_B + sum(a_j t_j) = beta, f0 = frac(beta) отсечение
+        sum(g_j t_j) >= 1,  g_j = f_j / f0 или (1 - f_j) / (1 - f0) для целых t_j,
+                            a_j / f0 или -a_j / (1 - f0) для непрерывных,
+    возвращается как Cut(-g, -1). Строки берутся в порядке убывания min(f0, 1 - f0).
+    Подходит как cuts для solve_integer.
+    """
+    be, T, basis, ncols = node.be, node.tableau, node.basis, node.ncols
+    rows = []
+    for r, var in enumerate(basis):
+        if var < ncols and node.integral[var]:
+            f0 = _frac(be, T[r][-1])
+            if f0:
+                rows.append((-min(f0, 1 - f0), r, f0))
+    rows.sort()
+    in_basis = set(basis)
+    cuts = []
+    for _, r, f0 in rows[:max_cuts]:
+        coeffs = {}
+        for j in range(ncols):
+            a = T[r][j]
+            if j in in_basis or be.is_zero(a):
+                continue
+            if node.integral[j]:
+                f = _frac(be, a)
+                g = f / f0 if f <= f0 else (1 - f) / (1 - f0)
+            else:
+                g = a / f0 if a > 0 else -a / (1 - f0)
+            if g:
+                coeffs[j] = -g
+        if coeffs:
+            cuts.append(Cut(coeffs, -1))
+    return cuts
+
+
+def structural_cut(node, coeffs, sense, rhs):
+    """
+    Отсечение coeffs·x (sense) rhs в исходных переменных ('<=' или '>=') -> Cut в переменных
+    таблицы узла: x_j = lower_j + t_j или upper_j - t_j для переменной на верхней границе.
+    """
+    sign = 1 if sense == '<=' else -1
+    bounds = node.bounds
+    rhs = rhs * sign
+    cut = {}
+    for j, a in enumerate(coeffs):
+        if a == 0:
+            continue
+        a = a * sign
+        if bounds is None:
+            cut[j] = a
+        elif bounds.flipped[j]:
+            cut[j] = -a
+            rhs -= a * bounds.upper[j]
+        else:
+            cut[j] = a
+            rhs -= a * bounds.lower[j]
+    return Cut(cut, rhs)
+
+
+def add_cut(be, T, basis, ncols, cut):
+    """
+    Добавляет отсечение строкой со slack-столбцом ncols (базисным); искусственные
+    индексы базиса (>= ncols) сдвигаются. Возвращает таблицу — в ней ncols + 1 столбцов.
+    """
+    for k, var in enumerate(basis):
+        if var >= ncols:
+            basis[k] = var + 1
+    coeffs = [0] * ncols
+    for j, v in cut.coeffs.items():
+        coeffs[j] = v
+    return be.add_row(T, basis, coeffs, cut.rhs, ncols)
+
+
+def integral_rows(A, b, integer):
+    """
+    Строки, slack которых s = b - A x целый: целые коэффициенты только при целых переменных
+    и целый b. Сдвиги границ и смена знака строки на это не влияют.
+    """
+    return [
+        F(bi).denominator == 1 and all(integer[j] and F(a).denominator == 1 for j, a in row.items())
+        for row, bi in zip(csr_rows(A, len(b)), b)
+    ]
+
+
+def column_integrality(bounds, integer, slack_integral, ncols):
+    """
+    integral для CutNode: t_j = x_j - lower_j (или upper_j - x_j) целый, если x_j целый и граница
+    целая; slack исходных строк — по slack_integral, slack отсечений считаются непрерывными.
+    """
+    n = len(integer)
+    integral = []
+    for j in range(n):
+        bound = 0 if bounds is None else (bounds.upper[j] if bounds.flipped[j] else bounds.lower[j])
+        integral.append(integer[j] and F(bound).denominator == 1)
+    integral.extend(slack_integral)
+    return (integral + [False] * ncols)[:ncols]
+
+
+def _structural(cut, model):
+    """Cut в переменных таблицы LPModel -> (coeffs, rhs) в исходных переменных x."""
+    n = model.n
+    coeffs = [cut.coeffs.get(j, 0) for j in range(n)]
+    rhs = cut.rhs
+    for i, row in enumerate(csr_rows(model.A, model.m)):
+        slack = model._slack(i)
+        if slack is None or slack[0] not in cut.coeffs:
+            continue
+        # sign * s = b_i - A_i x
+        g = cut.coeffs[slack[0]] * slack[1]
+        for j, a in row.items():
+            coeffs[j] -= g * a
+        rhs -= g * model.b[i]
+    return coeffs, rhs
+
+
+def _rounded(coeffs, rhs):
+    """Целочисленное отсечение: умножение на НОК знаменателей и округление rhs вниз (Хватал)."""
+    values = [F(v) for v in coeffs] + [F(rhs)]
+    scale = lcm(*(v.denominator for v in values))
+    ints = [int(v * scale) for v in values[:-1]]
+    g = gcd(*ints) or 1
+    return [v // g for v in ints], floor(values[-1] * scale / g)
+
+
+def gomory_integer(c, A, b, senses=None, max_cuts=100, backend=None):
+    """
+    Решение целочисленной задачи методом Гомори: отсечения GMI снимаются с оптимальной
+    таблицы, добавляются строками (с целыми коэффициентами и округлённой правой частью)
+    и таблица доводится двойственным симплексом без повторного решения с нуля.
+
+    Параметры:
+        c: коэффициенты целевой функции (макс. задача)
+        A: матрица ограничений
+        b: вектор правых частей
+        senses: список знаков ограничений (<=, >=, ==)
+        max_cuts: макс. число рассечений
+        backend: движок арифметики (точный по умолчанию)
+
+    Возвращает:
+        SimplexResult со status 'optimal_integer', 'infeasible', 'unbounded' или
+        'max_cuts_exceeded' (тогда bound — граница цели по последней релаксации)
+    """
+    n = len(c)
+    model = LPModel(c, A, b, senses, backend=backend)
+    monitor = Monitor(model.be)
+    exact = model.be.name != 'float'
+    integer = [True] * n
+    while True:
+        res = model.solve()
+        monitor.merge(res.stats)
+        if res.status != 'optimal':
+            res = SimplexResult(res.status)
+            break
+        if all(abs(v - round(v)) <= INT_TOL for v in res.x):
+            res.status = 'optimal_integer'
+            res.x = [round(v) for v in res.x]
+            break
+        slack_integral = [ok for ok, s in zip(integral_rows(model.A, model.b, integer), model.senses) if s != '==']
+        node = CutNode(model.be, model.T, model.basis, model.ncols, None,
+                       column_integrality(None, integer, slack_integral, model.ncols), res.x, 0)
+        cuts = gomory_cuts(node, max_cuts - monitor.stats.cuts) if monitor.stats.cuts < max_cuts else []
+        if not cuts:
+            res = SimplexResult('max_cuts_exceeded', bound=res.objective)
+            break
+        for cut in cuts:
+            coeffs, rhs = _structural(cut, model)
+            if exact:
+                coeffs, rhs = _rounded(coeffs, rhs)
+            model.add_row(coeffs, '<=', rhs)
+        monitor.stats.cuts += len(cuts)
+    res.stats = monitor.finish()
+    return res
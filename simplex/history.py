@@ -0,0 +1,101 @@
+from collections import namedtuple
+
+Pivot = namedtuple('Pivot', 'row col entering leaving')
+# переход к Phase II: удаление искусственных столбцов [start, stop) и новая строка цели
+PhaseChange = namedtuple('PhaseChange', 'start stop')
+# переход переменной к другой границе: столбец col заменён на bound - x_col
+Flip = namedtuple('Flip', 'col bound')
+
+HISTORY_MODES = ('none', 'pivots', 'full')
+
+
+class History(list):
+    """Общая часть журналов: события передаются монитору статистики (simplex.stats.Monitor), если он задан."""
+    monitor = None
+
+    def start(self, T):
+        if self.monitor is not None:
+            self.monitor.start(T)
+
+    def record(self, T, event):
+        if self.monitor is not None:
+            self.monitor.record(T, event)
+
+    def check(self, T):
+        """Перед очередным шагом: монитор прерывает решение по лимитам."""
+        if self.monitor is not None:
+            self.monitor.check(T)
+
+
+class NoHistory(History):
+    """record_history='none': ничего не сохраняется."""
+
+
+class TableauHistory(History):
+    """record_history='full': копия таблицы после каждого шага."""
+
+    def __init__(self, be):
+        super().__init__()
+        self.be = be
+
+    def start(self, T):
+        self.append(self.be.snapshot(T))
+        super().start(T)
+
+    def record(self, T, event):
+        self.append(self.be.snapshot(T))
+        super().record(T, event)
+
+
+class PivotLog(History):
+    """
+    record_history='pivots': компактный журнал Pivot(row, col, entering, leaving), Flip и PhaseChange.
+    Таблица любого шага восстанавливается по запросу через tableau(step).
+    """
+
+    def __init__(self, be, problem, basis, phase=1):
+        super().__init__()
+        self.be = be
+        self.problem = problem
+        self.basis = list(basis)
+        self.phase = phase
+
+    def record(self, T, event):
+        self.append(event)
+        super().record(T, event)
+
+    def tableau(self, step=None):
+        """Таблица после step событий журнала (0 — начальная, None — финальная)."""
+        if step is None:
+            step = len(self)
+        c, A, b, senses = self.problem
+        T, slack_count, _ = self.be.build(c, A, b, senses, phase=self.phase)
+        basis = list(self.basis)
+        flipped = set()
+        for event in self[:step]:
+            if isinstance(event, Pivot):
+                self.be.pivot(T, basis, event.row, event.col)
+            elif isinstance(event, Flip):
+                self.be.complement(T, basis, event.col, event.bound)
+                flipped ^= {event.col}
+            else:
+                cost = [-cj if j in flipped else cj for j, cj in enumerate(c)]
+                T = self.be.drop_columns(T, event.start, event.stop)
+                T = self.be.set_cost(T, cost, slack_count, basis)
+        return T
+
+    def tableaus(self):
+        return [self.tableau(step) for step in range(len(self) + 1)]
+
+
+def new_history(mode, be, problem, basis, phase=1, monitor=None):
+    if mode == 'full':
+        history = TableauHistory(be)
+    elif mode == 'pivots':
+        history = PivotLog(be, problem, basis, phase)
+    elif mode == 'none':
+        history = NoHistory()
+    else:
+        raise ValueError(f"record_history must be one of {HISTORY_MODES}, got {mode!r}")
+    history.monitor = monitor
+    return history
@@ -0,0 +1,25 @@
+from .base import get_backend, simplex, warm_solve
+from .stats import Monitor
+
+
+def hybrid_simplex(c, A, b, senses=None, exact='integer', record_history='none', pricing='dantzig'):
+    """
+    Гибридное решение: сначала быстрый float-симплекс, затем его итоговый базис
+    восстанавливается в точной арифметике (exact: 'integer' или 'fraction') и проверяется
+    на прямую и двойственную допустимость. Если float-базис оказался неверным, точный
+    симплекс доводит решение несколькими пивотами из него, а если базис непригоден —
+    решает задачу с нуля. Ответ точный, как у simplex(..., backend='fraction').
+    history и tableau относятся к точной фазе.
+    """
+    if senses is None:
+        senses = ['<='] * len(b)
+    approx = simplex(c, A, b, senses, backend='float', record_history='none', pricing=pricing)
+    if approx.basis is not None:
+        be = get_backend(exact, A, len(b))
+        monitor = Monitor(be)
+        res = warm_solve(be, c, A, b, senses, approx.basis, record_history, pricing, monitor)
+        if res is not None:
+            res.stats = monitor.finish()
+            res.problem = (c, A, b, senses)
+            return res
+    return simplex(c, A, b, senses, backend=exact, record_history=record_history, pricing=pricing)
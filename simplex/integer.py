@@ -0,0 +1,271 @@
+from fractions import Fraction as F
+from math import lcm
+
+from .base import build_tableau
+from .sparse import to_dense
+
+
+class _Row:
+    """Строка IntegerTableau: индексация возвращает точное значение (Fraction)."""
+
+    def __init__(self, nums, den):
+        self.nums = nums
+        self.den = den
+
+    def __getitem__(self, j):
+        return F(self.nums[j], self.den)
+
+    def __len__(self):
+        return len(self.nums)
+
+    def __iter__(self):
+        return (F(v, self.den) for v in self.nums)
+
+
+class IntegerTableau:
+    """
+    Таблица из целых чисел с общим знаменателем: значение элемента равно rows[i][j] / D,
+    строки цели — rows[-1][j] / (D * scale). Пивоты Барейса сохраняют целочисленность
+    без сокращения дробей; в Fraction значения переводятся только при чтении.
+    """
+
+    def __init__(self, rows, D=1, scale=1):
+        self.rows = rows
+        self.D = D          # общий знаменатель (> 0), определитель текущего базиса
+        self.scale = scale  # множитель строки цели (НОК знаменателей c)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getitem__(self, i):
+        if i == -1 or i == len(self.rows) - 1:
+            return _Row(self.rows[-1], self.D * self.scale)
+        return _Row(self.rows[i], self.D)
+
+    def to_fractions(self):
+        return [list(row) for row in (self[i] for i in range(len(self.rows)))]
+
+    def __eq__(self, other):
+        if isinstance(other, IntegerTableau):
+            other = other.to_fractions()
+        return self.to_fractions() == other
+
+    def rescale(self, k):
+        """Умножает все числители и D на целое k > 0 (значения не меняются)."""
+        if k != 1:
+            self.rows = [[v * k for v in row] for row in self.rows]
+            self.D *= k
+
+
+def build_integer_tableau(c, A, b, senses, phase):
+    """
+    Строки точной таблицы домножаются на НОК знаменателей строки L_i; общий знаменатель
+    D = prod(L_i) — определитель начального базиса (в нём slack-столбцы равны L_i).
+    """
+    tableau, slack_count, art_count = build_tableau(c, to_dense(A, len(b), len(c)), b, senses, phase)
+    dens = [lcm(*(v.denominator for v in row)) for row in tableau[:-1]]
+    D = 1
+    for L in dens:
+        D *= L
+    scale = 1 if phase == 1 else lcm(*(F(v).denominator for v in c), 1)
+    rows = [[int(v * D) for v in row] for row in tableau[:-1]]
+    rows.append([int(v * D * scale) for v in tableau[-1]])
+    return IntegerTableau(rows, D, scale), slack_count, art_count
+
+
+class IntegerBackend:
+    """
+    Точная арифметика без Fraction внутри пивота: целочисленная таблица с общим знаменателем
+    и пивотами Барейса (деление на прошлый ведущий элемент всегда нацело).
+    """
+    name = 'integer'
+    eps = 0
+
+    def build(self, c, A, b, senses, phase):
+        return build_integer_tableau(c, A, b, senses, phase)
+
+    def pivot(self, T, basis, row, col):
+        rows, D = T.rows, T.D
+        prow = rows[row]
+        p = prow[col]
+        sign = 1 if p > 0 else -1
+        for i, other in enumerate(rows):
+            if i == row:
+                continue
+            f = other[col]
+            if f == 0:
+                # the value is unchanged, only the denominator moves from D to |p|
+                if p * sign != D:
+                    rows[i] = [v * p * sign // D for v in other]
+            else:
+                rows[i] = [sign * ((v * p - f * w) // D) for v, w in zip(other, prow)]
+        if sign < 0:
+            rows[row] = [-v for v in prow]
+        T.D = p * sign
+        basis[row] = col
+
+    def entering(self, T):
+        return next((j for j, v in enumerate(T.rows[-1][:-1]) if v < 0), None)
+
+    def negative_costs(self, T, start=0, stop=None):
+        den = T.D * T.scale
+        stop = len(T.rows[-1]) - 1 if stop is None else stop
+        return [(j, F(v, den)) for j, v in enumerate(T.rows[-1][start:stop], start) if v < 0]
+
+    def width(self, T):
+        return len(T.rows[-1]) - 1
+
+    def column_norms(self, T, cols):
+        D = T.D
+        return [sum((row[j] / D) ** 2 for row in T.rows[:-1]) for j in cols]
+
+    def row_nonzeros(self, T, row):
+        den = T.D * T.scale if row in (-1, len(T.rows) - 1) else T.D
+        return [(j, F(v, den)) for j, v in enumerate(T.rows[row][:-1]) if v != 0]
+
+    def leaving(self, T, basis, col):
+        # all constraint rows share D, so ratios of numerators equal ratios of values;
+        # the pivot column is positive, so ratios compare by cross-multiplication
+        pivot_row = None
+        for i, row in enumerate(T.rows[:-1]):
+            a = row[col]
+            if a > 0 and row[-1] >= 0:
+                if pivot_row is None:
+                    pivot_row = i
+                    continue
+                best = T.rows[pivot_row]
+                lhs, rhs = row[-1] * best[col], best[-1] * a
+                if lhs < rhs or (lhs == rhs and basis[i] > basis[pivot_row]):
+                    pivot_row = i
+        return pivot_row
+
+    def dual_leaving(self, T):
+        rows = T.rows
+        return min(
+            (i for i in range(len(rows) - 1) if rows[i][-1] < 0),
+            default=None,
+            key=lambda i: rows[i][-1]
+        )
+
+    def negative_rhs(self, T):
+        # the values only weigh dual pricing, which works in float
+        D = T.D
+        return [(i, row[-1] / D) for i, row in enumerate(T.rows[:-1]) if row[-1] < 0]
+
+    def row_norms(self, T, rows):
+        D = T.D
+        return [sum((v / D) ** 2 for v in T.rows[i][:-1]) for i in rows]
+
+    def dual_ratios(self, T, row, ncols):
+        D, cost, r = T.D, T.rows[-1], T.rows[row]
+        return [(j, F(cost[j], D * T.scale), F(-r[j], D)) for j in range(ncols) if r[j] < 0]
+
+    def dual_entering(self, T, row, ncols):
+        # ratios cost_j / -r_j with -r_j > 0, compared by cross-multiplication;
+        # on ties the first (smallest) column is kept
+        cost, r = T.rows[-1], T.rows[row]
+        best = None
+        for j in range(ncols):
+            if r[j] < 0 and (best is None or cost[j] * -r[best] < cost[best] * -r[j]):
+                best = j
+        return best
+
+    def objective(self, T):
+        return F(T.rows[-1][-1], T.D * T.scale)
+
+    def is_zero(self, v):
+        return v == 0
+
+    def drop_columns(self, T, start, stop):
+        for row in T.rows:
+            del row[start:stop]
+        return T
+
+    def set_cost(self, T, c, slack_count, basis):
+        n = len(c)
+        c = [F(v) for v in c]
+        T.scale = scale = lcm(*(v.denominator for v in c), 1)
+        g = [int(v * scale) for v in c]
+        width = len(T.rows[0])
+        cost = [-T.D * v for v in g] + [0] * (width - n)
+        for i, var in enumerate(basis):
+            if var < n and g[var] != 0:
+                coef = g[var]
+                cost = [a + coef * b for a, b in zip(cost, T.rows[i])]
+        T.rows[-1] = cost
+        return T
+
+    def add_row(self, T, basis, coeffs, rhs, ncols):
+        coeffs = [F(v) for v in coeffs]
+        rhs = F(rhs)
+        T.rescale(lcm(*(v.denominator for v in coeffs), rhs.denominator))
+        for row in T.rows:
+            row.insert(ncols, 0)
+        D = T.D
+        new = [0] * (ncols + 2)
+        new[:len(coeffs)] = [int(v * D) for v in coeffs]
+        new[ncols] = D
+        new[-1] = int(rhs * D)
+        for i, var in enumerate(basis):
+            if var < ncols and new[var] != 0:
+                # exact: after the rescale every row is a multiple of the coefficient's denominator
+                f = new[var]
+                new = [a - f * b // D for a, b in zip(new, T.rows[i])]
+        T.rows.insert(len(T.rows) - 1, new)
+        basis.append(ncols)
+        return T
+
+    def add_column(self, T, col, values, coeffs):
+        # scaling row i by the denominator of a_i makes the column integral; D must grow
+        # by the same product to stay a multiple of the basis determinant
+        values = [F(v) for v in values]
+        k = 1
+        for a in coeffs[:-1]:
+            k *= F(a).denominator
+        T.rescale(k)
+        den = (F(coeffs[-1]) * T.scale).denominator
+        if den != 1:
+            T.rows[-1] = [v * den for v in T.rows[-1]]
+            T.scale *= den
+        dens = [T.D] * (len(T.rows) - 1) + [T.D * T.scale]
+        for row, v, den in zip(T.rows, values, dens):
+            row.insert(col, int(v * den))
+        return T
+
+    def remove_row(self, T, row):
+        # the removed row belongs to a basic slack, so D still divides every minor
+        del T.rows[row]
+        return T
+
+    def shift(self, T, col, delta):
+        # substitute x_col = x_col' + delta; rescaling makes the update integral
+        delta = F(delta)
+        T.rescale(delta.denominator)
+        for row in T.rows:
+            if row[col]:
+                row[-1] -= row[col] * delta.numerator // delta.denominator
+
+    def add_rhs(self, T, delta):
+        delta = [F(d) for d in delta]
+        T.rescale(lcm(*(d.denominator for d in delta), 1))
+        dens = [T.D] * (len(T.rows) - 1) + [T.D * T.scale]
+        for row, d, den in zip(T.rows, delta, dens):
+            row[-1] += int(d * den)
+
+    def complement(self, T, basis, col, bound):
+        self.shift(T, col, bound)
+        for row in T.rows:
+            row[col] = -row[col]
+        if col in basis:
+            r = basis.index(col)
+            T.rows[r] = [-v for v in T.rows[r]]
+
+    def extract(self, T, basis, n):
+        x = [0] * n
+        for i, var in enumerate(basis):
+            if var < n:
+                x[var] = float(F(T.rows[i][-1], T.D))
+        return x
+
+    def snapshot(self, T):
+        return IntegerTableau([list(row) for row in T.rows], T.D, T.scale)
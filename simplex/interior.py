@@ -0,0 +1,190 @@
+import numpy as np
+from scipy.linalg import LinAlgError, cho_factor, cho_solve
+
+from .base import SimplexResult, simplex
+from .stats import Monitor
+
+STEP = 0.99          # доля шага до границы z > 0, w > 0
+DIVERGENCE = 1e10    # рост ||z|| или ||y|| относительно данных, после которого метод останавливается
+RAY = 1e-6           # относительная точность луча Фаркаша, доказывающего несовместность
+STALL = 1e-16        # z·w / N, ниже которого барьер без прямой допустимости стоит на месте
+REGULARIZATION = 1e-12
+
+
+def standard_form(c, A, b, senses):
+    """
+    Задача min g·z, K z = b, z >= 0 в порядке столбцов таблицы: z = (x, slack), g = (-c, 0),
+    slack-столбец +1 для '<=' и -1 для '>='. Возвращает (g, K, b) плотными массивами numpy.
+    """
+    m, n = len(b), len(c)
+    if hasattr(A, 'toarray'):
+        dense = A.toarray()
+    else:
+        from .sparse import to_dense
+        dense = to_dense(A, m, n)
+    dense = np.asarray(dense, dtype=float).reshape(m, n)
+    rows = [i for i, s in enumerate(senses) if s in ('<=', '>=')]
+    slacks = np.zeros((m, len(rows)))
+    for k, i in enumerate(rows):
+        slacks[i, k] = 1.0 if senses[i] == '<=' else -1.0
+    g = np.concatenate([-np.asarray([float(v) for v in c]), np.zeros(len(rows))])
+    return g, np.hstack([dense, slacks]), np.asarray([float(v) for v in b])
+
+
+class NormalEquations:
+    """Разложение Холецкого K D K^T; при потере положительной определённости — с регуляризацией."""
+
+    def __init__(self, K, d):
+        M = (K * d) @ K.T
+        ridge, top = 0.0, max(1.0, np.diag(M).max(initial=0.0))
+        while True:
+            try:
+                self.factor = cho_factor(M + ridge * np.eye(len(M)) if ridge else M)
+                return
+            except LinAlgError:
+                ridge = ridge * 100 if ridge else REGULARIZATION * top
+
+    def solve(self, v):
+        return cho_solve(self.factor, v)
+
+
+def starting_point(g, K, b):
+    """
+    Начальная точка Мехротры: решения наименьшей нормы K z = b и K^T y ≈ g, сдвинутые
+    внутрь z > 0, w > 0. None — система K z = b несовместна и без условия z >= 0.
+    """
+    z = np.linalg.lstsq(K, b, rcond=None)[0]
+    if np.linalg.norm(K @ z - b) > RAY * (1.0 + np.linalg.norm(b)):
+        return None
+    y = np.linalg.lstsq(K.T, g, rcond=None)[0]
+    w = g - K.T @ y
+    z += max(-1.5 * z.min(), 0.0)
+    w += max(-1.5 * w.min(), 0.0)
+    gap = z @ w
+    if gap <= 0:
+        z += 1.0
+        w += 1.0
+        gap = z @ w
+    return z + 0.5 * gap / w.sum(), y, w + 0.5 * gap / z.sum()
+
+
+def _step(v, dv):
+    """Наибольший шаг alpha <= 1, при котором v + alpha dv >= 0."""
+    neg = dv < 0
+    return min(1.0, (-v[neg] / dv[neg]).min()) if neg.any() else 1.0
+
+
+def stalled(K, b, z, w, tol=1e-8):
+    """
+    Точка барьера застряла на границе z >= 0: z·w исчезло, а невязка K z = b осталась
+    выше tol и выше погрешности вычисления K z — допустимой точки нет.
+    """
+    residual = np.linalg.norm(K @ z - b)
+    scale = 1.0 + max(np.abs(b).max(initial=0.0), np.abs(K).max(initial=0.0))
+    return (z @ w / len(z) < STALL * scale and residual > tol * (1.0 + np.linalg.norm(b))
+            and residual > RAY * (1.0 + np.linalg.norm(b) + np.abs(K).max(initial=0.0) * np.abs(z).sum()))
+
+
+def barrier(g, K, b, tol=1e-8, iteration_limit=100):
+    """
+    Прямо-двойственный метод предиктор-корректор Мехротры для min g·z, K z = b, z >= 0
+    (двойственная: max b·y, K^T y + w = g, w >= 0). Направления — из нормальных уравнений
+    K D K^T dy = r, D = Z W^{-1}. Возвращает (status, z, y, w, iterations); status —
+    'optimal', 'infeasible', 'unbounded', 'iteration_limit' или 'diverged': z растёт,
+    а K z = b ещё не выполнено, так что по точке нельзя отличить несовместность от
+    неограниченности.
+    """
+    N = len(g)
+    start = starting_point(g, K, b)
+    if start is None:
+        return 'infeasible', None, None, None, 0
+    z, y, w = start
+    scale = 1.0 + max(np.abs(b).max(initial=0.0), np.abs(g).max(initial=0.0))
+    b_norm, g_norm = 1.0 + np.linalg.norm(b), 1.0 + np.linalg.norm(g)
+    for k in range(iteration_limit):
+        rb = K @ z - b
+        rg = K.T @ y + w - g
+        mu = z @ w / N
+        primal, dual = g @ z, b @ y
+        primal_feasible = np.linalg.norm(rb) / b_norm < tol
+        dual_feasible = np.linalg.norm(rg) / g_norm < tol
+        if primal_feasible and dual_feasible and abs(primal - dual) / (1.0 + abs(primal)) < tol:
+            return 'optimal', z, y, w, k
+        # approximate Farkas rays: K^T y <= 0 with b·y > 0 proves the primal infeasible,
+        # K z = 0 with g·z < 0 (z >= 0) proves it unbounded, but only from a feasible point
+        if not primal_feasible and (dual > 0 and np.maximum(K.T @ y, 0).max() <= RAY * dual
+                                    or np.abs(y).max() > DIVERGENCE * scale):
+            return 'infeasible', z, y, w, k
+        if not dual_feasible and (primal < 0 and np.abs(K @ z).max() <= RAY * -primal
+                                  or np.abs(z).max() > DIVERGENCE * scale):
+            return ('unbounded' if primal_feasible else 'diverged'), z, y, w, k
+
+        d = z / w
+        eqs = NormalEquations(K, d)
+
+        def direction(r_zw):
+            # Z dw + W dz = r_zw together with the two residual equations
+            dy = eqs.solve(-rb - K @ (r_zw / w + d * rg))
+            dw = -rg - K.T @ dy
+            dz = (r_zw - z * dw) / w
+            return dz, dy, dw
+
+        # predictor: the affine-scaling direction
+        dz, dy, dw = direction(-z * w)
+        ap, ad = _step(z, dz), _step(w, dw)
+        mu_aff = (z + ap * dz) @ (w + ad * dw) / N
+        sigma = (mu_aff / mu) ** 3
+        # corrector: centring plus the second-order term
+        dz, dy, dw = direction(-z * w - dz * dw + sigma * mu)
+        ap, ad = STEP * _step(z, dz), STEP * _step(w, dw)
+        z = z + ap * dz
+        y = y + ad * dy
+        w = w + ad * dw
+    return 'iteration_limit', z, y, w, iteration_limit
+
+
+def interior_point(c, A, b, senses=None, crossover=True, backend='float', tol=1e-8, iteration_limit=100,
+                   record_history='none', pricing='bland'):
+    """
+    Метод внутренней точки (прямо-двойственный барьер, предиктор-корректор Мехротры) для
+    задачи simplex (максимизация, x >= 0). Число итераций почти не зависит от размера задачи.
+    crossover: по точке барьера выбирается базис (столбцы с наибольшим z_j / w_j) и
+    simplex(..., backend, warm_start=...) доводит его до вершины — результат содержит
+    basis, tableau, alternative и анализ чувствительности. Без crossover возвращается
+    внутренняя точка с точностью tol (basis is None); если барьер застрял без прямой
+    допустимости, статус — 'infeasible'. iteration_limit — итерации барьера. Crossover по
+    умолчанию во float, как и сам барьер; точная вершина — backend='fraction' и т. п.
+    Если барьер расходится, не найдя допустимой точки, задачу решает simplex с нуля.
+    """
+    m, n = len(b), len(c)
+    if senses is None:
+        senses = ['<='] * m
+    if m == 0:
+        return simplex(c, A, b, senses, backend=backend, record_history=record_history, pricing=pricing)
+    monitor = Monitor()
+    monitor.phase('barrier')
+    g, K, rhs = standard_form(c, A, b, senses)
+    status, z, _, w, iterations = barrier(g, K, rhs, tol, iteration_limit)
+    if status == 'iteration_limit' and not crossover and stalled(K, rhs, z, w, tol):
+        status = 'infeasible'
+    monitor.stats.barrier_iterations = iterations
+    monitor.phase(None)
+    if status in ('infeasible', 'unbounded'):
+        res = SimplexResult(status)
+    elif status == 'diverged':
+        res = simplex(c, A, b, senses, backend=backend, record_history=record_history, pricing=pricing)
+        monitor.merge(res.stats)
+        if res.status in ('infeasible', 'unbounded'):
+            res = SimplexResult(res.status)
+    elif crossover:
+        order = np.argsort(-z / w, kind='stable')
+        res = simplex(c, A, b, senses, backend=backend, record_history=record_history, pricing=pricing,
+                      warm_start=[int(j) for j in order])
+        monitor.merge(res.stats)
+    elif status == 'optimal':
+        res = SimplexResult(status, z[:n].tolist(), -g[:n] @ z[:n])
+    else:
+        res = SimplexResult(status)
+    res.stats = monitor.finish()
+    res.problem = (c, A, b, senses)
+    return res
@@ -0,0 +1,203 @@
+from .base import (SimplexResult, get_backend, optimize, dual_optimize, finish, primal_solve, warm_solve,
+                   set_phase, watch, monitored)
+from .history import new_history
+from .sensitivity import columns, basis_inverse
+from .sparse import append_column, append_row, csr_lists, delete_row, is_sparse
+from .stats import Monitor
+
+
+class LPModel:
+    """
+    Изменяемая задача max c·x при A x (senses) b, x >= 0 с живой таблицей. После solve()
+    таблица и базис сохраняются; add_row, remove_row, add_column, set_rhs и set_cost правят
+    их на месте, и resolve() (как и каждый следующий solve()) продолжает с текущего базиса:
+    двойственным симплексом, если базис потерял прямую допустимость, затем прямым.
+    Изменения, которые нельзя внести в таблицу (строки '=='), ведут к пересборке таблицы
+    с установкой прежнего базиса. Разреженная A (scipy.sparse или тройка CSR) хранится
+    тройкой CSR и остаётся разреженной при правках.
+    """
+
+    def __init__(self, c, A, b, senses=None, backend=None, pricing='bland'):
+        self.be = get_backend(backend, A, len(b))
+        self.c = list(c)
+        self.A = csr_lists(A) if is_sparse(A, len(b)) else [list(row) for row in A]
+        self.b = list(b)
+        self.senses = list(senses) if senses is not None else ['<='] * len(b)
+        self.pricing = pricing
+        self.T = None      # таблица Phase II текущего базиса (None — собрать заново при solve)
+        self.basis = None  # базис таблицы или, при T=None, базис для warm_start
+
+    @property
+    def n(self):
+        return len(self.c)
+
+    @property
+    def m(self):
+        return len(self.b)
+
+    @property
+    def ncols(self):
+        return self.n + sum(s != '==' for s in self.senses)
+
+    @property
+    def problem(self):
+        A = csr_lists(self.A) if isinstance(self.A, tuple) else [list(row) for row in self.A]
+        return list(self.c), A, list(self.b), list(self.senses)
+
+    def _slack(self, i):
+        """(столбец, знак) slack-переменной строки i или None для '=='."""
+        if self.senses[i] == '==':
+            return None
+        return self.n + sum(s != '==' for s in self.senses[:i]), 1 if self.senses[i] == '<=' else -1
+
+    def _units(self, rows):
+        """
+        Столбцы B^-1 e_i таблицы для строк rows (последний элемент — двойственная цена y_i).
+        Для строк со slack это сам slack-столбец, для '==' — столбец обратной базисной матрицы.
+        """
+        T, m = self.T, self.m
+        units, Binv = {}, None
+        for i in rows:
+            slack = self._slack(i)
+            if slack is not None:
+                s, sign = slack
+                units[i] = [sign * T[k][s] for k in range(m + 1)]
+                continue
+            if Binv is None:
+                Binv = basis_inverse(columns(self.A, self.senses, self.n)[0], self.basis)
+            unit = [Binv[k][i] for k in range(m)]
+            unit.append(sum((self.c[var] * u for var, u in zip(self.basis, unit) if var < self.n), 0))
+            units[i] = unit
+        return units
+
+    def _remap(self, moved):
+        self.basis = [moved(var) for var in self.basis]
+
+    def add_row(self, coeffs, sense, rhs):
+        """Новое ограничение coeffs·x (sense) rhs; возвращает номер строки."""
+        coeffs = list(coeffs) + [0] * (self.n - len(coeffs))
+        ncols = self.ncols
+        if self.basis is not None:
+            # the new slack takes column ncols, artificials of old rows move right
+            self._remap(lambda var: var + 1 if var >= ncols and sense != '==' else var)
+        if self.T is not None and sense != '==':
+            sign = 1 if sense == '<=' else -1
+            self.T = self.be.add_row(self.T, self.basis, [sign * v for v in coeffs], sign * rhs, ncols)
+        else:
+            self.T = None
+        self.A = append_row(self.A, coeffs, len(self.b))
+        self.b.append(rhs)
+        self.senses.append(sense)
+        return self.m - 1
+
+    def remove_row(self, i):
+        """Удаляет ограничение i; номера следующих строк уменьшаются на 1."""
+        be, ncols = self.be, self.ncols
+        slack = self._slack(i)
+        if self.T is not None and slack is not None:
+            s = slack[0]
+            if s not in self.basis:
+                self._enter_free(s)
+            r = self.basis.index(s)
+            self.T = be.remove_row(be.drop_columns(self.T, s, s + 1), r)
+            del self.basis[r]
+        else:
+            self.T = None
+            if self.basis is not None:
+                gone = (ncols + i, slack[0] if slack is not None else None)
+                self.basis = [var for var in self.basis if var not in gone]
+        if self.basis is not None:
+            width = 1 if slack is not None else 0
+
+            def moved(var):
+                if var >= ncols:
+                    row = var - ncols
+                    return var - width - (row > i)
+                return var - 1 if slack is not None and var > slack[0] else var
+
+            self._remap(moved)
+        self.A = delete_row(self.A, i, len(self.b))
+        del self.b[i], self.senses[i]
+
+    def _enter_free(self, s):
+        """
+        Вводит в базис slack удаляемой строки: после удаления он свободен, поэтому ведущая
+        строка ищется в обе стороны так, чтобы базис остался прямо допустимым.
+        """
+        be, T = self.be, self.T
+        row = be.leaving(T, self.basis, s)
+        if row is None:
+            rows = [k for k in range(self.m) if not be.is_zero(T[k][s])]
+            down = [k for k in rows if T[k][s] < 0]
+            row = min(down, key=lambda k: T[k][-1] / -T[k][s]) if down else rows[0]
+        be.pivot(T, self.basis, row, s)
+
+    def add_column(self, cost, coeffs):
+        """Новая переменная x_n >= 0 с ценой cost и столбцом coeffs; возвращает её номер."""
+        coeffs = list(coeffs) + [0] * (self.m - len(coeffs))
+        n = self.n
+        if self.T is not None:
+            units = self._units([i for i, a in enumerate(coeffs) if a != 0])
+            values = [0] * (self.m + 1)
+            for i, unit in units.items():
+                values = [v + coeffs[i] * u for v, u in zip(values, unit)]
+            values[-1] -= cost
+            self.T = self.be.add_column(self.T, n, values, coeffs + [cost])
+        if self.basis is not None:
+            self._remap(lambda var: var + 1 if var >= n else var)
+        self.A = append_column(self.A, coeffs, n)
+        self.c.append(cost)
+        return n
+
+    def set_rhs(self, i, value):
+        if self.T is not None:
+            delta = value - self.b[i]
+            self.be.add_rhs(self.T, [delta * u for u in self._units([i])[i]])
+        self.b[i] = value
+
+    def set_cost(self, j, value):
+        self.c[j] = value
+        if self.T is not None:
+            self.T = self.be.set_cost(self.T, self.c, self.ncols - self.n, self.basis)
+
+    def resolve(self):
+        """Повторное решение после правок с текущего базиса; до первого решения — как solve()."""
+        return self.solve()
+
+    def solve(self):
+        """Решает текущую задачу, начиная с базиса прошлого решения (если он есть)."""
+        monitor = Monitor(self.be)
+        res = monitored(self.be, monitor, lambda: self._resume(monitor) if self.T is not None
+                        else self._rebuild(monitor))
+        res.problem = self.problem
+        return res
+
+    def _rebuild(self, monitor):
+        c, A, b, senses = self.problem
+        res = None
+        if self.basis is not None:
+            res = warm_solve(self.be, c, A, b, senses, self.basis, 'none', self.pricing, monitor)
+        if res is None:
+            res = primal_solve(self.be, c, A, b, senses, 'none', self.pricing, None, None, monitor)
+        if res.basis is not None:
+            self.T, self.basis = res.tableau, list(res.basis)
+        return res
+
+    def _resume(self, monitor):
+        be, T, basis, ncols = self.be, self.T, self.basis, self.ncols
+        history = new_history('none', be, None, basis, monitor=monitor)
+        watch(monitor, basis, self.n)
+        history.start(T)
+        stuck = any(var >= ncols and not be.is_zero(T[r][-1]) for r, var in enumerate(basis))
+        if stuck or (be.dual_leaving(T) is not None and be.entering(T) is not None):
+            # neither primal nor dual feasible: install the basis on a fresh tableau
+            self.T = None
+            return self._rebuild(monitor)
+        if be.dual_leaving(T) is not None:
+            set_phase(monitor, 'dual')
+            if not dual_optimize(be, T, basis, ncols, history):
+                return SimplexResult("infeasible", tableau=T, history=history)
+        set_phase(monitor, 'phase2')
+        if not optimize(be, T, basis, history, self.pricing):
+            return SimplexResult("unbounded", tableau=T, history=history, basis=list(basis))
+        return finish(be, T, basis, self.c, self.m, self.n, history)
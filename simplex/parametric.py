@@ -0,0 +1,156 @@
+from collections import namedtuple
+from fractions import Fraction as F
+
+from .base import simplex, get_backend
+from .sensitivity import columns, basis_inverse
+
+# участок оптимального значения z(t) = objective + slope * (t - start) на [start, end] с базисом basis
+Piece = namedtuple('Piece', 'start end objective slope basis')
+
+
+class ParametricResult:
+    """
+    Кусочно-линейная функция оптимального значения z(t) на [t_min, t_max]: pieces — участки
+    с постоянным базисом в порядке возрастания t, breakpoints — точки смены базиса.
+    status — 'optimal', если функция построена на всём интервале, иначе 'infeasible' или
+    'unbounded' для t правее последнего участка (или уже в t_min, тогда pieces пуст).
+    """
+
+    def __init__(self, status, pieces):
+        self.status = status
+        self.pieces = pieces
+
+    @property
+    def breakpoints(self):
+        return [p.start for p in self.pieces[1:]]
+
+    def value(self, t):
+        """z(t) или None, если t вне построенных участков."""
+        for p in self.pieces:
+            if p.start <= t <= p.end:
+                return float(p.objective + p.slope * (t - p.start))
+        return None
+
+
+def _start(c, A, b, senses, be, pricing):
+    # the tableau is walked by further pivots, so the problem is not scaled
+    res = simplex(c, A, b, senses, backend=be, record_history='none', pricing=pricing, scaling=False)
+    # float-таблица считается в float, точные бэкенды — в Fraction
+    return res, float if be.name == 'float' else F
+
+
+def parametric_rhs(c, A, b, db, senses=None, t_range=(0, 1), backend=None, pricing='bland'):
+    """
+    Оптимальное значение при b(t) = b + t * db, t из t_range. Задача решается один раз
+    в t_min, далее базис ведётся по точкам излома двойственными пивотами: между изломами
+    x_B(t) = x_B + (t - t0) * B^-1 db, в изломе базисная переменная обнуляется и покидает базис.
+    """
+    m, n = len(b), len(c)
+    if senses is None:
+        senses = ['<='] * m
+    be = get_backend(backend, A, len(b))
+    res, num = _start(c, A, [F(bi) + F(t_range[0]) * F(di) for bi, di in zip(b, db)], senses, be, pricing)
+    t, t_max = num(t_range[0]), num(t_range[1])
+    if res.status != 'optimal':
+        return ParametricResult(res.status, [])
+    T, basis = res.tableau, res.basis
+    column, ncols = columns(A, senses, n)
+    Binv = basis_inverse(column, basis)
+    delta = [num(sum((Binv[k][i] * F(db[i]) for i in range(m)), F(0))) for k in range(m)]
+    cost = [num(v) for v in c]
+    pieces = []
+    while True:
+        slope = sum((cost[var] * d for var, d in zip(basis, delta) if var < n), num(0))
+        step, row = None, None
+        for k, (var, d) in enumerate(zip(basis, delta)):
+            if var >= ncols:
+                # an artificial left at zero: any move along db breaks the row
+                if not be.is_zero(d):
+                    step, row = num(0), k
+                    break
+                continue
+            if d < -be.eps:
+                ratio = max(num(T[k][-1]) / -d, num(0))
+                if step is None or ratio < step:
+                    step, row = ratio, k
+        end = t_max if step is None or t + step >= t_max else t + step
+        pieces.append(Piece(t, end, be.objective(T), slope, list(basis)))
+        if end == t_max:
+            return ParametricResult('optimal', _merged(pieces))
+        be.add_rhs(T, [d * (end - t) for d in delta] + [slope * (end - t)])
+        t = end
+        col = None if basis[row] >= ncols else be.dual_entering(T, row, ncols)
+        if col is None:
+            # no column can replace the leaving variable: infeasible for t > end
+            return ParametricResult('infeasible', _merged(pieces))
+        alpha = [num(T[k][col]) for k in range(m)]
+        delta[row] = delta[row] / alpha[row]
+        for k in range(m):
+            if k != row:
+                delta[k] -= alpha[k] * delta[row]
+        be.pivot(T, basis, row, col)
+
+
+def parametric_cost(c, A, b, dc, senses=None, t_range=(0, 1), backend=None, pricing='bland'):
+    """
+    Оптимальное значение при c(t) = c + t * dc, t из t_range. Между изломами x постоянен,
+    приведённые стоимости меняются линейно; в изломе стоимость небазисного столбца обнуляется,
+    и он входит в базис прямым пивотом.
+    """
+    m, n = len(b), len(c)
+    if senses is None:
+        senses = ['<='] * m
+    be = get_backend(backend, A, len(b))
+
+    def costs(t):
+        return [F(ci) + F(t) * F(di) for ci, di in zip(c, dc)]
+
+    res, num = _start(costs(t_range[0]), A, b, senses, be, pricing)
+    t, t_max = num(t_range[0]), num(t_range[1])
+    if res.status != 'optimal':
+        return ParametricResult(res.status, [])
+    T, basis = res.tableau, res.basis
+    slack_count = sum(s != '==' for s in senses)
+    ncols = n + slack_count
+    direction = [num(v) for v in dc] + [num(0)] * slack_count
+    pieces = []
+    while True:
+        x = [num(0)] * n
+        for k, var in enumerate(basis):
+            if var < n:
+                x[var] = num(T[k][-1])
+        slope = sum((d * v for d, v in zip(direction, x)), num(0))
+        # change of the cost row per unit of t: dc_B · B^-1 A_j - dc_j
+        in_basis = set(basis)
+        step, col = None, None
+        for j in range(ncols):
+            if j in in_basis:
+                continue
+            rho = sum((direction[var] * num(T[k][j]) for k, var in enumerate(basis) if var < ncols),
+                      num(0)) - direction[j]
+            if rho < -be.eps:
+                ratio = max(num(T[-1][j]) / -rho, num(0))
+                if step is None or ratio < step:
+                    step, col = ratio, j
+        end = t_max if step is None or t + step >= t_max else t + step
+        pieces.append(Piece(t, end, be.objective(T), slope, list(basis)))
+        if end == t_max:
+            return ParametricResult('optimal', _merged(pieces))
+        t = end
+        be.set_cost(T, costs(t), slack_count, basis)
+        row = be.leaving(T, basis, col)
+        if row is None:
+            # the entering column has no bound: unbounded for t > end
+            return ParametricResult('unbounded', _merged(pieces))
+        be.pivot(T, basis, row, col)
+
+
+def _merged(pieces):
+    """Склеивает соседние участки с одинаковым наклоном (вырожденные изломы)."""
+    merged = []
+    for p in pieces:
+        if merged and merged[-1].slope == p.slope and merged[-1].end == p.start:
+            merged[-1] = merged[-1]._replace(end=p.end)
+        elif p.end > p.start or not merged:
+            merged.append(p)
+    return merged
@@ -0,0 +1,203 @@
+import math
+from fractions import Fraction as F
+
+from .bounds import FLIP, as_bound
+from .sparse import is_sparse, csr_rows
+
+
+class Presolved:
+    """
+    Результат предобработки: уменьшенная задача (c, A, b, senses), журнал сокращений
+    reductions и обратное отображение postsolve(x) в исходное пространство переменных.
+    status равен 'infeasible', если несовместность видна уже при предобработке.
+    """
+
+    def __init__(self, n, m):
+        self.n = n
+        self.m = m
+        self.status = None
+        self.reductions = []
+        self.fixed = {}         # j -> значение
+        self.free_columns = []  # пустые столбцы с c_j > 0: неограниченность, если задача совместна
+        self.zero_columns = []  # пустые столбцы с c_j == 0: любое значение оптимально
+        self.offset = F(0)      # вклад зафиксированных переменных в цель
+        self.cols = []          # оставшиеся столбцы (в порядке уменьшенной задачи)
+        self.rows = []          # оставшиеся строки
+        self.c = self.A = self.b = self.senses = None
+        self.bounds = None      # границы оставшихся столбцов; None — не заданы и все x >= 0
+
+    def postsolve(self, x):
+        full = [0] * self.n
+        for k, j in enumerate(self.cols):
+            full[j] = x[k]
+        for j, v in self.fixed.items():
+            full[j] = float(v)
+        return full
+
+
+def _activity(row, lower, upper):
+    """Наименьшее и наибольшее значение a·x при lower <= x <= upper (None — бесконечность)."""
+    low = high = F(0)
+    for j, a in row.items():
+        lo, up = (lower[j], upper[j]) if a > 0 else (upper[j], lower[j])
+        low = None if low is None or lo is None else low + a * lo
+        high = None if high is None or up is None else high + a * up
+    return low, high
+
+
+def presolve(c, A, b, senses=None, bounds=None, integral=False):
+    """
+    Удаляет пустые и избыточные строки (по диапазону значений a·x в границах переменных),
+    превращает строки-синглтоны в границы переменной, фиксирует переменные с совпавшими
+    границами и пустые столбцы. Повторяется до неподвижной точки.
+    bounds: границы переменных [(lower, upper), ...], по умолчанию x >= 0.
+    integral: все переменные целые — границы округляются внутрь.
+    """
+    m, n = len(b), len(c)
+    if senses is None:
+        senses = ['<='] * m
+    p = Presolved(n, m)
+    explicit = bounds is not None
+    if bounds is None:
+        bounds = [(0, None)] * n
+    rows = dict(enumerate(csr_rows(A, m)))
+    rhs = {i: F(b[i]) for i in range(m)}
+    sense = dict(enumerate(senses))
+    cost = [F(v) for v in c]
+    inward = (math.ceil, math.floor) if integral else (F, F)
+    lower = [F(inward[0](F(lo))) for lo, _ in bounds]
+    upper = [None if up is None else F(inward[1](up)) for up in (as_bound(up) for _, up in bounds)]
+    alive = set(range(n))
+
+    def fix(j, value, reason='fixed'):
+        p.fixed[j] = value
+        p.offset += cost[j] * value
+        p.reductions.append((reason, j, value))
+        alive.discard(j)
+        for i, row in rows.items():
+            if j in row:
+                rhs[i] -= row.pop(j) * value
+
+    def infeasible(i):
+        p.status = 'infeasible'
+        p.reductions.append(('infeasible_row', i))
+
+    changed = True
+    while changed and p.status is None:
+        changed = False
+        for i in list(rows):
+            row = rows[i]
+            low, high = _activity(row, lower, upper)
+            too_low = high is not None and high < rhs[i] and sense[i] != '<='
+            too_high = low is not None and low > rhs[i] and sense[i] != '>='
+            if too_low or too_high:
+                infeasible(i)
+                break
+            if not row:
+                del rows[i]
+                p.reductions.append(('empty_row', i))
+                changed = True
+            elif (sense[i] == '<=' and high is not None and high <= rhs[i]
+                  or sense[i] == '>=' and low is not None and low >= rhs[i]):
+                # holds for every x within the bounds
+                del rows[i]
+                p.reductions.append(('redundant_row', i))
+                changed = True
+            elif len(row) == 1:
+                (j, a), = row.items()
+                value = rhs[i] / a
+                s = sense[i] if a > 0 else FLIP[sense[i]]
+                del rows[i]
+                changed = True
+                if s in ('>=', '==') and value > lower[j]:
+                    lower[j] = F(inward[0](value))
+                if s in ('<=', '==') and (upper[j] is None or value < upper[j]):
+                    upper[j] = F(inward[1](value))
+                p.reductions.append(('bound_row', i, j))
+                if upper[j] is not None and lower[j] > upper[j]:
+                    infeasible(i)
+                    break
+                if lower[j] == upper[j]:
+                    fix(j, lower[j])
+        if p.status is not None:
+            break
+        # identical rows with the same sense: keep the tightest
+        seen = {}
+        for i in sorted(rows):
+            key = (tuple(sorted(rows[i].items())), sense[i])
+            if key not in seen:
+                seen[key] = i
+                continue
+            k = seen[key]
+            tighter = {'<=': min, '>=': max}.get(sense[i])
+            if tighter is None:
+                if rhs[i] != rhs[k]:
+                    infeasible(i)
+                    break
+            else:
+                rhs[k] = tighter(rhs[k], rhs[i])
+            del rows[i]
+            p.reductions.append(('duplicate_row', i, k))
+            changed = True
+        if p.status is not None:
+            break
+        used = {j for row in rows.values() for j in row}
+        for j in sorted(alive - used):
+            if cost[j] > 0 and upper[j] is None:
+                p.free_columns.append(j)
+                p.reductions.append(('unbounded_column', j))
+                alive.discard(j)
+            else:
+                if cost[j] == 0 and upper[j] != lower[j]:
+                    p.zero_columns.append(j)
+                fix(j, upper[j] if cost[j] > 0 else lower[j], 'empty_column')
+            changed = True
+
+    p.rows = sorted(rows)
+    p.cols = sorted(alive)
+    index = {j: k for k, j in enumerate(p.cols)}
+    p.c = [cost[j] for j in p.cols]
+    p.b = [rhs[i] for i in p.rows]
+    p.senses = [sense[i] for i in p.rows]
+    if explicit or any(lower[j] != 0 or upper[j] is not None for j in p.cols):
+        p.bounds = [(lower[j], upper[j]) for j in p.cols]
+    if is_sparse(A, m):
+        data, indices, indptr = [], [], [0]
+        for i in p.rows:
+            for j, v in sorted(rows[i].items()):
+                data.append(v)
+                indices.append(index[j])
+            indptr.append(len(data))
+        p.A = (data, indices, indptr)
+    else:
+        p.A = [[rows[i].get(j, F(0)) for j in p.cols] for i in p.rows]
+    return p
+
+
+def solve_presolved(solver, c, A, b, senses, bounds=None, integral=False):
+    """
+    Предобработка, решение уменьшенной задачи solver(c, A, b, senses, bounds=...) и возврат
+    в исходные переменные. tableau и history результата относятся к уменьшенной задаче,
+    basis сбрасывается. integral: все переменные целые (для solve_integer).
+    """
+    from .base import SimplexResult
+    p = presolve(c, A, b, senses, bounds, integral)
+    if p.status is not None:
+        return SimplexResult(p.status)
+    if p.rows:
+        res = solver(p.c, p.A, p.b, p.senses, bounds=p.bounds)
+    else:
+        # no constraints left: every remaining column is fixed or free
+        res = SimplexResult('optimal', [0] * len(p.cols), 0)
+    if res.bound is not None:
+        res.bound = float(res.bound + p.offset)
+    if res.status != 'optimal' and not res.x:
+        # a stopped solve may still carry its best point
+        return res
+    if p.free_columns:
+        return SimplexResult('unbounded', tableau=res.tableau, history=res.history)
+    res.x = p.postsolve(res.x)
+    res.objective = float(res.objective + p.offset)
+    res.alternative = res.alternative or bool(p.zero_columns)
+    res.basis = None
+    return res
@@ -0,0 +1,152 @@
+STALL_LIMIT = 10  # подряд идущих вырожденных шагов до перехода на правило Бланда
+
+
+class BlandPricing:
+    """Первая отрицательная приведённая стоимость (не зацикливается)."""
+    name = 'bland'
+
+    def select(self, be, T):
+        return be.entering(T)
+
+    def update(self, be, T, basis, row, col):
+        pass
+
+
+class DantzigPricing(BlandPricing):
+    """Наиболее отрицательная приведённая стоимость."""
+    name = 'dantzig'
+
+    def select(self, be, T):
+        candidates = be.negative_costs(T)
+        if not candidates:
+            return None
+        return min(candidates, key=lambda t: (t[1], t[0]))[0]
+
+
+class PartialPricing(BlandPricing):
+    """
+    Частичный просмотр: правило Данцига только в окне из size столбцов строки цели.
+    Окно остаётся на месте, пока в нём есть отрицательные приведённые стоимости, затем
+    сдвигается к следующим столбцам (по кругу); вся строка просматривается лишь на
+    последнем шаге, когда кандидатов нет.
+    """
+    name = 'partial'
+
+    def __init__(self, size=8):
+        self.size = size
+        self.start = 0
+
+    def select(self, be, T):
+        width = be.width(T)
+        start, scanned = (self.start if self.start < width else 0), 0
+        while scanned < width:
+            stop = min(start + self.size, width)
+            candidates = be.negative_costs(T, start, stop)
+            if candidates:
+                self.start = start
+                return min(candidates, key=lambda t: (t[1], t[0]))[0]
+            scanned += stop - start
+            start = 0 if stop == width else stop
+        return None
+
+
+class DevexPricing(BlandPricing):
+    """Devex: d_j^2 / w_j с приближёнными весами опорной системы (Harris)."""
+    name = 'devex'
+
+    def __init__(self):
+        self.weights = {}
+
+    def select(self, be, T):
+        candidates = be.negative_costs(T)
+        if not candidates:
+            return None
+        w = self.weights
+        return max(candidates, key=lambda t: (float(t[1]) ** 2 / w.get(t[0], 1.0), -t[0]))[0]
+
+    def update(self, be, T, basis, row, col):
+        alpha = dict(be.row_nonzeros(T, row))
+        aq = float(alpha[col])
+        wq = self.weights.get(col, 1.0)
+        basic = set(basis)
+        for j, a in alpha.items():
+            if j != col and j not in basic:
+                self.weights[j] = max(self.weights.get(j, 1.0), (float(a) / aq) ** 2 * wq)
+        self.weights[basis[row]] = max(wq / aq ** 2, 1.0)
+        self.weights.pop(col, None)
+
+
+class SteepestEdgePricing(BlandPricing):
+    """Наискорейшее ребро: d_j^2 / (1 + ||B^-1 a_j||^2), нормы берутся прямо из столбцов таблицы."""
+    name = 'steepest'
+
+    def select(self, be, T):
+        candidates = be.negative_costs(T)
+        if not candidates:
+            return None
+        norms = be.column_norms(T, [j for j, _ in candidates])
+        best = max(
+            zip(candidates, norms),
+            key=lambda t: (float(t[0][1]) ** 2 / (1.0 + t[1]), -t[0][0])
+        )
+        return best[0][0]
+
+
+PRICING = {
+    'bland': BlandPricing,
+    'dantzig': DantzigPricing,
+    'partial': PartialPricing,
+    'devex': DevexPricing,
+    'steepest': SteepestEdgePricing,
+}
+
+
+def get_pricing(pricing):
+    """Правило выбора входящей переменной по имени или сам объект правила."""
+    if not isinstance(pricing, str):
+        return pricing
+    if pricing not in PRICING:
+        raise ValueError(f"pricing must be one of {tuple(PRICING)}, got {pricing!r}")
+    return PRICING[pricing]()
+
+
+class DualDantzigPricing:
+    """Строка с наиболее отрицательной правой частью."""
+    name = 'dantzig'
+
+    def select(self, be, T):
+        return be.dual_leaving(T)
+
+
+class DualSteepestEdgePricing(DualDantzigPricing):
+    """
+    Двойственное наискорейшее ребро: r_i^2 / ||alpha_i||^2, где alpha_i — строка таблицы
+    (вместе с единицей базисного столбца). Нормы берутся прямо из строк таблицы.
+    """
+    name = 'steepest'
+
+    def select(self, be, T):
+        candidates = be.negative_rhs(T)
+        if not candidates:
+            return None
+        norms = be.row_norms(T, [i for i, _ in candidates])
+        best = max(
+            zip(candidates, norms),
+            key=lambda t: (float(t[0][1]) ** 2 / t[1], -t[0][0])
+        )
+        return best[0][0]
+
+
+DUAL_PRICING = {
+    'dantzig': DualDantzigPricing,
+    'steepest': DualSteepestEdgePricing,
+}
+
+
+def get_dual_pricing(pricing):
+    """Правило выбора уходящей строки двойственного симплекса по имени или сам объект правила."""
+    if not isinstance(pricing, str):
+        return pricing
+    if pricing not in DUAL_PRICING:
+        raise ValueError(f"dual_pricing must be one of {tuple(DUAL_PRICING)}, got {pricing!r}")
+    return DUAL_PRICING[pricing]()
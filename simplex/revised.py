@@ -0,0 +1,172 @@
+import numpy as np
+from scipy import sparse as sp
+from scipy.linalg import lu_factor, lu_solve
+
+from .base import SimplexResult, alternative_optimum
+from .sparse import is_sparse, csr_arrays
+
+
+def column(A, j):
+    a = A[:, j]
+    return a.toarray().ravel() if sp.issparse(a) else a
+
+
+class BasisFactor:
+    """LU-разложение базисной матрицы B плюс eta-файл (мультипликативная форма обновлений)."""
+
+    def __init__(self, A, basis, refactor_every=50):
+        self.A = A
+        self.refactor_every = refactor_every
+        self.refactor(basis)
+
+    def refactor(self, basis):
+        B = self.A[:, basis]
+        self.lu = lu_factor(B.toarray() if sp.issparse(B) else B)
+        self.etas = []
+
+    def ftran(self, a):
+        y = lu_solve(self.lu, a)
+        for r, d in self.etas:
+            yr = y[r] / d[r]
+            y -= d * yr
+            y[r] = yr
+        return y
+
+    def btran(self, cb):
+        w = np.array(cb, dtype=float)
+        for r, d in reversed(self.etas):
+            # w^T E^{-1}: only component r changes
+            w[r] = (w[r] - (w @ d - w[r] * d[r])) / d[r]
+        return lu_solve(self.lu, w, trans=1)
+
+    def update(self, basis, r, d):
+        self.etas.append((r, d.copy()))
+        if len(self.etas) >= self.refactor_every:
+            self.refactor(basis)
+
+
+def phase1_form(c, A, b, senses):
+    """
+    Приводит задачу к виду A x = b, b >= 0 с явными столбцами slack и искусственных переменных
+    и начальным базисом Phase I.
+    Разреженная A (scipy.sparse или тройка CSR) остаётся разреженной (CSC).
+    """
+    m, n = len(b), len(c)
+    b = np.asarray(b, dtype=float).copy()
+    senses = list(senses)
+    sign = np.where(b < 0, -1.0, 1.0)
+    b *= sign
+    for i in np.flatnonzero(sign < 0):
+        senses[i] = {'<=': '>=', '>=': '<=', '==': '=='}[senses[i]]
+
+    slack_rows = [i for i, s in enumerate(senses) if s in ('<=', '>=')]
+    art_rows = [i for i, s in enumerate(senses) if s in ('>=', '==')]
+    slack_vals = [1.0 if senses[i] == '<=' else -1.0 for i in slack_rows]
+    S = sp.csc_matrix((slack_vals, (slack_rows, range(len(slack_rows)))), shape=(m, len(slack_rows)))
+    R = sp.csc_matrix(([1.0] * len(art_rows), (art_rows, range(len(art_rows)))), shape=(m, len(art_rows)))
+
+    if is_sparse(A, m):
+        A = sp.csr_matrix(csr_arrays(A), shape=(m, n), dtype=float)
+        full = sp.hstack([sp.diags(sign) @ A, S, R], format='csc')
+    else:
+        A = np.asarray(A, dtype=float).reshape(m, n) * sign[:, None]
+        full = np.hstack([A, S.toarray(), R.toarray()])
+
+    basis = [0] * m
+    for k, i in enumerate(slack_rows):
+        if senses[i] == '<=':
+            basis[i] = n + k
+    for k, i in enumerate(art_rows):
+        basis[i] = n + len(slack_rows) + k
+    return full, b, basis, len(slack_rows), len(art_rows)
+
+
+def revised_optimize(F, cost, basis, xb, allowed, tol):
+    """Прямой пересмотренный симплекс (правило Бланда). Возвращает False при неограниченности."""
+    A = F.A
+    basic = np.zeros(A.shape[1], dtype=bool)
+    basic[basis] = True
+    while True:
+        y = F.btran(cost[basis])
+        d = cost - A.T @ y
+        candidates = np.flatnonzero((d > tol) & allowed & ~basic)
+        if not candidates.size:
+            return True
+        col = int(candidates[0])
+        a = F.ftran(column(A, col))
+        mask = a > tol
+        if not mask.any():
+            return False
+        ratios = np.full(a.shape, np.inf)
+        ratios[mask] = xb[mask] / a[mask]
+        best = ratios.min()
+        ties = np.flatnonzero(ratios <= best + tol)
+        row = int(min(ties, key=lambda i: basis[i]))
+        theta = ratios[row]
+        xb -= theta * a
+        xb[row] = theta
+        basic[basis[row]] = False
+        basic[col] = True
+        basis[row] = col
+        F.update(basis, row, a)
+
+
+def revised_simplex(c, A, b, senses=None, refactor_every=50, tol=1e-9):
+    """
+    Пересмотренный симплекс-метод (максимизация).
+
+    Хранит только LU-разложение базиса B; приведённые стоимости и ведущий столбец
+    вычисляются по требованию (BTRAN/FTRAN), разложение обновляется eta-матрицами
+    и пересчитывается каждые refactor_every итераций.
+    """
+    m, n = len(b), len(c)
+    if senses is None:
+        senses = ['<='] * m
+    full, rhs, basis, slack_count, art_count = phase1_form(c, A, b, senses)
+    total = full.shape[1]
+    art_start = n + slack_count
+
+    F = BasisFactor(full, basis, refactor_every)
+    xb = F.ftran(rhs)
+
+    # Phase I: maximize -sum(artificials)
+    if art_count:
+        cost = np.zeros(total)
+        cost[art_start:] = -1.0
+        allowed = np.ones(total, dtype=bool)
+        revised_optimize(F, cost, basis, xb, allowed, tol)
+        if cost[basis] @ xb < -tol * max(1.0, np.abs(rhs).sum()):
+            return SimplexResult("infeasible")
+        # drive zero-level artificials out of the basis
+        for row, var in enumerate(basis):
+            if var < art_start:
+                continue
+            e = np.zeros(m)
+            e[row] = 1.0
+            alpha = full[:, :art_start].T @ F.btran(e)
+            for col in np.flatnonzero(np.abs(alpha) > tol):
+                if col not in basis:
+                    basis[row] = int(col)
+                    F.refactor(basis)
+                    xb = F.ftran(rhs)
+                    break
+
+    # Phase II
+    cost = np.zeros(total)
+    cost[:n] = np.asarray(c, dtype=float)
+    allowed = np.arange(total) < art_start
+    if not revised_optimize(F, cost, basis, xb, allowed, tol):
+        return SimplexResult("unbounded")
+
+    F.refactor(basis)
+    xb = F.ftran(rhs)
+    x = [0] * n
+    for i, var in enumerate(basis):
+        if var < n:
+            x[var] = float(xb[i])
+    obj = float(cost[basis] @ xb)
+
+    y = F.btran(cost[basis])
+    d = cost - full.T @ y
+    alternative = alternative_optimum(c, m, basis, d, lambda v: abs(v) <= tol)
+    return SimplexResult("optimal", x, obj, alternative)
@@ -0,0 +1,153 @@
+from fractions import Fraction as F
+
+import numpy as np
+
+from .bounds import Bounds, as_bound
+from .sparse import is_sparse, csr_arrays, csr_rows, to_dense
+
+MIN_RANGE = 1e3       # модели с max|a| / min|a| меньше решаются как есть
+GEOMETRIC_PASSES = 6  # проходов геометрического среднего, пока разброс падает больше чем на 10%
+
+
+class Scaling:
+    """
+    Масштабирование A' = R A S степенями двойки (в float без ошибок округления): строки —
+    row[i], столбцы — col[j]. Переменные x = S x', поэтому c' = S c, b' = R b, границы x'
+    делятся на col[j]; значение цели и номера базисных столбцов не меняются. Для точных
+    бэкендов (exact=True) множители применяются как Fraction и задача остаётся точной.
+    """
+
+    def __init__(self, row, col):
+        self.row = row
+        self.col = col
+
+    def problem(self, c, A, b, bounds=None, exact=False):
+        """Масштабированная задача (c', A', b', bounds'); A' — в формате A (CSR-тройка или плотная)."""
+        m, n = len(b), len(c)
+        if exact:
+            return self._exact_problem(c, A, b, bounds)
+        rows, cols, vals = _entries(A, m, n)
+        vals = vals * self.row[rows] * self.col[cols]
+        if is_sparse(A, m):
+            order = np.lexsort((cols, rows))
+            indptr = np.searchsorted(rows[order], np.arange(m + 1)).tolist()
+            new_A = (vals[order].tolist(), cols[order].tolist(), indptr)
+        else:
+            dense = np.zeros((m, n))
+            dense[rows, cols] = vals
+            new_A = dense.tolist()
+        new_c = (np.asarray([float(v) for v in c]) * self.col).tolist()
+        new_b = (np.asarray([float(v) for v in b]) * self.row).tolist()
+        return new_c, new_A, new_b, self._bounds(bounds)
+
+    def _exact_problem(self, c, A, b, bounds):
+        # powers of two convert to Fraction exactly
+        r = [F(v) for v in self.row.tolist()]
+        s = [F(v) for v in self.col.tolist()]
+        m, n = len(b), len(c)
+        rows = [{j: F(a) * r[i] * s[j] for j, a in row.items()} for i, row in enumerate(csr_rows(A, m))]
+        if is_sparse(A, m):
+            data, indices, indptr = [], [], [0]
+            for row in rows:
+                for j in sorted(row):
+                    data.append(row[j])
+                    indices.append(j)
+                indptr.append(len(data))
+            new_A = (data, indices, indptr)
+        else:
+            new_A = [[row.get(j, F(0)) for j in range(n)] for row in rows]
+        new_c = [F(v) * sj for v, sj in zip(c, s)]
+        new_b = [F(v) * ri for v, ri in zip(b, r)]
+        return new_c, new_A, new_b, self._bounds(bounds)
+
+    def _bounds(self, bounds):
+        if bounds is None:
+            return None
+        return [
+            (lo if lo is None or lo == -float('inf') else F(lo) / F(s),
+             None if as_bound(up) is None else F(up) / F(s))
+            for (lo, up), s in zip(bounds, self.col.tolist())
+        ]
+
+    def unscale(self, res):
+        """Возвращает x и границы столбцов результата в исходные единицы: x = S x'."""
+        col = [F(s) for s in self.col.tolist()]
+        if res.x:
+            res.x = [float(v * s) for v, s in zip(res.x, col)]
+        if res.bounds is not None:
+            bounds = Bounds(
+                [lo * s for lo, s in zip(res.bounds.lower, col)],
+                [None if up is None else up * s for up, s in zip(res.bounds.upper, col)],
+            )
+            bounds.flipped = list(res.bounds.flipped)
+            bounds.offset = res.bounds.offset
+            res.bounds = bounds
+        return res
+
+
+def scale_factors(A, m, n):
+    """
+    Множители масштабирования A: несколько проходов геометрического среднего
+    (r_i = 1 / sqrt(max_j |a_ij| * min_j |a_ij|), затем то же по столбцам), после них
+    выравнивание — наибольший элемент каждой строки, затем каждого столбца равен 1.
+    Множители округляются до степеней двойки. None — матрица и так хорошо масштабирована.
+    """
+    rows, cols, vals = _entries(A, m, n)
+    vals = np.abs(vals)
+    if not vals.size or vals.max() / vals.min() < MIN_RANGE:
+        return None
+    r, s = np.ones(m), np.ones(n)
+    spread = vals.max() / vals.min()
+    for _ in range(GEOMETRIC_PASSES):
+        v = vals * s[cols]
+        r = 1 / np.sqrt(_extreme(np.maximum, rows, v, m) * _extreme(np.minimum, rows, v, m))
+        v = vals * r[rows]
+        s = 1 / np.sqrt(_extreme(np.maximum, cols, v, n) * _extreme(np.minimum, cols, v, n))
+        v = vals * r[rows] * s[cols]
+        previous, spread = spread, v.max() / v.min()
+        if spread > 0.9 * previous:
+            break
+    r /= _extreme(np.maximum, rows, vals * r[rows] * s[cols], m)
+    s /= _extreme(np.maximum, cols, vals * r[rows] * s[cols], n)
+    return Scaling(_power_of_two(r), _power_of_two(s))
+
+
+def solve_scaled(solver, c, A, b, senses, bounds=None, exact=False):
+    """
+    Масштабирование, решение solver(c', A', b', senses, bounds=...) и возврат x и границ
+    в исходные единицы. Базис результата годится для исходной задачи (в том числе для
+    анализа чувствительности); tableau и history относятся к масштабированной задаче.
+    exact — масштабированная задача в Fraction (для точных бэкендов).
+    """
+    scaling = scale_factors(A, len(b), len(c))
+    if scaling is None:
+        return solver(c, A, b, senses, bounds=bounds)
+    sc, sA, sb, sbounds = scaling.problem(c, A, b, bounds, exact)
+    return scaling.unscale(solver(sc, sA, sb, senses, bounds=sbounds))
+
+
+def _entries(A, m, n):
+    """Ненулевые элементы A в массивах numpy: (строки, столбцы, значения)."""
+    if is_sparse(A, m):
+        data, indices, indptr = csr_arrays(A)
+        rows = np.repeat(np.arange(m), np.diff(np.asarray(indptr)))
+        cols = np.asarray(indices, dtype=int)
+        vals = np.asarray([float(v) for v in data])
+    else:
+        dense = np.asarray(to_dense(A, m, n), dtype=float).reshape(m, n)
+        rows, cols = np.nonzero(dense)
+        vals = dense[rows, cols]
+    keep = vals != 0
+    return rows[keep], cols[keep], vals[keep]
+
+
+def _extreme(ufunc, index, values, size):
+    """Максимум или минимум values по группам index; у пустых групп — 1."""
+    out = np.full(size, -np.inf if ufunc is np.maximum else np.inf)
+    ufunc.at(out, index, values)
+    out[~np.isfinite(out)] = 1.0
+    return out
+
+
+def _power_of_two(f):
+    return np.exp2(np.round(np.log2(f)))
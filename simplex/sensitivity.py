@@ -0,0 +1,185 @@
+from fractions import Fraction as F
+
+import numpy as np
+
+from .sparse import csr_rows
+
+FLOAT_TOL = 1e-9  # |v| <= FLOAT_TOL считается нулём в анализе float-результата
+
+
+class Sensitivity:
+    """
+    Анализ чувствительности оптимального базиса (задача на максимум):
+    duals — теневые цены y_i = d(objective)/d(b_i);
+    reduced_costs — c_j - y·A_j (для небазисной переменной на нижней границе <= 0, на верхней >= 0);
+    rhs_ranges — интервалы b_i, в которых базис остаётся оптимальным (цена y_i постоянна);
+    cost_ranges — интервалы c_j, в которых текущее решение x остаётся оптимальным.
+    Границы интервалов: None — бесконечность.
+    """
+
+    def __init__(self, duals, reduced_costs, rhs_ranges, cost_ranges):
+        self.duals = duals
+        self.reduced_costs = reduced_costs
+        self.rhs_ranges = rhs_ranges
+        self.cost_ranges = cost_ranges
+
+
+def _inverse(B):
+    """Обратная матрица Гаусса — Жордана в точной арифметике (B — список строк)."""
+    m = len(B)
+    M = [list(row) + [F(int(i == k)) for k in range(m)] for i, row in enumerate(B)]
+    for col in range(m):
+        r = next(r for r in range(col, m) if M[r][col] != 0)
+        M[col], M[r] = M[r], M[col]
+        p = M[col][col]
+        M[col] = [v / p for v in M[col]]
+        for i in range(m):
+            f = M[i][col]
+            if i != col and f != 0:
+                M[i] = [a - f * b for a, b in zip(M[i], M[col])]
+    return [row[m:] for row in M]
+
+
+def columns(A, senses, n):
+    """
+    Столбцы таблицы Phase II в исходных строках: column(j) -> {строка: коэффициент}.
+    j < n — столбец A, затем slack-столбцы (+1 для '<=', -1 для '>='), индексы >= ncols —
+    искусственные столбцы, оставшиеся в базисе. Возвращает (column, ncols).
+    """
+    m = len(senses)
+    rows = csr_rows(A, m)
+    slack_row, slack_sign = [], []
+    for i, s in enumerate(senses):
+        if s in ('<=', '>='):
+            slack_row.append(i)
+            slack_sign.append(F(1) if s == '<=' else F(-1))
+    ncols = n + len(slack_row)
+
+    def column(j):
+        if j < n:
+            return {i: row[j] for i, row in enumerate(rows) if j in row}
+        if j < ncols:
+            return {slack_row[j - n]: slack_sign[j - n]}
+        return {j - ncols: F(1)}
+
+    return column, ncols
+
+
+def basis_inverse(column, basis):
+    """B^-1 для базисной матрицы из столбцов column(basis[k])."""
+    m = len(basis)
+    B = [[F(0)] * m for _ in range(m)]
+    for k, var in enumerate(basis):
+        for i, v in column(var).items():
+            B[i][k] = v
+    return _inverse(B)
+
+
+def _matrix(column, cols, m, num):
+    """Матрица numpy (m, len(cols)) из столбцов column(j); num — F (dtype object) или float."""
+    M = np.zeros((m, len(cols)), dtype=object if num is F else float)
+    if num is F:
+        M[:] = F(0)
+    for k, j in enumerate(cols):
+        for i, v in column(j).items():
+            M[i, k] = num(v)
+    return M
+
+
+def _interval(values, direction, lower, upper, tol=0):
+    """
+    Наибольший интервал [lo, hi] для t, при котором lower_k <= values_k + t * direction_k <= upper_k
+    (None в upper — без границы). None в ответе — бесконечность. |direction_k| <= tol — ноль.
+    """
+    lo = hi = None
+    for v, d, l, u in zip(values, direction, lower, upper):
+        if abs(d) <= tol:
+            continue
+        limits = [(l - v) / d, None if u is None else (u - v) / d]
+        if d < 0:
+            limits.reverse()
+        if limits[0] is not None and (lo is None or limits[0] > lo):
+            lo = limits[0]
+        if limits[1] is not None and (hi is None or limits[1] < hi):
+            hi = limits[1]
+    return lo, hi
+
+
+def _shifted(base, interval):
+    lo, hi = interval
+    return (None if lo is None else float(base + lo), None if hi is None else float(base + hi))
+
+
+def sensitivity(res):
+    """
+    Двойственные цены, приведённые стоимости и интервалы устойчивости по итоговому базису
+    res.basis. Базисная матрица B собирается из исходных столбцов и обращается один раз:
+    для точных бэкендов — в Fraction, для float-результата — numpy. Нужны status 'optimal',
+    basis и problem результата.
+    """
+    if res.status != 'optimal' or res.basis is None or res.problem is None:
+        raise ValueError("sensitivity needs an optimal result with a basis (not available after presolve)")
+    c, A, b, senses = res.problem
+    m, n = len(b), len(c)
+    # the float backend keeps a numpy tableau: its analysis stays in float as well
+    num, tol = (float, FLOAT_TOL) if isinstance(res.tableau, np.ndarray) else (F, 0)
+    c = [num(v) for v in c]
+    b = [num(v) for v in b]
+    column, ncols = columns(A, senses, n)
+
+    if res.bounds is not None:
+        lower = [num(v) for v in res.bounds.lower]
+        upper = [None if v is None else num(v) for v in res.bounds.upper]
+        flipped = res.bounds.flipped
+    else:
+        lower, upper, flipped = [num(0)] * n, [None] * n, [False] * n
+
+    def cost(j):
+        return c[j] if j < n else num(0)
+
+    basis = res.basis
+    B = _matrix(column, basis, m, num)
+    Binv = np.array(_inverse(B.tolist()), dtype=object).reshape(m, m) if num is F else np.linalg.inv(B)
+
+    duals = np.array([cost(var) for var in basis], dtype=B.dtype) @ Binv
+    in_basis = set(basis)
+    nonbasic = [j for j in range(ncols) if j not in in_basis]
+    N = _matrix(column, nonbasic, m, num)
+    reduced = dict(zip(nonbasic, (np.array([cost(j) for j in nonbasic], dtype=B.dtype) - duals @ N).tolist()))
+
+    # basic values: B x_B = b - (nonbasic structural columns at their bounds)
+    at_bound = np.array([(upper[j] if flipped[j] else lower[j]) if j < n else num(0) for j in nonbasic],
+                        dtype=B.dtype)
+    values = (Binv @ (np.array(b, dtype=B.dtype) - N @ at_bound)).tolist()
+    low = [lower[var] if var < n else num(0) for var in basis]
+    high = [upper[var] if var < n else (None if var < ncols else num(0)) for var in basis]
+
+    rhs_ranges = [_shifted(b[i], _interval(values, Binv[:, i].tolist(), low, high, tol)) for i in range(m)]
+
+    cost_ranges = []
+    row_of = {var: k for k, var in enumerate(basis)}
+    # alpha[k][l]: entry of B^-1 A_l in the row of basis[k]
+    alpha = (Binv @ N).tolist()
+    for j in range(n):
+        if j not in row_of:
+            r = reduced[j]
+            cost_ranges.append((float(c[j] - r), None) if flipped[j] else (None, float(c[j] - r)))
+            continue
+        # c_j + t changes the reduced cost of a nonbasic column l by -t * (B^-1 A_l)_k
+        lo = hi = None
+        for l, a in zip(nonbasic, alpha[row_of[j]]):
+            if l < n and upper[l] is not None and upper[l] == lower[l]:
+                continue  # fixed variable: its reduced cost may have any sign
+            if abs(a) <= tol:
+                continue
+            t = reduced[l] / a
+            at_upper = l < n and flipped[l]
+            # at the lower bound r_l - t * alpha must stay <= 0, at the upper bound >= 0
+            if (a > 0) != at_upper:
+                lo = t if lo is None or t > lo else lo
+            else:
+                hi = t if hi is None or t < hi else hi
+        cost_ranges.append(_shifted(c[j], (lo, hi)))
+
+    reduced_costs = [float(reduced.get(j, 0)) for j in range(n)]
+    return Sensitivity([float(y) for y in duals], reduced_costs, rhs_ranges, cost_ranges)
@@ -0,0 +1,339 @@
+from fractions import Fraction as F
+
+RHS = -1  # ключ правой части в разреженной строке
+
+
+class SparseRow(dict):
+    """Строка таблицы {столбец: значение}; отсутствующие элементы равны нулю."""
+
+    def __missing__(self, key):
+        return F(0)
+
+
+def is_sparse(A, m=None):
+    """
+    scipy.sparse или тройка CSR (data, indices, indptr). Кортеж из трёх строк плотной
+    матрицы тройкой не считается: indptr — целые числа от 0 до len(data) по неубыванию,
+    а при известном числе строк m — длины m + 1.
+    """
+    if hasattr(A, 'tocsr'):
+        return True
+    if not (isinstance(A, tuple) and len(A) == 3):
+        return False
+    data, indices, indptr = A
+    ptr, cols = _integers(indptr), _integers(indices)
+    return (
+        ptr is not None and cols is not None and len(ptr) > 0
+        and ptr[0] == 0 and ptr[-1] == len(data) == len(cols)
+        and all(a <= b for a, b in zip(ptr, ptr[1:])) and all(j >= 0 for j in cols)
+        and (m is None or len(ptr) == m + 1)
+    )
+
+
+def _integers(values):
+    """Список целых чисел или None, если values — не последовательность целых."""
+    try:
+        ints = [int(v) for v in values]
+    except (TypeError, ValueError):
+        return None
+    return ints if all(i == v for i, v in zip(ints, values)) else None
+
+
+def _num(v):
+    v = v.item() if hasattr(v, 'item') else v
+    return F(v)
+
+
+def csr_arrays(A):
+    if hasattr(A, 'tocsr'):
+        A = A.tocsr()
+        return A.data, A.indices, A.indptr
+    return A
+
+
+def csr_rows(A, m):
+    """Строки матрицы A (списки, scipy.sparse или тройка CSR) как словари без нулей."""
+    if not is_sparse(A, m):
+        return [{j: F(v) for j, v in enumerate(row) if v != 0} for row in A]
+    data, indices, indptr = csr_arrays(A)
+    rows = []
+    for i in range(m):
+        row = {}
+        for k in range(indptr[i], indptr[i + 1]):
+            if data[k] != 0:
+                row[int(indices[k])] = _num(data[k])
+        rows.append(row)
+    return rows
+
+
+def to_dense(A, m, n):
+    """Плотная копия A в виде списка списков."""
+    if not is_sparse(A, m):
+        return A
+    dense = [[0] * n for _ in range(m)]
+    for i, row in enumerate(csr_rows(A, m)):
+        for j, v in row.items():
+            dense[i][j] = v
+    return dense
+
+
+def append_row(A, row, m):
+    """Новая матрица: A (m строк) с добавленной снизу строкой row (исходная не изменяется)."""
+    if hasattr(A, 'tocsr'):
+        from scipy.sparse import csr_matrix, vstack
+        return vstack([A.tocsr(), csr_matrix([row])], format='csr')
+    if is_sparse(A, m):
+        data, indices, indptr = A
+        nz = [(j, v) for j, v in enumerate(row) if v != 0]
+        return (
+            list(data) + [v for _, v in nz],
+            list(indices) + [j for j, _ in nz],
+            list(indptr) + [indptr[-1] + len(nz)],
+        )
+    return [list(r) for r in A] + [list(row)]
+
+
+def csr_lists(A):
+    """Тройка CSR из списков Python (копия): для scipy.sparse и тройки с массивами numpy."""
+    return tuple(v.tolist() if hasattr(v, 'tolist') else list(v) for v in csr_arrays(A))
+
+
+def delete_row(A, i, m):
+    """Новая матрица: A (m строк) без строки i (тройка CSR или список строк)."""
+    if is_sparse(A, m):
+        data, indices, indptr = csr_lists(A)
+        lo, hi = indptr[i], indptr[i + 1]
+        return (data[:lo] + data[hi:], indices[:lo] + indices[hi:],
+                indptr[:i] + [p - (hi - lo) for p in indptr[i + 1:]])
+    return [list(r) for k, r in enumerate(A) if k != i]
+
+
+def append_column(A, column, n):
+    """Новая матрица: A (n столбцов) со столбцом column справа (тройка CSR или список строк)."""
+    if is_sparse(A, len(column)):
+        data, indices, indptr = csr_lists(A)
+        new = ([], [], [0])
+        for i, v in enumerate(column):
+            lo, hi = indptr[i], indptr[i + 1]
+            new[0].extend(data[lo:hi])
+            new[1].extend(indices[lo:hi])
+            if v != 0:
+                new[0].append(v)
+                new[1].append(n)
+            new[2].append(len(new[0]))
+        return new
+    return [list(r) + [v] for r, v in zip(A, column)]
+
+
+def build_sparse_tableau(c, A, b, senses, phase):
+    m, n = len(b), len(c)
+    slack_count = sum(1 for s in senses if s in ('<=', '>='))
+    art_count = sum(1 for s in senses if s in ('>=', '=='))
+
+    tableau = []
+    slack_pos = art_pos = 0
+    for i, data in enumerate(csr_rows(A, m)):
+        row = SparseRow(data)
+        if senses[i] == '<=':
+            row[n + slack_pos] = F(1)
+        elif senses[i] == '>=':
+            row[n + slack_pos] = F(-1)
+            if phase == 1:
+                row[n + slack_count + art_pos] = F(1)
+        elif senses[i] == '==' and phase == 1:
+            row[n + slack_count + art_pos] = F(1)
+        slack_pos += senses[i] in ('<=', '>=')
+        art_pos += senses[i] in ('>=', '==')
+        if b[i] != 0:
+            row[RHS] = _num(b[i])
+        tableau.append(row)
+
+    cost = SparseRow()
+    if phase == 1:
+        # sum of rows with an artificial ('<=' rows start from their slack);
+        # artificial columns keep zero cost so they never re-enter
+        for row, s in zip(tableau, senses):
+            if s == '<=':
+                continue
+            for j, v in row.items():
+                if j < n + slack_count:
+                    cost[j] = cost[j] - v
+        cost = SparseRow((j, v) for j, v in cost.items() if v != 0)
+    else:
+        for j, cj in enumerate(c):
+            if cj != 0:
+                cost[j] = -_num(cj)
+    tableau.append(cost)
+    return tableau, slack_count, art_count
+
+
+def _axpy(target, factor, source):
+    # target -= factor * source, dropping cancelled entries
+    for j, v in source.items():
+        w = target[j] - factor * v
+        if w:
+            target[j] = w
+        else:
+            target.pop(j, None)
+
+
+class SparseBackend:
+    """Точная арифметика на разреженной таблице: строки — словари, нули не хранятся."""
+    name = 'sparse'
+    eps = 0
+
+    def build(self, c, A, b, senses, phase):
+        return build_sparse_tableau(c, A, b, senses, phase)
+
+    def pivot(self, T, basis, row, col):
+        piv = T[row][col]
+        prow = SparseRow((j, v / piv) for j, v in T[row].items())
+        T[row] = prow
+        for r, other in enumerate(T):
+            if r != row and col in other:
+                _axpy(other, other[col], prow)
+        basis[row] = col
+
+    def entering(self, T):
+        return min((j for j, v in T[-1].items() if j != RHS and v < 0), default=None)
+
+    def negative_costs(self, T, start=0, stop=None):
+        return sorted(
+            (j, v) for j, v in T[-1].items()
+            if j != RHS and v < 0 and j >= start and (stop is None or j < stop)
+        )
+
+    def width(self, T):
+        # columns past the last stored cost entry have zero reduced cost
+        return max((j + 1 for j in T[-1] if j != RHS), default=0)
+
+    def column_norms(self, T, cols):
+        return [sum(float(row[j]) ** 2 for row in T[:-1] if j in row) for j in cols]
+
+    def row_nonzeros(self, T, row):
+        return [(j, v) for j, v in T[row].items() if j != RHS]
+
+    def leaving(self, T, basis, col):
+        min_ratio = None
+        pivot_row = None
+        for i, row in enumerate(T[:-1]):
+            if row[col] > 0:
+                ratio = row[RHS] / row[col]
+                if ratio >= 0 and (
+                    min_ratio is None
+                    or ratio < min_ratio
+                    or (ratio == min_ratio and basis[i] > basis[pivot_row])
+                ):
+                    min_ratio = ratio
+                    pivot_row = i
+        return pivot_row
+
+    def dual_leaving(self, T):
+        return min(
+            (i for i in range(len(T) - 1) if T[i][RHS] < 0),
+            default=None,
+            key=lambda i: T[i][RHS]
+        )
+
+    def negative_rhs(self, T):
+        return [(i, row[RHS]) for i, row in enumerate(T[:-1]) if row[RHS] < 0]
+
+    def row_norms(self, T, rows):
+        return [sum(float(v) ** 2 for j, v in T[i].items() if j != RHS) for i in rows]
+
+    def dual_ratios(self, T, row, ncols):
+        return [(j, T[-1][j], -v) for j, v in T[row].items() if j != RHS and j < ncols and v < 0]
+
+    def dual_entering(self, T, row, ncols):
+        candidates = [
+            (j, T[-1][j] / -v)
+            for j, v in T[row].items() if j != RHS and j < ncols and v < 0
+        ]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda t: (t[1], t[0]))[0]
+
+    def objective(self, T):
+        return T[-1][RHS]
+
+    def is_zero(self, v):
+        return v == 0
+
+    def drop_columns(self, T, start, stop):
+        width = stop - start
+        for i, row in enumerate(T):
+            T[i] = SparseRow(
+                (j if j < start or j == RHS else j - width, v)
+                for j, v in row.items() if not (start <= j < stop)
+            )
+        return T
+
+    def set_cost(self, T, c, slack_count, basis):
+        n = len(c)
+        cost = SparseRow((j, -_num(cj)) for j, cj in enumerate(c) if cj != 0)
+        for i, var in enumerate(basis):
+            if var < n + slack_count and var in cost:
+                _axpy(cost, cost[var], T[i])
+        T[-1] = cost
+        return T
+
+    def add_row(self, T, basis, coeffs, rhs, ncols):
+        new = SparseRow((j, _num(v)) for j, v in enumerate(coeffs) if v != 0)
+        new[ncols] = F(1)
+        if rhs != 0:
+            new[RHS] = _num(rhs)
+        for i, var in enumerate(basis):
+            if var < ncols and var in new:
+                _axpy(new, new[var], T[i])
+        T.insert(len(T) - 1, new)
+        basis.append(ncols)
+        return T
+
+    def add_column(self, T, col, values, coeffs):
+        for i, v in enumerate(values):
+            row = SparseRow((j + 1 if j >= col else j, w) for j, w in T[i].items())
+            if v != 0:
+                row[col] = _num(v)
+            T[i] = row
+        return T
+
+    def remove_row(self, T, row):
+        del T[row]
+        return T
+
+    def shift(self, T, col, delta):
+        delta = _num(delta)
+        for row in T:
+            if col in row:
+                w = row[RHS] - row[col] * delta
+                if w:
+                    row[RHS] = w
+                else:
+                    row.pop(RHS, None)
+
+    def add_rhs(self, T, delta):
+        for row, d in zip(T, delta):
+            w = row[RHS] + _num(d)
+            if w:
+                row[RHS] = w
+            else:
+                row.pop(RHS, None)
+
+    def complement(self, T, basis, col, bound):
+        self.shift(T, col, bound)
+        for row in T:
+            if col in row:
+                row[col] = -row[col]
+        if col in basis:
+            r = basis.index(col)
+            T[r] = SparseRow((j, -v) for j, v in T[r].items())
+
+    def extract(self, T, basis, n):
+        x = [0] * n
+        for i, var in enumerate(basis):
+            if var < n:
+                x[var] = float(T[i][RHS])
+        return x
+
+    def snapshot(self, T):
+        return [SparseRow(row) for row in T]
@@ -0,0 +1,154 @@
+import time
+from collections import namedtuple
+
+from .history import PhaseChange, Flip
+
+# событие для callback: kind — 'pivot', 'flip', 'phase' или 'node'; phase — текущая фаза;
+# detail — Pivot, Flip, PhaseChange или BnBProgress; stats — текущая SolveStats
+SolveEvent = namedtuple('SolveEvent', 'kind phase detail stats')
+
+
+class SolveAborted(Exception):
+    """
+    Решение прервано: status — 'aborted' (callback вернул истинное значение), 'time_limit',
+    'iteration_limit' или 'node_limit'. tableau — таблица в момент остановки.
+    """
+
+    def __init__(self, tableau=None, status='aborted'):
+        super().__init__(f'solve stopped: {status}')
+        self.tableau = tableau
+        self.status = status
+
+
+class SolveStats:
+    """
+    Статистика одного решения. pivots и phase_time — по фазам: 'phase1', 'phase2', 'dual'
+    (двойственная фаза) и 'warm' (установка базиса warm_start). Пивот вырожденный, если
+    он не изменил значение цели. nodes, pruned и infeasible_nodes заполняет метод ветвей
+    и границ: обработанные узлы, отсечённые по рекорду и несовместные потомки; cuts — число
+    добавленных отсечений. barrier_iterations — итерации метода внутренней точки
+    (его время — phase_time['barrier']).
+    """
+
+    def __init__(self):
+        self.pivots = {}
+        self.degenerate_pivots = 0
+        self.flips = 0
+        self.phase_time = {}
+        self.time = 0.0
+        self.nodes = 0
+        self.pruned = 0
+        self.infeasible_nodes = 0
+        self.cuts = 0
+        self.barrier_iterations = 0
+
+    @property
+    def total_pivots(self):
+        return sum(self.pivots.values())
+
+    def as_dict(self):
+        return {
+            'pivots': dict(self.pivots), 'total_pivots': self.total_pivots,
+            'degenerate_pivots': self.degenerate_pivots, 'flips': self.flips,
+            'phase_time': dict(self.phase_time), 'time': self.time,
+            'nodes': self.nodes, 'pruned': self.pruned, 'infeasible_nodes': self.infeasible_nodes,
+            'cuts': self.cuts, 'barrier_iterations': self.barrier_iterations,
+        }
+
+    def __repr__(self):
+        return f"SolveStats({self.as_dict()!r})"
+
+
+class Monitor:
+    """
+    Собирает SolveStats по событиям журнала (history.record) и вызывает callback(SolveEvent)
+    на каждом пивоте, переходе к границе, смене фазы и узле дерева ветвлений.
+    Лимиты time_limit (секунды), iteration_limit (пивоты и переходы к границе) и node_limit
+    проверяются перед каждым шагом (check) и узлом (check_nodes).
+    state — (basis, n, bounds) текущей таблицы для результата при остановке.
+    """
+
+    def __init__(self, be=None, callback=None, stats=None, time_limit=None, iteration_limit=None,
+                 node_limit=None):
+        self.be = be
+        self.callback = callback
+        self.stats = stats if stats is not None else SolveStats()
+        self.time_limit = time_limit
+        self.iteration_limit = iteration_limit
+        self.node_limit = node_limit
+        self.current = None
+        self.started = self.phase_started = time.perf_counter()
+        self.last_objective = None
+        self.state = None
+
+    def time_left(self):
+        if self.time_limit is None:
+            return None
+        return self.time_limit - (time.perf_counter() - self.started)
+
+    def check(self, T):
+        """Вызывается перед очередным пивотом или переходом к границе."""
+        if self.iteration_limit is not None and self.stats.total_pivots + self.stats.flips >= self.iteration_limit:
+            raise SolveAborted(T, 'iteration_limit')
+        if self.time_limit is not None and self.time_left() <= 0:
+            raise SolveAborted(T, 'time_limit')
+
+    def check_nodes(self):
+        """Вызывается перед обработкой очередного узла."""
+        if self.node_limit is not None and self.stats.nodes >= self.node_limit:
+            raise SolveAborted(status='node_limit')
+        if self.time_limit is not None and self.time_left() <= 0:
+            raise SolveAborted(status='time_limit')
+
+    def phase(self, name):
+        now = time.perf_counter()
+        if self.current is not None:
+            times = self.stats.phase_time
+            times[self.current] = times.get(self.current, 0.0) + now - self.phase_started
+        self.current, self.phase_started = name, now
+
+    def start(self, T):
+        self.last_objective = self.be.objective(T)
+
+    def record(self, T, event):
+        if isinstance(event, PhaseChange):
+            self.phase('phase2')
+            kind = 'phase'
+        elif isinstance(event, Flip):
+            self.stats.flips += 1
+            kind = 'flip'
+        else:
+            pivots = self.stats.pivots
+            pivots[self.current] = pivots.get(self.current, 0) + 1
+            kind = 'pivot'
+        objective = self.be.objective(T)
+        if kind == 'pivot' and self.last_objective is not None and self.be.is_zero(objective - self.last_objective):
+            self.stats.degenerate_pivots += 1
+        self.last_objective = objective
+        self.emit(kind, event, T)
+
+    def merge(self, stats):
+        """Добавляет статистику вложенного решения (например, корневой релаксации)."""
+        for phase, count in stats.pivots.items():
+            self.stats.pivots[phase] = self.stats.pivots.get(phase, 0) + count
+        for phase, spent in stats.phase_time.items():
+            self.stats.phase_time[phase] = self.stats.phase_time.get(phase, 0.0) + spent
+        self.stats.degenerate_pivots += stats.degenerate_pivots
+        self.stats.flips += stats.flips
+        self.stats.cuts += stats.cuts
+        self.stats.barrier_iterations += stats.barrier_iterations
+
+    def node(self, progress, pruned=False, infeasible=0):
+        self.stats.nodes += 1
+        self.stats.pruned += pruned
+        self.stats.infeasible_nodes += infeasible
+        self.emit('node', progress)
+
+    def emit(self, kind, detail, T=None):
+        if self.callback is not None and self.callback(SolveEvent(kind, self.current, detail, self.stats)):
+            raise SolveAborted(T)
+
+    def finish(self):
+        self.phase(None)
+        self.stats.time = time.perf_counter() - self.started
+        return self.stats
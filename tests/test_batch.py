@@ -0,0 +1,101 @@
+"""
+Pytest tests for batch LP solving.
+"""
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from simplex import simplex, solve_batch
+from simplex.batch import solve_stacked
+
+
+def random_problems(seed, count, m=6, n=5):
+    rng = np.random.default_rng(seed)
+    problems = []
+    for _ in range(count):
+        A = rng.uniform(-2, 10, size=(m, n))
+        b = rng.uniform(-1, 20, size=m)
+        c = rng.uniform(-1, 5, size=n)
+        problems.append((c.tolist(), A.tolist(), b.tolist()))
+    return problems
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_stacked_matches_single(seed):
+    problems = random_problems(seed, 40)
+    stacked = solve_stacked(problems)
+    for (c, A, b), res in zip(problems, stacked):
+        ref = simplex(c, A, b, backend='float')
+        assert res.status == ref.status
+        if ref.status == 'optimal':
+            assert pytest.approx(res.objective, abs=1e-9) == ref.objective
+            assert res.x == pytest.approx(ref.x, abs=1e-9)
+            assert res.alternative == ref.alternative
+            assert res.basis == ref.basis
+
+
+def test_stacked_with_senses_against_scipy():
+    rng = np.random.default_rng(7)
+    senses = ['<=', '>=', '==']
+    problems = []
+    for _ in range(20):
+        A = rng.uniform(1, 5, size=(3, 4))
+        x0 = rng.uniform(0, 2, size=4)
+        b = A @ x0
+        b[0] += 1.0
+        b[1] -= 1.0
+        c = rng.uniform(-1, 1, size=4)
+        problems.append((c, A, b, senses))
+    for (c, A, b, _), res in zip(problems, solve_batch(problems)):
+        lp = linprog(-c, A_ub=np.vstack([A[:1], -A[1:2]]), b_ub=[b[0], -b[1]],
+                     A_eq=A[2:], b_eq=b[2:], bounds=(0, None), method='highs')
+        assert res.status == {0: 'optimal', 2: 'infeasible', 3: 'unbounded'}[lp.status]
+        if lp.status == 0:
+            assert pytest.approx(res.objective, abs=1e-7) == -lp.fun
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_stacked_negative_rhs_with_senses(seed):
+    rng = np.random.default_rng(seed)
+    senses = ['<=', '>=', '<=', '<=', '==']
+    problems = [([-1, -5, -1], [[5, 1, 6], [2, 4, -1], [-2, -1, 3], [1, 1, 1], [0, 0, 0]],
+                 [0, -6, 9, 30, 0], senses)]
+    for _ in range(30):
+        A = rng.integers(-3, 6, size=(5, 3)).tolist()
+        b = rng.integers(-6, 10, size=5).tolist()
+        c = rng.integers(-5, 5, size=3).tolist()
+        problems.append((c, A, b, senses))
+    for p, res in zip(problems, solve_stacked(problems)):
+        ref = simplex(*p, backend='float')
+        assert res.status == ref.status
+        if ref.status == 'optimal':
+            assert pytest.approx(res.objective, abs=1e-9) == ref.objective
+            assert sum(ci * xi for ci, xi in zip(p[0], res.x)) == pytest.approx(ref.objective, abs=1e-9)
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_heterogeneous_batch_keeps_order(workers):
+    problems = (
+        random_problems(0, 3, m=4, n=3)
+        + [([3, 2, 4], [[1, 1, 1], [2, 0, 1], [0, 1, 2]], [5, 6, 5])]
+        + random_problems(1, 2, m=5, n=5)
+        + [([1, 2], [[1, 1], [1, 2]], [5, 8], ['>=', '=='])]
+    )
+    results = solve_batch(problems, workers=workers)
+    assert len(results) == len(problems)
+    for p, res in zip(problems, results):
+        ref = simplex(*p, backend='float')
+        assert res.status == ref.status
+        if ref.status == 'optimal':
+            assert pytest.approx(res.objective, abs=1e-9) == ref.objective
+
+
+@pytest.mark.parametrize("backend", [None, 'fraction', 'integer'])
+def test_exact_backend_is_not_stacked(backend):
+    problems = [([3, 2], [[1, 1], [1, 3]], [4, 6]), ([1, 1], [[2, 1], [1, 3]], [5, 7])]
+    results = solve_batch(problems, backend=backend)
+    for p, res in zip(problems, results):
+        ref = simplex(*p, backend=backend)
+        # exact arithmetic: the same objective and an exact tableau, not a float array
+        assert res.objective == ref.objective and res.x == ref.x
+        assert not isinstance(res.tableau, np.ndarray)
@@ -0,0 +1,73 @@
+"""
+Pytest tests for the benchmark generators (checked against SciPy) and the regression check.
+"""
+import pytest
+from scipy.optimize import linprog, milp, LinearConstraint, Bounds as ScipyBounds
+from scipy import sparse as sp
+
+from benchmarks import generators as gen
+from benchmarks.run import SUITE, compare, measure
+
+SMALL = [
+    (gen.random_dense, {'m': 4, 'n': 6}),
+    (gen.transportation, {'sources': 3, 'sinks': 4}),
+    (gen.assignment, {'n': 4}),
+    (gen.knapsack, {'n': 8, 'rows': 2}),
+    (gen.set_cover, {'universe': 6, 'sets': 8}),
+    (gen.klee_minty, {'n': 4}),
+]
+
+
+def dense(p):
+    A = p['A']
+    if isinstance(A, tuple):
+        data, indices, indptr = A
+        A = sp.csr_matrix((data, indices, indptr), shape=(len(p['b']), len(p['c']))).toarray()
+    return A
+
+
+def scipy_solve(p, integral):
+    A = dense(p)
+    lo = [-float('inf') if s == '<=' else rhs for s, rhs in zip(p['senses'], p['b'])]
+    up = [float('inf') if s == '>=' else rhs for s, rhs in zip(p['senses'], p['b'])]
+    bounds = p['bounds'] or [(0, None)] * len(p['c'])
+    res = milp([-v for v in p['c']], constraints=LinearConstraint(A, lo, up),
+               integrality=[int(integral)] * len(p['c']),
+               bounds=ScipyBounds([l for l, _ in bounds], [float('inf') if u is None else u for _, u in bounds]))
+    return -res.fun
+
+
+@pytest.mark.parametrize("make, params", SMALL)
+def test_generators_are_deterministic(make, params):
+    assert make(seed=3, **params) == make(seed=3, **params)
+
+
+@pytest.mark.parametrize("make, params", SMALL)
+def test_generators_against_scipy(make, params):
+    p = make(seed=1, **params)
+    integral = p['bounds'] is not None
+    solver = 'solve_integer' if integral else 'simplex'
+    r = measure(solver, p, repeat=1)
+    assert r['status'] == 'optimal'
+    assert r['objective'] == pytest.approx(scipy_solve(p, integral))
+    assert r['time'] > 0 and r['peak_kib'] > 0
+
+
+def test_klee_minty_visits_every_vertex():
+    r = measure('simplex', gen.klee_minty(5), repeat=1)
+    assert r['pivots'] == 2 ** 5 - 1
+
+
+def test_suite_names_are_unique():
+    assert len({name for name, *_ in SUITE}) == len(SUITE)
+
+
+def test_compare_reports_regressions():
+    base = {'lp/simplex': {'status': 'optimal', 'objective': 10.0, 'pivots': 5, 'nodes': None,
+                           'time': 0.1, 'peak_kib': 100.0}}
+    same = {'lp/simplex': dict(base['lp/simplex'], time=0.11)}
+    assert compare(same, base) == []
+    slow = {'lp/simplex': dict(base['lp/simplex'], time=0.2, pivots=7, peak_kib=200.0, objective=9.0)}
+    problems = compare(slow, base)
+    assert len(problems) == 4
+    assert any('pivots 5 -> 7' in line for line in problems)
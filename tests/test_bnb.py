@@ -118,3 +118,151 @@ def test_branch_and_bound_extended(c, A, b, expected_status, expected_solution):
         assert status_pulp == 'Optimal'
         if expected_solution is not None:
             assert sol_pulp == expected_solution
+
+
+@pytest.mark.skipif(not PULP, reason="PuLP не установлен")
+@pytest.mark.parametrize("backend", [None, 'float', 'sparse'])
+@pytest.mark.parametrize("seed", range(4))
+def test_branch_and_bound_random_vs_pulp(backend, seed):
+    import random
+    rnd = random.Random(seed)
+    n, m = 5, 3
+    c = [rnd.randint(1, 9) for _ in range(n)]
+    A = [[rnd.randint(1, 9) for _ in range(n)] for _ in range(m)]
+    b = [rnd.randint(10, 30) for _ in range(m)]
+
+    res, x = solve_integer(c, A, b, backend=backend)
+    status_pulp, sol_pulp = solve_pulp_integer(c, A, b)
+    assert res.status == 'optimal'
+    assert status_pulp == 'Optimal'
+    assert res.objective == pytest.approx(sum(ci * xi for ci, xi in zip(c, sol_pulp)))
+    assert all(sum(a * xi for a, xi in zip(row, x)) <= bi for row, bi in zip(A, b))
+
+
+@pytest.mark.parametrize("backend", [None, 'float', 'fraction'])
+def test_badly_scaled_model(backend):
+    # max|a| / min|a| = 2250: the float root LP would be scaled, but its tableau feeds the children
+    res, x = solve_integer([7, 9], [[8, 9000], [4, 6000], [4, 4000]], [34, 23, 6], backend=backend)
+    assert res.status == 'optimal'
+    assert res.objective == pytest.approx(7) and x == [1, 0]
+
+
+def test_children_reoptimize_without_resolving(monkeypatch):
+    """Симплекс с нуля запускается только в корне, потомки доводятся двойственным симплексом."""
+    import importlib
+    bnb = importlib.import_module('simplex.bnb')  # simplex.bnb в пакете — псевдоним solve_integer
+    calls = []
+    original = bnb.simplex
+
+    def counting_simplex(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(bnb, 'simplex', counting_simplex)
+    res, x = solve_integer([3, 2, 4], [[1, 1, 1], [2, 0, 1], [0, 1, 2]], [5, 6, 5])
+    assert x == [2, 1, 2]
+    assert len(calls) == 1
+
+
+def test_branch_and_bound_with_senses():
+    # max x1 + x2, x1 + x2 <= 3.5, x1 >= 1.5 ⇒ x1 >= 2, x1 + x2 <= 3
+    res, x = solve_integer([1, 1], [[1, 1], [1, 0]], [3.5, 1.5], senses=['<=', '>='])
+    assert res.status == 'optimal'
+    assert res.objective == 3
+    assert x[0] >= 2
+
+
+KNAPSACK = (
+    [10, 13, 18, 31, 7, 15],
+    [[11, 15, 20, 35, 10, 33], [3, 4, 5, 7, 2, 6]],
+    [47, 15],
+)
+
+
+@pytest.mark.parametrize("policy", ['depth', 'best-bound', 'best-estimate', 'hybrid'])
+def test_node_selection_policies(policy):
+    from simplex.bnb import branch_and_bound
+    ref = branch_and_bound(*KNAPSACK, node_selection='depth')
+    res = branch_and_bound(*KNAPSACK, node_selection=policy)
+    assert res.objective == ref.objective
+    assert res.gap == 0
+    assert res.bound == res.objective
+    assert res.nodes > 0
+
+
+def test_progress_reports_bound_and_gap():
+    from simplex.bnb import branch_and_bound
+    progress = []
+    res = branch_and_bound(*KNAPSACK, on_progress=progress.append)
+    assert len(progress) == res.nodes
+    bounds = [p.bound for p in progress]
+    # глобальная граница не возрастает, разрыв в конце закрыт
+    assert all(b1 >= b2 - 1e-9 for b1, b2 in zip(bounds, bounds[1:]))
+    assert progress[-1].gap == 0
+    assert all(p.incumbent is None or p.bound >= p.incumbent for p in progress)
+
+
+def test_target_gap_stops_early():
+    from simplex.bnb import branch_and_bound
+    exact = branch_and_bound(*KNAPSACK, node_selection='depth')
+    rough = branch_and_bound(*KNAPSACK, node_selection='depth', gap=0.5)
+    assert rough.nodes < exact.nodes
+    assert rough.gap <= 0.5
+    assert rough.bound >= exact.objective >= rough.objective
+
+
+def test_unknown_node_selection():
+    from simplex.bnb import branch_and_bound
+    with pytest.raises(ValueError):
+        branch_and_bound([1], [[1]], [1], node_selection='random')
+
+
+@pytest.mark.parametrize("policy", ['depth', 'best-bound'])
+def test_parallel_is_deterministic(policy):
+    from simplex.bnb import branch_and_bound
+    serial = branch_and_bound(*KNAPSACK, node_selection=policy)
+    results = [branch_and_bound(*KNAPSACK, node_selection=policy, workers=w) for w in (1, 2, 4)]
+    for res in results:
+        assert res.objective == serial.objective
+        assert res.x == serial.x
+        assert res.nodes == serial.nodes
+        assert res.gap == 0
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_serial_search_matches_workers(seed):
+    import random
+    rng = random.Random(seed)
+    c = [rng.randint(5, 40) for _ in range(8)]
+    A = [[rng.randint(3, 30) for _ in range(8)]]
+    b = [rng.randint(40, 120)]
+    serial, x = solve_integer(c, A, b)
+    parallel, y = solve_integer(c, A, b, workers=4)
+    # the default search runs the same rounds as a pool, so the same optimum is returned
+    assert x == y and serial.stats.nodes == parallel.stats.nodes
+
+
+def test_parallel_solve_integer():
+    res, x = solve_integer([3, 2, 4], [[1, 1, 1], [2, 0, 1], [0, 1, 2]], [5, 6, 5], workers=2)
+    assert res.status == 'optimal'
+    assert x == [2, 1, 2]
+
+
+def test_depth_first_explores_floor_branch_first(monkeypatch):
+    import importlib
+    bnb = importlib.import_module('simplex.bnb')  # simplex.bnb в пакете — псевдоним solve_integer
+    expanded = []
+    original = bnb.expand
+
+    def recording_expand(be, node, *args):
+        expanded.append(node.x)
+        return original(be, node, *args)
+
+    monkeypatch.setattr(bnb, 'expand', recording_expand)
+    bnb.branch_and_bound(*KNAPSACK, node_selection='depth', node_limit=3)
+    root, first, second = expanded
+    i = bnb.fractional(root, range(6))[0]
+    # the floor child (x_i <= floor) comes first, then its own floor child
+    assert first[i] <= int(root[i])
+    j = bnb.fractional(first, range(6))[0]
+    assert second[j] <= int(first[j]) and second[i] <= int(root[i])
@@ -0,0 +1,126 @@
+"""
+Pytest tests for native variable bounds (bounded-variable simplex and bound branching in B&B).
+"""
+import importlib
+
+import pulp
+import pytest
+from scipy.optimize import linprog
+
+from simplex import simplex, dual_simplex, solve_integer
+from simplex.history import Flip
+
+
+CASES = [
+    # upper bounds only
+    {'c': [3, 2], 'A': [[1, 1]], 'b': [10], 'senses': None, 'bounds': [(0, 4), (0, 3)]},
+    # the entering variable reaches its own bound (bound flip without a pivot)
+    {'c': [1, 1], 'A': [[1, 2], [2, 1]], 'b': [8, 8], 'senses': None, 'bounds': [(0, 1), (0, 1)]},
+    # lower bounds push b - A·lower below zero
+    {'c': [-1, -2], 'A': [[1, -1], [1, 1]], 'b': [0, 10], 'senses': None, 'bounds': [(2, None), (1, 5)]},
+    # negative lower bound
+    {'c': [1, -1], 'A': [[1, 1]], 'b': [3], 'senses': ['<='], 'bounds': [(-2, 2), (-1, 4)]},
+    # equality and >= rows
+    {'c': [2, 3, 1], 'A': [[1, 1, 1], [1, 0, -1]], 'b': [6, 1], 'senses': ['==', '>='],
+     'bounds': [(0, 3), (1, 2), (0, None)]},
+    # fixed variable
+    {'c': [1, 1], 'A': [[1, 1]], 'b': [5], 'senses': None, 'bounds': [(2, 2), (0, None)]},
+    # infeasible by bounds
+    {'c': [1, 1], 'A': [[1, 1]], 'b': [5], 'senses': ['>='], 'bounds': [(0, 2), (0, 2)]},
+    # unbounded above
+    {'c': [1, 1], 'A': [[1, -1]], 'b': [1], 'senses': None, 'bounds': [(0, None), (0, None)]},
+]
+
+
+def scipy_solve(case):
+    senses = case['senses'] or ['<='] * len(case['b'])
+    A_ub, b_ub, A_eq, b_eq = [], [], [], []
+    for row, rhs, s in zip(case['A'], case['b'], senses):
+        if s == '<=':
+            A_ub.append(row); b_ub.append(rhs)
+        elif s == '>=':
+            A_ub.append([-v for v in row]); b_ub.append(-rhs)
+        else:
+            A_eq.append(row); b_eq.append(rhs)
+    return linprog([-v for v in case['c']], A_ub=A_ub or None, b_ub=b_ub or None,
+                   A_eq=A_eq or None, b_eq=b_eq or None, bounds=case['bounds'], method='highs')
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse'])
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+@pytest.mark.parametrize("case", CASES)
+def test_bounds_against_scipy(backend, solver, case):
+    ref = scipy_solve(case)
+    res = solver(case['c'], case['A'], case['b'], case['senses'], backend=backend, bounds=case['bounds'])
+    assert res.status == {0: 'optimal', 2: 'infeasible', 3: 'unbounded'}[ref.status]
+    if res.status == 'optimal':
+        assert res.objective == pytest.approx(-ref.fun)
+        for x, (lo, up) in zip(res.x, case['bounds']):
+            assert x >= lo - 1e-9
+            assert up is None or x <= up + 1e-9
+
+
+def test_bounds_do_not_add_rows():
+    c, A, b = [3, 2], [[1, 1]], [10]
+    res = simplex(c, A, b, bounds=[(0, 4), (0, 3)])
+    assert res.x == [4, 3] and res.objective == 18
+    # one constraint row plus the cost row, as without bounds
+    assert len(res.tableau) == len(simplex(c, A, b).tableau) == 2
+
+
+def test_bound_flip_in_pivot_log():
+    case = CASES[1]
+    res = simplex(case['c'], case['A'], case['b'], bounds=case['bounds'], record_history='pivots')
+    assert any(isinstance(event, Flip) for event in res.history)
+    assert res.history.tableau() == res.tableau
+
+
+def test_infinite_lower_bound_rejected():
+    with pytest.raises(ValueError):
+        simplex([1], [[1]], [1], bounds=[(None, 1)])
+    with pytest.raises(ValueError):
+        simplex([1, 1], [[1, 1]], [1], bounds=[(0, 1)])
+
+
+KNAPSACK = (
+    [10, 13, 18, 31, 7, 15],
+    [[11, 15, 20, 35, 10, 33], [3, 4, 5, 7, 2, 6]],
+    [47, 15],
+)
+
+
+def pulp_integer(c, A, b, bounds):
+    prob = pulp.LpProblem('p', pulp.LpMaximize)
+    xs = [pulp.LpVariable(f'x{j}', lowBound=lo, upBound=up, cat='Integer') for j, (lo, up) in enumerate(bounds)]
+    prob += pulp.lpSum(cj * x for cj, x in zip(c, xs))
+    for row, rhs in zip(A, b):
+        prob += pulp.lpSum(a * x for a, x in zip(row, xs)) <= rhs
+    prob.solve(pulp.PULP_CBC_CMD(msg=0))
+    return pulp.value(prob.objective)
+
+
+@pytest.mark.parametrize("bounds", [
+    [(0, 1)] * 6,
+    [(0, 2)] * 6,
+    [(1, 1), (0, 1), (0, 1), (0, 1), (0, 3), (0, 1)],
+])
+def test_integer_with_bounds(bounds):
+    c, A, b = KNAPSACK
+    res, x = solve_integer(c, A, b, bounds=bounds)
+    assert res.objective == pytest.approx(pulp_integer(c, A, b, bounds))
+    assert all(lo <= v <= up for v, (lo, up) in zip(x, bounds))
+
+
+def test_branching_keeps_tableau_size():
+    bnb = importlib.import_module('simplex.bnb')  # simplex.bnb в пакете — псевдоним solve_integer
+    be = bnb.get_backend(None)
+    c, A, b = KNAPSACK
+    root = bnb.root_node(be, c, A, b, ['<='] * 2, [(0, None)] * 6)
+    i = bnb.fractional(root.x, range(6))[0]
+    down = bnb.child_node(be, root, 6, i, upper=0)
+    assert len(down.tableau) == len(root.tableau)
+    assert len(down.tableau[0]) == len(root.tableau[0])
+    assert down.x[i] == 0
+    assert down.objective <= root.objective
+    # the parent node is left untouched
+    assert root.bounds.upper[i] is None
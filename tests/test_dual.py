@@ -170,12 +170,12 @@ from fractions import Fraction
         'objective': 1.0,
         'alternative': False
     },
-    # 2. Невыполнимая
+    # 2. Отрицательная правая часть: x - y >= 1, луч (1, 1) неограничен
     {
         'c': [2, 3],
         'A': [[-1, 1]],
         'b': [-1],
-        'status': 'infeasible'
+        'status': 'unbounded'
     },
     # 3. Рациональные коэффициенты
     {
@@ -306,3 +306,79 @@ def test_dual_simplex_against_scipy(c, A, b, senses, skip_x):
     else:
         # For multiple optima, just check alternative flag
         assert res.alternative, "Expected alternative=True for multiple optimal solutions"
+
+
+def test_dual_warm_start_after_rhs_change():
+    c, A = [3, 2, 4], [[1, 1, 1], [2, 0, 1], [0, 1, 2]]
+    first = dual_simplex(c, A, [5, 6, 5])
+    # новая правая часть делает прежний базис прямо недопустимым
+    cold = dual_simplex(c, A, [5, 12, 5])
+    warm = dual_simplex(c, A, [5, 12, 5], warm_start=first.basis, record_history='pivots')
+    assert warm.status == cold.status == 'optimal'
+    assert pytest.approx(warm.objective) == cold.objective
+    assert warm.x == pytest.approx(cold.x)
+    assert len(warm.history) > 0
+
+
+@pytest.mark.skipif(not SCIPY, reason="SciPy не установлен")
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse', 'integer'])
+@pytest.mark.parametrize("dual_pricing", ['dantzig', 'steepest'])
+def test_dual_pricing_warm_reoptimisation(backend, dual_pricing):
+    import random
+    rng = random.Random(7)
+    for _ in range(15):
+        m, n = rng.randint(3, 6), rng.randint(3, 6)
+        A = [[rng.randint(0, 6) for _ in range(n)] for _ in range(m)]
+        c = [rng.randint(1, 9) for _ in range(n)]
+        b = [rng.randint(5, 20) for _ in range(m)]
+        first = dual_simplex(c, A, b, backend=backend, record_history='none')
+        # сжатие правых частей делает прежний базис прямо недопустимым
+        b2 = [max(bi - rng.randint(0, 10), 0) for bi in b]
+        warm = dual_simplex(c, A, b2, backend=backend, record_history='none', warm_start=first.basis,
+                            dual_pricing=dual_pricing)
+        ref = linprog([-v for v in c], A_ub=A, b_ub=b2, method='highs')
+        assert warm.status == 'optimal'
+        assert float(warm.objective) == pytest.approx(-ref.fun, abs=1e-7)
+
+
+def test_dual_steepest_edge_scales_rows():
+    from simplex.base import FractionBackend
+    from simplex.pricing import get_dual_pricing
+    # строка 0 сильнее нарушена, но её норма велика: по ребру выгоднее строка 1
+    T = [[1, 0, -100, 0, -5], [0, 1, -1, -1, -1], [0, 0, 1, 1, 0]]
+    be = FractionBackend()
+    assert get_dual_pricing('dantzig').select(be, T) == 0
+    assert get_dual_pricing('steepest').select(be, T) == 1
+    with pytest.raises(ValueError):
+        get_dual_pricing('devex')
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse', 'integer'])
+def test_dual_bound_flipping_ratio_test(backend):
+    from fractions import Fraction as F
+    from simplex.base import get_backend, dual_optimize
+    from simplex.bounds import Bounds
+    from simplex.history import NoHistory
+    be = get_backend(backend)
+    # x0 - t1 - t2 = -3 при t1 <= 1: t1 проходится переводом на границу, входит t2
+    T, _, _ = be.build([0, -1, -2], [[1, -1, -1]], [-3], ['=='], phase=2)
+    basis = [0]
+    bounds = Bounds([0, 0, 0], [None, 1, None])
+    history = NoHistory()
+    assert dual_optimize(be, T, basis, 3, history, bounds)
+    assert basis == [2]
+    assert bounds.flipped == [False, True, False]
+    assert float(be.extract(T, basis, 3)[2]) == pytest.approx(2)
+    assert all(v >= -1e-9 for _, v in be.row_nonzeros(T, -1))
+    assert float(be.objective(T)) == pytest.approx(-5)
+    assert bounds.values(be.extract(T, basis, 3)) == pytest.approx([0, 1, 2])
+
+
+def test_dual_harris_ratio_test_prefers_large_pivot():
+    import numpy as np
+    from simplex.floating import FloatBackend
+    be = FloatBackend(tol=1e-6)
+    # отношения 0 и 1e-7 неразличимы при допуске, ведущим берётся больший |a_rj|
+    T = np.array([[-1e-3, -1.0, 1.0, -1.0], [0.0, 1e-7, 0.0, 0.0]])
+    assert be.dual_entering(T, 0, 3) == 1
+    assert FloatBackend(tol=1e-12).dual_entering(T, 0, 3) == 0
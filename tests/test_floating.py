@@ -0,0 +1,63 @@
+"""
+Pytest tests for the float64 (numpy) backend, comparing against the exact Fraction backend and SciPy.
+"""
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from simplex import simplex, dual_simplex
+
+
+CASES = [
+    # regular
+    {'c': [3, 2], 'A': [[1, 2], [4, 0]], 'b': [4, 12], 'senses': None},
+    # unbounded
+    {'c': [1, 1], 'A': [[1, -1]], 'b': [1], 'senses': None},
+    # infeasible
+    {'c': [1, 1], 'A': [[1, 0], [0, 1]], 'b': [-1, -1], 'senses': None},
+    # alternative
+    {'c': [1, 1], 'A': [[1, 0], [0, 1], [1, 1]], 'b': [1, 1, 2], 'senses': None},
+    # cycling
+    {'c': [1, 0], 'A': [[1, -2], [-1, 1], [0, 1]], 'b': [0, 0, 1], 'senses': None},
+    # mixed senses
+    {'c': [1, 2], 'A': [[1, 1], [1, 2]], 'b': [5, 8], 'senses': ['>=', '==']},
+    {'c': [1], 'A': [[1], [1]], 'b': [1, 3], 'senses': ['<=', '>=']},
+    # rational data
+    {'c': [0.5, -3], 'A': [[2, 1], [2, 3]], 'b': [8, 12], 'senses': None},
+]
+
+
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+@pytest.mark.parametrize("case", CASES)
+def test_float_matches_fraction(solver, case):
+    exact = solver(case['c'], case['A'], case['b'], case['senses'])
+    fast = solver(case['c'], case['A'], case['b'], case['senses'], backend='float')
+    assert fast.status == exact.status
+    if exact.status == 'optimal':
+        assert pytest.approx(fast.objective, rel=1e-9, abs=1e-9) == exact.objective
+        assert fast.x == pytest.approx(exact.x, rel=1e-9, abs=1e-9)
+        assert fast.alternative == exact.alternative
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_float_random_against_scipy(seed):
+    rng = np.random.default_rng(seed)
+    m, n = 40, 30
+    A = rng.uniform(0, 10, size=(m, n))
+    b = rng.uniform(10, 100, size=m)
+    c = rng.uniform(1, 5, size=n)
+
+    res = simplex(c.tolist(), A.tolist(), b.tolist(), backend='float')
+    lp = linprog(-c, A_ub=A, b_ub=b, bounds=(0, None), method='highs')
+
+    assert lp.success
+    assert res.status == 'optimal'
+    assert pytest.approx(res.objective, rel=1e-7) == -lp.fun
+    assert np.all(A @ np.array(res.x) <= b + 1e-7)
+
+
+def test_float_history_is_ndarray():
+    res = simplex([3, 2], [[1, 2], [4, 0]], [4, 12], backend='float')
+    assert res.status == 'optimal'
+    assert all(isinstance(tab, np.ndarray) and tab.dtype == np.float64 for tab in res.history)
+    assert res.tableau.shape == (3, 5)
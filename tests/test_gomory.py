@@ -1,186 +1,207 @@
-# import pytest
-# from simplex import gomory_integer   
-# try:
-#     from pulp import LpProblem, LpMaximize, LpVariable, lpSum, LpInteger, value, LpStatus
-#     PULP = True
-# except ImportError:
-#     PULP = False
-
-
-
-# def solve_pulp_integer(c, A, b, signs=None):
-#     """
-#     Решает целочисленную задачу линейного программирования с помощью PuLP.
-#     max c^T x
-#     s.t. Ax [signs[i]] b
-#     x — целочисленное
-#     """
-#     n = len(c)
-#     prob = LpProblem("Integer_MIP", LpMaximize)
-#     x = [LpVariable(f"x{i}", lowBound=0, cat=LpInteger) for i in range(n)]
-#     prob += lpSum(c[i] * x[i] for i in range(n))
-    
-#     if signs is None:
-#         signs = ["<="] * len(b)
-    
-#     for row, bi, sign in zip(A, b, signs):
-#         if sign == "<=":
-#             prob += lpSum(row[i] * x[i] for i in range(n)) <= bi
-#         elif sign == ">=":
-#             prob += lpSum(row[i] * x[i] for i in range(n)) >= bi
-#         elif sign == "==":
-#             prob += lpSum(row[i] * x[i] for i in range(n)) == bi
-#         else:
-#             raise ValueError(f"Unsupported constraint sign: {sign}")
-    
-#     status_code = prob.solve()
-#     status_name = LpStatus[status_code]
-#     return status_name, [int(value(xi)) for xi in x]
-
-
-# @pytest.mark.skipif(not PULP, reason="PuLP не установлен")
-# @pytest.mark.parametrize(
-#     "c, A, b, expected",
-#     [
-#         (
-#             [2, 3],
-#             [[1, 0], [0, 1], [1, 1]],
-#             [4, 4, 5],
-#             [1, 4]
-#         ),
-#         (
-#             [3, 2, 4],
-#             [[1, 1, 1], [2, 0, 1], [0, 1, 2]],
-#             [5, 6, 5],
-#             [2, 1, 2]
-#         ),
-#     ]
-# )
-# def test_gomory_vs_pulp(c, A, b, expected):
-#     """
-#     Сравниваем решение метода Гомори с решением PuLP.
-#     """
-#     res = gomory_integer(c.copy(), [row.copy() for row in A], b.copy())
-#     assert res.status == 'optimal_integer'
-#     assert res.x == expected
-#     assert all(isinstance(x, int) for x in res.x)
-
-#     status_pulp, sol_pulp = solve_pulp_integer(c, A, b)
-#     assert status_pulp == 'Optimal'
-#     assert sol_pulp == expected
-
-
-# @pytest.mark.skipif(not PULP, reason="PuLP не установлен")
-# @pytest.mark.parametrize(
-#     "c, A, b, expected_status, expected_solution",
-#     [
-#         (
-#             [2, 3],
-#             [[1, 0], [0, 1], [1, 1]],
-#             [4, 4, 5],
-#             'optimal_integer',
-#             [1, 4]
-#         ),
-#         (
-#             [3, 2, 4],
-#             [[1, 1, 1], [2, 0, 1], [0, 1, 2]],
-#             [5, 6, 5],
-#             'optimal_integer',
-#             [2, 1, 2]
-#         ),
-#         (
-#             [1, 1],
-#             [[1, 2], [3, 4]],
-#             [1, 1],
-#             'optimal_integer',
-#             [0, 0]
-#         ),
-#         (
-#             [1, 1],
-#             [[1, 0], [0, 1]],
-#             [2, 2],
-#             'optimal_integer',
-#             [2, 2 ]
-#         ),
-#         (
-#             [-1, -2],
-#             [[1, 1], [2, 0]],
-#             [3, 4],
-#             'optimal_integer',
-#             [0, 0]
-#         ),
-#         (
-#             [0, 0],
-#             [[1, 0], [0, 1]],
-#             [0, 0],
-#             'optimal_integer',
-#             [0, 0]
-#         ),
-#     ]
-# )
-# def test_gomory_extended(c, A, b, expected_status, expected_solution):
-#     """
-#     Расширенный набор тестов для метода Гомори.
-#     """
-#     res = gomory_integer(c.copy(), [row.copy() for row in A], b.copy())
-#     assert res.status == expected_status
-#     if expected_solution is not None:
-#         assert res.x == expected_solution
-#         assert all(isinstance(x, int) for x in res.x)
-
-#     if expected_status == 'optimal_integer':
-#         status_pulp, sol_pulp = solve_pulp_integer(c, A, b)
-#         assert status_pulp == 'Optimal'
-#         if expected_solution is not None:
-#             assert sol_pulp == expected_solution
-
-# @pytest.mark.skipif(not PULP, reason="PuLP не установлен")
-# @pytest.mark.parametrize(
-#     "c, A, b, signs, expected",
-#     [
-#         (
-#             [2, 3],
-#             [[1, 0], [0, 1], [1, 1]],
-#             [4, 4, 5],
-#             ["<=", "<=", "<="],
-#             [1, 4]
-#         ),
-#         (
-#             [1, 2],
-#             [[1, 0], [0, 1], [1, 1]],
-#             [1, 2, 4],
-#             [">=", ">=", ">="],
-#             [1, 2]
-#         ),
-#         (
-#             [3, 1],
-#             [[1, 2], [3, 4]],
-#             [7, 18],
-#             ["==", "=="],
-#             [2, 3]
-#         ),
-#         (
-#             [1, 1],
-#             [[1, 0], [0, 1], [1, 1], [1, -1]],
-#             [3, 3, 5, 1],
-#             ["<=", ">=", "==", "<="],
-#             [2, 3]
-#         ),
-#     ]
-# )
-# def test_gomory_various_constraints(c, A, b, signs, expected):
-#     # gomory_integer принимает parameter `senses`
-#     res = gomory_integer(c.copy(), [row.copy() for row in A], b.copy(), senses=signs)
-    
-#     # Проверяем, что статус - оптимальный (но если unbounded, то тест возможно нужно подкорректировать)
-#     assert res.status in ('optimal_integer', 'optimal'), f"Unexpected status: {res.status}"
-
-#     # Если статус оптимальный, проверяем решение
-#     if res.status == 'optimal_integer':
-#         assert all(isinstance(x, int) for x in res.x)
-#         assert res.x == expected
-
-#     # solve_pulp_integer не принимает senses, вызываем без него
-#     status_pulp, sol_pulp = solve_pulp_integer(c, A, b, signs)
-#     assert status_pulp == 'Optimal'
-#     assert sol_pulp == expected
+import pytest
+from simplex import gomory_integer, gomory_cuts, solve_integer
+from simplex.gomory import structural_cut
+try:
+    from pulp import LpProblem, LpMaximize, LpVariable, lpSum, LpInteger, value, LpStatus
+    PULP = True
+except ImportError:
+    PULP = False
+
+
+def solve_pulp_integer(c, A, b, signs=None):
+    """
+    Решает целочисленную задачу линейного программирования с помощью PuLP.
+    max c^T x
+    s.t. Ax [signs[i]] b
+    x — целочисленное
+    """
+    n = len(c)
+    prob = LpProblem("Integer_MIP", LpMaximize)
+    x = [LpVariable(f"x{i}", lowBound=0, cat=LpInteger) for i in range(n)]
+    prob += lpSum(c[i] * x[i] for i in range(n))
+
+    if signs is None:
+        signs = ["<="] * len(b)
+
+    for row, bi, sign in zip(A, b, signs):
+        if sign == "<=":
+            prob += lpSum(row[i] * x[i] for i in range(n)) <= bi
+        elif sign == ">=":
+            prob += lpSum(row[i] * x[i] for i in range(n)) >= bi
+        elif sign == "==":
+            prob += lpSum(row[i] * x[i] for i in range(n)) == bi
+        else:
+            raise ValueError(f"Unsupported constraint sign: {sign}")
+
+    status_code = prob.solve()
+    status_name = LpStatus[status_code]
+    return status_name, [int(value(xi)) for xi in x], value(prob.objective)
+
+
+@pytest.mark.skipif(not PULP, reason="PuLP не установлен")
+@pytest.mark.parametrize("backend", ['fraction', 'integer', 'sparse', 'float'])
+@pytest.mark.parametrize(
+    "c, A, b, expected",
+    [
+        (
+            [2, 3],
+            [[1, 0], [0, 1], [1, 1]],
+            [4, 4, 5],
+            [1, 4]
+        ),
+        (
+            [3, 2, 4],
+            [[1, 1, 1], [2, 0, 1], [0, 1, 2]],
+            [5, 6, 5],
+            [2, 1, 2]
+        ),
+    ]
+)
+def test_gomory_vs_pulp(backend, c, A, b, expected):
+    """
+    Сравниваем решение метода Гомори с решением PuLP.
+    """
+    res = gomory_integer(c.copy(), [row.copy() for row in A], b.copy(), backend=backend)
+    assert res.status == 'optimal_integer'
+    assert res.x == expected
+    assert all(isinstance(x, int) for x in res.x)
+
+    status_pulp, sol_pulp, _ = solve_pulp_integer(c, A, b)
+    assert status_pulp == 'Optimal'
+    assert sol_pulp == expected
+
+
+@pytest.mark.parametrize(
+    "c, A, b, expected_status, expected_solution",
+    [
+        ([2, 3], [[1, 0], [0, 1], [1, 1]], [4, 4, 5], 'optimal_integer', [1, 4]),
+        ([3, 2, 4], [[1, 1, 1], [2, 0, 1], [0, 1, 2]], [5, 6, 5], 'optimal_integer', [2, 1, 2]),
+        ([1, 1], [[1, 2], [3, 4]], [1, 1], 'optimal_integer', [0, 0]),
+        ([1, 1], [[1, 0], [0, 1]], [2, 2], 'optimal_integer', [2, 2]),
+        ([-1, -2], [[1, 1], [2, 0]], [3, 4], 'optimal_integer', [0, 0]),
+        ([0, 0], [[1, 0], [0, 1]], [0, 0], 'optimal_integer', [0, 0]),
+        ([1, 1], [[2, 2]], [3], 'optimal_integer', None),
+        ([1, 0], [[2, 0], [-2, 0]], [3, -3], 'infeasible', None),
+        ([1, 1], [[1, -1]], [1], 'unbounded', None),
+    ]
+)
+def test_gomory_extended(c, A, b, expected_status, expected_solution):
+    """
+    Расширенный набор тестов для метода Гомори.
+    """
+    senses = ['<=', '>='] if expected_status == 'infeasible' else None
+    A_in = [row.copy() for row in A]
+    if senses:
+        A_in[1] = [-v for v in A_in[1]]
+    res = gomory_integer(c.copy(), A_in, [abs(v) for v in b] if senses else b.copy(), senses=senses)
+    assert res.status == expected_status
+    if expected_solution is not None:
+        assert res.x == expected_solution
+        assert all(isinstance(x, int) for x in res.x)
+    if expected_status == 'optimal_integer':
+        assert res.objective == sum(ci * xi for ci, xi in zip(c, res.x))
+        assert res.stats.cuts >= 0
+    # исходные данные не изменяются
+    assert A_in == ([row.copy() for row in A] if not senses else A_in)
+
+
+@pytest.mark.skipif(not PULP, reason="PuLP не установлен")
+@pytest.mark.parametrize(
+    "c, A, b, signs, expected",
+    [
+        (
+            [2, 3],
+            [[1, 0], [0, 1], [1, 1]],
+            [4, 4, 5],
+            ["<=", "<=", "<="],
+            [1, 4]
+        ),
+        (
+            [-1, -2],
+            [[1, 0], [0, 1], [1, 1]],
+            [1, 2, 4],
+            [">=", ">=", ">="],
+            [2, 2]
+        ),
+        (
+            [3, 1],
+            [[1, 2], [3, 4]],
+            [8, 18],
+            ["==", "=="],
+            [2, 3]
+        ),
+        (
+            [1, 1],
+            [[1, 0], [0, 1], [1, 1], [1, -1]],
+            [3, 3, 5, 1],
+            ["<=", ">=", "==", "<="],
+            None
+        ),
+    ]
+)
+def test_gomory_various_constraints(c, A, b, signs, expected):
+    res = gomory_integer(c.copy(), [row.copy() for row in A], b.copy(), senses=signs)
+    assert res.status == 'optimal_integer'
+    assert all(isinstance(x, int) for x in res.x)
+    if expected is not None:
+        assert res.x == expected
+
+    status_pulp, sol_pulp, obj_pulp = solve_pulp_integer(c, A, b, signs)
+    assert status_pulp == 'Optimal'
+    assert res.objective == pytest.approx(obj_pulp)
+
+
+def test_gomory_cut_limit_keeps_bound():
+    c, A, b = [5, 8], [[1, 1], [5, 9]], [6, 45]
+    full = gomory_integer(c, A, b)
+    assert full.status == 'optimal_integer' and full.objective == 40
+    assert full.stats.cuts > 0
+    res = gomory_integer(c, A, b, max_cuts=0)
+    assert res.status == 'max_cuts_exceeded'
+    assert res.x == [] and res.bound >= full.objective
+    assert res.stats.cuts == 0
+
+
+KNAPSACK = {
+    'c': [12, 11, 9, 8, 7, 7, 6, 5, 4, 3],
+    'A': [[7, 6, 5, 5, 4, 4, 3, 3, 2, 2], [3, 5, 2, 6, 1, 4, 5, 2, 3, 1]],
+    'b': [19, 14],
+}
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'integer', 'float'])
+def test_root_cuts_shrink_tree(backend):
+    plain, x = solve_integer(KNAPSACK['c'], KNAPSACK['A'], KNAPSACK['b'], backend=backend)
+    cut, y = solve_integer(KNAPSACK['c'], KNAPSACK['A'], KNAPSACK['b'], backend=backend, cuts=gomory_cuts)
+    assert cut.objective == pytest.approx(plain.objective)
+    assert cut.stats.cuts > 0
+    assert cut.stats.nodes < plain.stats.nodes
+    deep, _ = solve_integer(KNAPSACK['c'], KNAPSACK['A'], KNAPSACK['b'], backend=backend, cuts=gomory_cuts,
+                            cut_depth=3, cut_rounds=2)
+    assert deep.objective == pytest.approx(plain.objective)
+
+
+def test_cuts_with_bounds_and_continuous_variables():
+    from simplex.bnb import branch_and_bound
+    c, A, b = [3, 2, 1], [[2, 3, 1], [4, 1, 2]], [12, 10]
+    bounds = [(0, 3), (1, None), (0, 2.5)]
+    plain = branch_and_bound(c, A, b, integer_indices=[0, 1], bounds=bounds)
+    cut = branch_and_bound(c, A, b, integer_indices=[0, 1], bounds=bounds, cuts=gomory_cuts, cut_depth=5)
+    # оптимум не единственен, сравниваем значение цели и допустимость
+    assert cut.objective == pytest.approx(plain.objective)
+    assert all(lo <= v <= (hi if hi is not None else v) + 1e-9 for v, (lo, hi) in zip(cut.x, bounds))
+    assert cut.x[0] == int(cut.x[0]) and cut.x[1] == int(cut.x[1])
+
+
+def test_custom_cut_callback():
+    seen = []
+
+    def cover(node):
+        seen.append(node.depth)
+        # x0 + x1 <= 2 не отсекает оптимум этой задачи
+        return [structural_cut(node, [1, 1] + [0] * 8, '<=', 2)] if len(seen) == 1 else []
+
+    res, _ = solve_integer(KNAPSACK['c'], KNAPSACK['A'], KNAPSACK['b'], cuts=cover)
+    plain, _ = solve_integer(KNAPSACK['c'], KNAPSACK['A'], KNAPSACK['b'])
+    assert seen[0] == 0 and res.stats.cuts == 1
+    assert res.objective == plain.objective
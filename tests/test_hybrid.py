@@ -0,0 +1,93 @@
+"""
+Pytest tests for the hybrid float-then-exact solve, comparing against the exact Fraction backend.
+"""
+import random
+from fractions import Fraction as F
+
+import pytest
+
+from simplex import simplex, hybrid_simplex, SimplexResult
+import simplex.hybrid as hybrid
+
+
+CASES = [
+    {'c': [3, 2], 'A': [[1, 2], [4, 0]], 'b': [4, 12], 'senses': None},
+    {'c': [1, 1], 'A': [[1, -1]], 'b': [1], 'senses': None},
+    {'c': [1, 1], 'A': [[1, 0], [0, 1]], 'b': [-1, -1], 'senses': None},
+    {'c': [1, 1], 'A': [[1, 0], [0, 1], [1, 1]], 'b': [1, 1, 2], 'senses': None},
+    {'c': [1, 0], 'A': [[1, -2], [-1, 1], [0, 1]], 'b': [0, 0, 1], 'senses': None},
+    {'c': [1, 2], 'A': [[1, 1], [1, 2]], 'b': [5, 8], 'senses': ['>=', '==']},
+    {'c': [-1], 'A': [[1], [2], [4], [-5], [-2]], 'b': [9, 10, 3, 15, 20], 'senses': ['<=', '==', '>=', '<=', '<=']},
+    {'c': [F(1, 2), -3], 'A': [[F(2, 3), 1], [2, F(3, 7)]], 'b': [8, F(12, 5)], 'senses': None},
+]
+
+
+@pytest.mark.parametrize("exact", ['integer', 'fraction'])
+@pytest.mark.parametrize("case", CASES)
+def test_hybrid_matches_exact(exact, case):
+    ref = simplex(case['c'], case['A'], case['b'], case['senses'])
+    res = hybrid_simplex(case['c'], case['A'], case['b'], case['senses'], exact=exact)
+    assert res.status == ref.status
+    assert res.objective == ref.objective
+    if ref.status == 'optimal':
+        assert res.alternative == ref.alternative
+        assert res.tableau[-1][-1] == ref.tableau[-1][-1]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_hybrid_random_rational(seed):
+    rng = random.Random(seed)
+    m, n = 15, 20
+    A = [[F(rng.randint(0, 9), rng.choice([1, 2, 3])) for _ in range(n)] for _ in range(m)]
+    b = [F(rng.randint(10, 60)) for _ in range(m)]
+    c = [F(rng.randint(1, 9), rng.choice([1, 2])) for _ in range(n)]
+    ref = simplex(c, A, b, record_history='none')
+    res = hybrid_simplex(c, A, b, record_history='pivots')
+    assert res.status == 'optimal'
+    # exact objective, not just a float approximation
+    assert res.tableau[-1][-1] == ref.tableau[-1][-1]
+    assert res.x == ref.x
+    # the float basis is already optimal: the exact phase only installs it
+    assert len(res.history) <= m
+
+
+def test_hybrid_repairs_wrong_float_basis(monkeypatch):
+    case = CASES[0]
+    calls = []
+
+    def fake_simplex(c, A, b, senses, backend=None, **kw):
+        calls.append(backend)
+        if backend == 'float':
+            # a feasible but suboptimal basis: only the slacks
+            return SimplexResult('optimal', [0, 0], 0, basis=[2, 3])
+        return simplex(c, A, b, senses, backend=backend, **kw)
+
+    monkeypatch.setattr(hybrid, 'simplex', fake_simplex)
+    res = hybrid_simplex(case['c'], case['A'], case['b'], record_history='pivots')
+    assert calls == ['float']
+    assert res.status == 'optimal'
+    assert res.objective == simplex(case['c'], case['A'], case['b']).objective
+    assert len(res.history) > 0
+
+
+def test_hybrid_falls_back_without_float_basis(monkeypatch):
+    case = CASES[5]
+    calls = []
+
+    def fake_simplex(c, A, b, senses, backend=None, **kw):
+        calls.append(backend)
+        if backend == 'float':
+            return SimplexResult('infeasible')
+        return simplex(c, A, b, senses, backend=backend, **kw)
+
+    monkeypatch.setattr(hybrid, 'simplex', fake_simplex)
+    res = hybrid_simplex(case['c'], case['A'], case['b'], case['senses'])
+    assert calls == ['float', 'integer']
+    assert res.objective == simplex(case['c'], case['A'], case['b'], case['senses']).objective
+
+
+def test_hybrid_stats_cover_exact_phase():
+    case = CASES[0]
+    res = hybrid_simplex(case['c'], case['A'], case['b'], record_history='pivots')
+    assert res.stats.total_pivots == len(res.history)
+    assert 'warm' in res.stats.pivots
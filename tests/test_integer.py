@@ -0,0 +1,139 @@
+"""
+Pytest tests for the integer (Bareiss, fraction-free) backend, comparing against the exact Fraction backend.
+"""
+import random
+from fractions import Fraction as F
+
+import pytest
+
+from simplex import simplex, dual_simplex, solve_integer
+from simplex.integer import IntegerTableau
+
+
+CASES = [
+    # regular
+    {'c': [3, 2], 'A': [[1, 2], [4, 0]], 'b': [4, 12], 'senses': None},
+    # unbounded
+    {'c': [1, 1], 'A': [[1, -1]], 'b': [1], 'senses': None},
+    # infeasible
+    {'c': [1, 1], 'A': [[1, 0], [0, 1]], 'b': [-1, -1], 'senses': None},
+    # alternative
+    {'c': [1, 1], 'A': [[1, 0], [0, 1], [1, 1]], 'b': [1, 1, 2], 'senses': None},
+    # cycling
+    {'c': [1, 0], 'A': [[1, -2], [-1, 1], [0, 1]], 'b': [0, 0, 1], 'senses': None},
+    # mixed senses
+    {'c': [1, 2], 'A': [[1, 1], [1, 2]], 'b': [5, 8], 'senses': ['>=', '==']},
+    {'c': [1], 'A': [[1], [1]], 'b': [1, 3], 'senses': ['<=', '>=']},
+    # rational data
+    {'c': [F(1, 2), -3], 'A': [[F(2, 3), 1], [2, F(3, 7)]], 'b': [8, F(12, 5)], 'senses': None},
+    {'c': [0.5, 1.25], 'A': [[0.5, 1], [1, 0.25]], 'b': [3.5, 2], 'senses': ['<=', '>=']},
+]
+
+
+def random_problem(seed, m=12, n=15):
+    rng = random.Random(seed)
+    A = [[F(rng.randint(0, 9), rng.choice([1, 1, 2, 3])) for _ in range(n)] for _ in range(m)]
+    b = [F(rng.randint(10, 60)) for _ in range(m)]
+    c = [F(rng.randint(1, 9), rng.choice([1, 2])) for _ in range(n)]
+    return c, A, b
+
+
+@pytest.mark.parametrize("pricing", ['bland', 'dantzig', 'steepest'])
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+@pytest.mark.parametrize("case", CASES)
+def test_integer_matches_fraction(pricing, solver, case):
+    exact = solver(case['c'], case['A'], case['b'], case['senses'], pricing=pricing, record_history='pivots')
+    res = solver(case['c'], case['A'], case['b'], case['senses'], pricing=pricing, record_history='pivots',
+                 backend='integer')
+    assert res.status == exact.status
+    assert res.x == exact.x
+    assert res.objective == exact.objective
+    assert res.alternative == exact.alternative
+    # те же пивоты и та же финальная таблица в точных значениях
+    assert len(res.history) == len(exact.history)
+    if exact.status == 'optimal':
+        assert res.tableau.to_fractions() == exact.tableau
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_integer_random_exact(seed):
+    c, A, b = random_problem(seed)
+    exact = simplex(c, A, b, record_history='none')
+    res = simplex(c, A, b, backend='integer', record_history='none')
+    assert res.status == exact.status == 'optimal'
+    assert res.tableau.to_fractions() == exact.tableau
+    T = res.tableau
+    assert isinstance(T, IntegerTableau) and T.D > 0
+    assert all(isinstance(v, int) for row in T.rows for v in row)
+    # базисные столбцы — единичные векторы
+    for i, var in enumerate(res.basis):
+        if var < len(c):
+            assert [T[k][var] for k in range(len(b))] == [int(k == i) for k in range(len(b))]
+
+
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+def test_ratio_tests_stay_in_integers(monkeypatch, solver):
+    import importlib
+    integer = importlib.import_module('simplex.integer')
+    c, A, b = random_problem(1)
+    exact = solver(c, A, b, pricing='bland', record_history='none')
+    be = integer.IntegerBackend()
+
+    def no_fractions(name):
+        method = getattr(be, name)
+
+        def wrapped(*args):
+            # ratio tests and dual pricing must not build a Fraction
+            with monkeypatch.context() as patch:
+                patch.setattr(integer, 'F', None)
+                return method(*args)
+        return wrapped
+
+    for name in ('leaving', 'dual_entering', 'negative_rhs', 'row_norms'):
+        setattr(be, name, no_fractions(name))
+    res = solver(c, A, b, pricing='bland', record_history='none', backend=be)
+    assert res.objective == exact.objective and res.x == exact.x
+
+
+def test_integer_history_replay():
+    case = CASES[5]
+    full = simplex(case['c'], case['A'], case['b'], case['senses'], backend='integer')
+    assert all(isinstance(tab, IntegerTableau) for tab in full.history)
+    log = simplex(case['c'], case['A'], case['b'], case['senses'], backend='integer', record_history='pivots')
+    assert log.history.tableaus() == full.history
+    assert log.history.tableau() == log.tableau
+
+
+def test_integer_with_bounds_and_warm_start():
+    c, A, b = [3, 2], [[1, 1], [F(1, 2), 1]], [10, 6]
+    bounds = [(F(1, 3), 4), (0, F(5, 2))]
+    exact = simplex(c, A, b, bounds=bounds)
+    res = simplex(c, A, b, bounds=bounds, backend='integer')
+    assert res.x == exact.x and res.objective == exact.objective
+    first = simplex(c, A, b, backend='integer')
+    warm = simplex(c, A, [9, 6], backend='integer', warm_start=first.basis)
+    assert warm.objective == simplex(c, A, [9, 6]).objective
+
+
+def test_integer_branch_and_bound():
+    c, A, b = [10, 13, 18, 31, 7, 15], [[11, 15, 20, 35, 10, 33], [3, 4, 5, 7, 2, 6]], [47, 15]
+    exact, x = solve_integer(c, A, b)
+    res, y = solve_integer(c, A, b, backend='integer')
+    assert y == x
+    assert res.objective == exact.objective
+
+
+def test_integer_accepts_sparse_input():
+    from scipy import sparse as sp
+    case = CASES[0]
+    res = simplex(case['c'], sp.csr_matrix(case['A']), case['b'], backend='integer')
+    assert res.x == simplex(case['c'], case['A'], case['b']).x
+
+
+def test_integer_warm_start_negative_pivots():
+    # installing this basis pivots on elements equal to -D
+    c, A, b, senses = [-1], [[1], [2], [4], [-5], [-2]], [9, 10, 3, 15, 20], ['<=', '==', '>=', '<=', '<=']
+    exact = simplex(c, A, b, senses, warm_start=[1, 2, 0, 3, 4])
+    res = simplex(c, A, b, senses, backend='integer', warm_start=[1, 2, 0, 3, 4])
+    assert res.tableau.to_fractions() == exact.tableau
+    assert res.objective == exact.objective == -5
@@ -0,0 +1,150 @@
+"""
+Pytest tests for the Mehrotra predictor-corrector interior-point solver and its simplex
+crossover, checked against SciPy and the exact simplex backends.
+"""
+import random
+
+import numpy as np
+import pytest
+from scipy import sparse as sp
+from scipy.optimize import linprog
+
+from simplex import interior_point, simplex
+
+
+def random_problem(seed, mixed=True):
+    rng = random.Random(seed)
+    m, n = rng.randint(2, 25), rng.randint(2, 25)
+    A = [[rng.randint(0, 9) for _ in range(n)] for _ in range(m)]
+    senses = [rng.choice(['<=', '<=', '<=', '>=', '==']) if mixed else '<=' for _ in range(m)]
+    # '>=' and '==' rows get a small right-hand side, so most problems stay feasible
+    b = [rng.randint(50, 200) if s == '<=' else rng.randint(1, 10) for s in senses]
+    c = [rng.randint(-3, 10) for _ in range(n)]
+    return c, A, b, senses
+
+
+def transportation(seed, k=5):
+    """Транспортная задача: ранг строк-равенств на единицу меньше их числа."""
+    rng = random.Random(seed)
+    supply = [rng.randint(5, 20) for _ in range(k)]
+    demand = list(supply)
+    rng.shuffle(demand)
+    A = [[int(j // k == i) for j in range(k * k)] for i in range(k)]
+    A += [[int(j % k == i) for j in range(k * k)] for i in range(k)]
+    c = [-rng.randint(1, 9) for _ in range(k * k)]
+    return c, A, supply + demand, ['=='] * (2 * k)
+
+
+def scipy_solve(c, A, b, senses):
+    sign = {'<=': 1, '>=': -1}
+    ub = [(sign[s], row, v) for row, v, s in zip(A, b, senses) if s != '==']
+    eq = [(row, v) for row, v, s in zip(A, b, senses) if s == '==']
+    res = linprog(
+        [-v for v in c],
+        A_ub=[[s * a for a in row] for s, row, _ in ub] or None, b_ub=[s * v for s, _, v in ub] or None,
+        A_eq=[row for row, _ in eq] or None, b_eq=[v for _, v in eq] or None,
+        method='highs'
+    )
+    return {0: 'optimal', 2: 'infeasible', 3: 'unbounded'}[res.status], -res.fun if res.status == 0 else None
+
+
+@pytest.mark.parametrize("crossover", [False, True])
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_scipy(seed, crossover):
+    problem = random_problem(seed, mixed=seed % 2 == 0)
+    status, objective = scipy_solve(*problem)
+    res = interior_point(*problem, crossover=crossover)
+    assert res.status == status
+    if status == 'optimal':
+        assert res.objective == pytest.approx(objective, rel=1e-7, abs=1e-7)
+        assert res.objective == pytest.approx(sum(ci * xi for ci, xi in zip(problem[0], res.x)), rel=1e-7, abs=1e-7)
+        assert (res.basis is not None) == crossover
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'sparse', 'integer', 'float'])
+def test_crossover_gives_exact_vertex(backend):
+    c, A, b, senses = random_problem(7)
+    exact = simplex(c, A, b, senses)
+    res = interior_point(c, A, b, senses, backend=backend, record_history='pivots')
+    assert res.status == 'optimal'
+    if backend == 'float':
+        assert res.objective == pytest.approx(exact.objective)
+    else:
+        assert res.objective == exact.objective and res.x == exact.x
+    # the barrier point already identifies the optimal basis: no Phase I
+    assert 'phase1' not in res.stats.pivots
+    assert res.tableau is not None and len(res.history) == res.stats.total_pivots
+    assert res.duals == pytest.approx(exact.duals)
+    assert res.alternative == exact.alternative
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_degenerate_equalities(seed):
+    problem = transportation(seed)
+    _, objective = scipy_solve(*problem)
+    point = interior_point(*problem, crossover=False)
+    assert point.status == 'optimal' and point.objective == pytest.approx(objective, rel=1e-7)
+    vertex = interior_point(*problem, backend='fraction')
+    assert vertex.objective == objective
+    assert all(v == int(v) for v in vertex.x)
+
+
+@pytest.mark.parametrize("crossover", [False, True])
+@pytest.mark.parametrize("problem, status", [
+    (([1, 1], [[1, -1]], [1], ['<=']), 'unbounded'),
+    (([1, 1], [[1, 1], [1, 1]], [1, 2], ['<=', '>=']), 'infeasible'),
+    (([1, 2], [[1, 1], [1, 0]], [4, 5], ['<=', '>=']), 'infeasible'),
+    # more equations than columns: K z = b has no solution at all
+    (([1], [[1], [2]], [1, 3], ['==', '==']), 'infeasible'),
+    # z diverges before K z = b holds: growth alone does not prove unboundedness
+    (([-1, 5], [[9.0, 0.0], [9000, 9], [6000, 0]], [0.019, 7, 40], ['<=', '>=', '>=']), 'infeasible'),
+    # the iterates stall with z·w -> 0 while K z = b keeps its residual
+    (([-1], [[-991.2169497951127], [1], [708.2980208314009]], [5.673399586991728, -9.480486898547728,
+                                                                 46.289723239295185], ['==', '>=', '>=']),
+     'infeasible'),
+])
+def test_infeasible_and_unbounded(problem, status, crossover):
+    res = interior_point(*problem, crossover=crossover)
+    assert res.status == status
+    assert res.x == [] and res.basis is None
+
+
+def test_crossover_defaults_to_float():
+    c, A, b, senses = random_problem(7)
+    res = interior_point(c, A, b, senses)
+    assert isinstance(res.tableau, np.ndarray)
+    assert res.objective == pytest.approx(simplex(c, A, b, senses).objective)
+
+
+def test_sparse_input():
+    c, A, b, senses = random_problem(4)
+    dense = interior_point(c, A, b, senses, crossover=False)
+    for matrix in (sp.csr_matrix(A), tuple(map(list, (sp.csr_matrix(A).data, sp.csr_matrix(A).indices,
+                                                       sp.csr_matrix(A).indptr)))):
+        res = interior_point(c, matrix, b, senses, crossover=False)
+        assert res.x == pytest.approx(dense.x)
+
+
+def test_iterations_do_not_grow_with_size():
+    rng = random.Random(0)
+    counts = []
+    for m in (20, 80, 160):
+        A = [[rng.uniform(0, 10) for _ in range(2 * m)] for _ in range(m)]
+        b = [rng.uniform(50, 100) for _ in range(m)]
+        c = [rng.uniform(1, 10) for _ in range(2 * m)]
+        res = interior_point(c, A, b, crossover=False)
+        assert res.objective == pytest.approx(scipy_solve(c, A, b, ['<='] * m)[1], rel=1e-7)
+        counts.append(res.stats.barrier_iterations)
+    assert max(counts) <= 30
+    assert res.stats.phase_time['barrier'] > 0
+
+
+def test_iteration_limit():
+    problem = random_problem(3)
+    res = interior_point(*problem, crossover=False, iteration_limit=2)
+    assert res.status == 'iteration_limit' and res.x == []
+    assert res.stats.barrier_iterations == 2
+    # crossover still finishes the solve from the unfinished barrier point
+    res = interior_point(*problem, iteration_limit=2)
+    assert res.status == scipy_solve(*problem)[0] == 'optimal'
+    assert res.stats.as_dict()['barrier_iterations'] == 2
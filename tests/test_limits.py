@@ -0,0 +1,140 @@
+"""
+Pytest tests for time, iteration and node limits and the best-so-far results they return.
+"""
+import pytest
+
+from simplex import simplex, dual_simplex, solve_integer
+
+# Klee-Minty cube, n = 6: Dantzig's rule visits all 64 vertices
+KLEE_MINTY = (
+    [32, 16, 8, 4, 2, 1],
+    [[2 ** (i - j + 1) if j < i else int(j == i) for j in range(6)] for i in range(6)],
+    [5 ** (i + 1) for i in range(6)],
+)
+
+KNAPSACK = ([10, 13, 18, 31, 7, 15], [[11, 15, 20, 35, 10, 33], [3, 4, 5, 7, 2, 6]], [47, 15])
+
+
+def feasible(x, A, b):
+    return all(v >= -1e-9 for v in x) and all(
+        sum(a * v for a, v in zip(row, x)) <= rhs + 1e-9 for row, rhs in zip(A, b)
+    )
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'integer'])
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+def test_iteration_limit_returns_feasible_point(backend, solver):
+    c, A, b = KLEE_MINTY
+    full = solver(c, A, b, pricing='dantzig', backend=backend)
+    res = solver(c, A, b, pricing='dantzig', backend=backend, iteration_limit=40)
+    assert res.status == 'iteration_limit'
+    assert res.stats.total_pivots == 40 < full.stats.total_pivots
+    assert feasible(res.x, A, b)
+    assert res.objective < full.objective
+    assert res.objective == pytest.approx(sum(ci * v for ci, v in zip(c, res.x)))
+
+
+def test_iteration_limit_in_phase1_has_no_point():
+    c, A, b = KLEE_MINTY
+    # equality rows start from artificials: the crash pivots are Phase I steps
+    res = simplex(c, A, b, ['=='] * 6, pricing='dantzig', iteration_limit=3)
+    assert res.status == 'iteration_limit'
+    assert res.x == [] and res.objective is None
+    assert res.tableau is not None
+
+
+def test_limit_not_reported_when_solve_finishes():
+    c, A, b = KLEE_MINTY
+    full = simplex(c, A, b, pricing='dantzig')
+    res = simplex(c, A, b, pricing='dantzig', iteration_limit=full.stats.total_pivots)
+    assert res.status == 'optimal' and res.objective == full.objective
+
+
+def test_dual_phase_limit_gives_bound():
+    c, A = [3, 2], [[1, 1], [0.5, 1]]
+    first = simplex(c, A, [10, 6])
+    # the warm start basis is dual feasible only, so the stop happens in the dual phase
+    res = simplex(c, A, [10, 2], warm_start=first.basis, iteration_limit=2)
+    assert res.status == 'iteration_limit'
+    assert res.x == []
+    assert res.bound >= simplex(c, A, [10, 2]).objective
+
+
+def test_bounded_limit_respects_bounds():
+    c, A, b = KLEE_MINTY
+    bounds = [(1, None)] * 6
+    full = simplex(c, A, b, pricing='dantzig', bounds=bounds)
+    res = simplex(c, A, b, pricing='dantzig', bounds=bounds, iteration_limit=full.stats.total_pivots - 1)
+    assert res.status == 'iteration_limit'
+    assert all(v >= 1 - 1e-9 for v in res.x) and feasible(res.x, A, b)
+    assert res.objective < full.objective
+
+
+def test_time_limit():
+    c, A, b = KLEE_MINTY
+    res = simplex(c, A, b, time_limit=0)
+    assert res.status == 'time_limit'
+    res = simplex(c, A, b, time_limit=60)
+    assert res.status == 'optimal'
+
+
+def test_limits_with_presolve():
+    c, A, b = KLEE_MINTY
+    res = simplex(c, A, b, pricing='dantzig', presolve=True, iteration_limit=40)
+    assert res.status == 'iteration_limit'
+    assert len(res.x) == 6 and feasible(res.x, A, b)
+
+
+def test_node_limit_keeps_incumbent_and_bound():
+    c, A, b = KNAPSACK
+    full, _ = solve_integer(c, A, b, node_selection='depth')
+    res, x = solve_integer(c, A, b, node_selection='depth', node_limit=full.stats.nodes // 2)
+    assert res.status == 'node_limit'
+    assert res.stats.nodes == full.stats.nodes // 2
+    assert feasible(x, A, b) and all(v == int(v) for v in x)
+    assert res.objective <= full.objective <= res.bound + 1e-9
+
+
+def test_node_limit_without_incumbent():
+    c, A, b = KNAPSACK
+    res, x = solve_integer(c, A, b, node_limit=1)
+    assert res.status == 'node_limit'
+    assert x is None
+    assert res.bound >= solve_integer(c, A, b)[0].objective
+
+
+@pytest.mark.parametrize("limits, status", [
+    ({'time_limit': 0}, 'time_limit'),
+    # the root LP starts from the slack basis and needs a single pivot
+    ({'iteration_limit': 0}, 'iteration_limit'),
+])
+def test_integer_root_limits(limits, status):
+    res, x = solve_integer(*KNAPSACK, **limits)
+    assert res.status == status and x is None
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_iteration_limit_inside_node_reoptimisation(workers):
+    c, A, b = KNAPSACK
+    full, _ = solve_integer(c, A, b, workers=workers)
+    limit = (full.stats.total_pivots + full.stats.flips) // 2
+    res, x = solve_integer(c, A, b, workers=workers, iteration_limit=limit)
+    assert res.status == 'iteration_limit'
+    if workers is None:
+        # the search stops on the exact pivot, not after the node that crossed the limit
+        assert res.stats.total_pivots + res.stats.flips == limit
+    # nodes cut short go back to the queue, so the bound still covers the optimum
+    assert res.bound >= full.objective - 1e-9
+    assert x is None or (feasible(x, A, b) and res.objective <= full.objective)
+
+
+def test_time_limit_inside_node_reoptimisation(monkeypatch):
+    from types import SimpleNamespace
+    from simplex import stats
+    c, A, b = KNAPSACK
+    clock = iter(range(10 ** 6))
+    # every clock reading advances one second: the limit expires during the search
+    monkeypatch.setattr(stats, 'time', SimpleNamespace(perf_counter=lambda: next(clock)))
+    res, _ = solve_integer(c, A, b, time_limit=40)
+    assert res.status == 'time_limit'
+    assert res.bound >= solve_integer(c, A, b)[0].objective - 1e-9
@@ -0,0 +1,121 @@
+"""
+Pytest tests for the incremental LPModel: after every edit solve() must agree with
+a cold simplex() on the current problem while reusing the previous basis.
+"""
+from fractions import Fraction as F
+
+import pytest
+from scipy import sparse as sp
+
+from simplex import simplex, LPModel
+
+
+BACKENDS = ['fraction', 'float', 'sparse', 'integer']
+
+BASE = {'c': [3, 2, 4], 'A': [[1, 1, 1], [2, 0, 1], [0, 1, 2]], 'b': [5, 6, 5], 'senses': ['<='] * 3}
+
+# правки: (метод, аргументы)
+EDITS = [
+    [('add_row', ([1, 0, 1], '<=', 3)), ('add_row', ([0, 1, 1], '>=', 1)), ('set_rhs', (0, 4))],
+    [('add_column', (5, [1, 1, 1])), ('set_cost', (3, 1)), ('add_column', (F(7, 2), [F(1, 2), 0, 1]))],
+    [('remove_row', (1,)), ('add_row', ([1, 2, 0], '<=', 4)), ('remove_row', (0,))],
+    [('add_row', ([1, 1, 0], '==', 3)), ('set_rhs', (3, 2)), ('add_column', (2, [1, 0, 0, 1])),
+     ('remove_row', (3,))],
+    [('set_rhs', (1, 1)), ('set_cost', (0, -1)), ('add_row', ([F(1, 2), 1, 0], '>=', 2)), ('set_rhs', (3, 6))],
+    [('add_column', (10, [-1, 0, 0])), ('set_cost', (3, 0))],
+]
+
+
+def cold(problem):
+    return simplex(*problem, record_history='none')
+
+
+def same(res, ref):
+    assert res.status == ref.status
+    if ref.status == 'optimal':
+        assert res.objective == pytest.approx(ref.objective)
+        c, A, b, senses = res.problem
+        assert sum(ci * xi for ci, xi in zip(c, res.x)) == pytest.approx(ref.objective)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("edits", EDITS)
+def test_edits_match_cold_solve(backend, edits):
+    model = LPModel(BASE['c'], BASE['A'], BASE['b'], BASE['senses'], backend=backend)
+    same(model.solve(), cold(model.problem))
+    for method, args in edits:
+        getattr(model, method)(*args)
+        same(model.solve(), cold(model.problem))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_cutting_plane_rounds_reuse_basis(backend):
+    model = LPModel([5, 4], [[6, 4], [1, 2]], [24, 6], backend=backend)
+    res = model.solve()
+    assert res.objective == pytest.approx(21.0)
+    for cut in ([1, 1], [1, 0], [0, 1]):
+        model.add_row(cut, '<=', 3)
+        res = model.solve()
+        # the cut is restored by the dual simplex from the live tableau, no Phase I
+        assert 'phase1' not in res.stats.pivots
+        assert res.stats.total_pivots <= 2
+        same(res, cold(model.problem))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_column_generation_prices_new_column(backend):
+    model = LPModel([1, 1], [[2, 1], [1, 3]], [8, 9], backend=backend)
+    first = model.solve()
+    model.add_column(3, [1, 1])
+    res = model.solve()
+    assert 'phase1' not in res.stats.pivots and res.stats.total_pivots >= 1
+    assert res.objective > first.objective
+    same(res, cold(model.problem))
+
+
+def test_unbounded_then_bounded_again():
+    model = LPModel([1, 1], [[1, -1]], [2])
+    assert model.solve().status == 'unbounded'
+    model.add_row([0, 1], '<=', 3)
+    res = model.solve()
+    assert res.status == 'optimal'
+    assert res.x == pytest.approx([5.0, 3.0])
+
+
+def test_infeasible_after_edit_and_recovery():
+    model = LPModel([1, 1], [[1, 1]], [4])
+    model.solve()
+    model.add_row([1, 1], '>=', 6)
+    assert model.solve().status == 'infeasible'
+    model.remove_row(1)
+    assert model.solve().objective == pytest.approx(4.0)
+
+
+def test_model_result_has_sensitivity():
+    model = LPModel(BASE['c'], BASE['A'], BASE['b'])
+    model.solve()
+    model.add_row([1, 0, 1], '<=', 3)
+    res = model.solve()
+    ref = simplex(*model.problem)
+    assert res.duals == pytest.approx(ref.duals)
+    assert res.problem == ref.problem
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("edits", EDITS)
+def test_sparse_matrix_stays_sparse(backend, edits):
+    model = LPModel(BASE['c'], sp.csr_matrix(BASE['A']), BASE['b'], BASE['senses'], backend=backend)
+    same(model.solve(), cold(model.problem))
+    for method, args in edits:
+        getattr(model, method)(*args)
+        assert isinstance(model.A, tuple)
+        same(model.resolve(), cold(model.problem))
+
+
+def test_resolve_warm_starts():
+    model = LPModel([5, 4], [[6, 4], [1, 2]], [24, 6])
+    assert model.resolve().objective == pytest.approx(21.0)
+    model.add_row([1, 1], '<=', 3)
+    res = model.resolve()
+    assert 'phase1' not in res.stats.pivots
+    same(res, cold(model.problem))
@@ -0,0 +1,113 @@
+"""
+Pytest tests for the parametric RHS/cost sweep: the piecewise-linear optimal value
+function against cold re-solves at sample points of the parameter.
+"""
+from fractions import Fraction as F
+
+import pytest
+
+from simplex import simplex, parametric_rhs, parametric_cost
+
+
+BACKENDS = ['fraction', 'float', 'sparse', 'integer']
+
+RHS_CASES = [
+    {'c': [3, 2], 'A': [[1, 1], [1, 3], [2, 1]], 'b': [4, 6, 6], 'senses': ['<='] * 3,
+     'd': [1, 0, -1], 't_range': (0, 5)},
+    {'c': [1, 2], 'A': [[1, 1], [1, 2]], 'b': [5, 8], 'senses': ['>=', '=='],
+     'd': [1, -1], 't_range': (-2, 3)},
+    {'c': [0, 0, -1, 1], 'A': [[-2, -2, 1, 5], [1, 2, 2, 2], [1, 0, 1, 4], [-2, 1, 5, -2]],
+     'b': [8, 8, 9, 4], 'senses': ['<='] * 4, 'd': [-3, -4, 1, -2], 't_range': (0, 2)},
+    {'c': [-3, -2, 0, 1], 'A': [[3, -2, 3, -1], [5, -1, 5, 3], [-2, 0, 3, 3], [1, 0, 0, -1]],
+     'b': [9, 8, 11, 9], 'senses': ['>='] * 4, 'd': [2, 4, 0, -3], 't_range': (0, 3)},
+    # coefficients over three orders of magnitude: float would scale it by default
+    {'c': [5, 4000], 'A': [[6, 4000], [1, 2000]], 'b': [24, 6], 'senses': ['<='] * 2,
+     'd': [0, 2], 't_range': (0, 5)},
+]
+
+COST_CASES = [
+    {'c': [3, 2], 'A': [[1, 1], [1, 3], [2, 1]], 'b': [4, 6, 6], 'senses': ['<='] * 3,
+     'd': [-1, 2], 't_range': (-1, 5)},
+    {'c': [2, 3, 1], 'A': [[1, 1, 1], [1, 0, -1]], 'b': [6, 1], 'senses': ['<=', '>='],
+     'd': [1, -2, 1], 't_range': (-3, 3)},
+    {'c': [-1, -2], 'A': [[1, 1], [1, -1]], 'b': [2, 1], 'senses': ['>=', '<='],
+     'd': [1, 0], 't_range': (0, 4)},
+    {'c': [5, 4000], 'A': [[6, 4000], [1, 2000]], 'b': [24, 6], 'senses': ['<='] * 2,
+     'd': [3000, 0], 't_range': (0, 1)},
+]
+
+
+def resolve(c, A, b, senses):
+    return simplex(c, A, b, senses, record_history='none')
+
+
+def samples(t_range, count=13):
+    lo, hi = t_range
+    return [lo + (hi - lo) * k / (count - 1) for k in range(count)]
+
+
+def check(res, t_range, solve_at):
+    for t in samples(t_range):
+        ref = solve_at(t)
+        value = res.value(t)
+        if value is None:
+            # past the last piece the problem has no optimum
+            assert res.status != 'optimal' and t > res.pieces[-1].end
+            assert ref.status == res.status
+        else:
+            assert ref.status == 'optimal'
+            assert value == pytest.approx(ref.objective, abs=1e-9)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("case", RHS_CASES)
+def test_rhs_sweep_matches_resolves(backend, case):
+    res = parametric_rhs(case['c'], case['A'], case['b'], case['d'], case['senses'],
+                         t_range=case['t_range'], backend=backend)
+    check(res, case['t_range'], lambda t: resolve(
+        case['c'], case['A'], [bi + t * di for bi, di in zip(case['b'], case['d'])], case['senses']))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("case", COST_CASES)
+def test_cost_sweep_matches_resolves(backend, case):
+    res = parametric_cost(case['c'], case['A'], case['b'], case['d'], case['senses'],
+                          t_range=case['t_range'], backend=backend)
+    check(res, case['t_range'], lambda t: resolve(
+        [ci + t * di for ci, di in zip(case['c'], case['d'])], case['A'], case['b'], case['senses']))
+
+
+def test_rhs_breakpoints_exact():
+    res = parametric_rhs([3, 2], [[1, 1], [1, 3], [2, 1]], [4, 6, 6], [1, 0, -1], t_range=(0, 8))
+    assert res.status == 'infeasible'  # the third row needs 6 - t >= 0
+    assert res.breakpoints == [4]
+    assert [(p.start, p.end, p.objective, p.slope) for p in res.pieces] == [
+        (0, 4, F(48, 5), F(-7, 5)), (4, 6, 4, -2)]
+    assert res.value(7) is None
+
+
+def test_rhs_value_is_concave_and_continuous():
+    case = RHS_CASES[2]
+    res = parametric_rhs(case['c'], case['A'], case['b'], case['d'], case['senses'], t_range=(0, 2))
+    slopes = [p.slope for p in res.pieces]
+    assert slopes == sorted(slopes, reverse=True)
+    for left, right in zip(res.pieces, res.pieces[1:]):
+        assert left.objective + left.slope * (left.end - left.start) == right.objective
+
+
+def test_cost_sweep_unbounded_and_convex():
+    res = parametric_cost([3, 2], [[1, 1], [1, 3], [2, 1]], [4, 6, 6], [-1, 2], t_range=(-1, 5))
+    assert res.status == 'optimal'
+    assert res.breakpoints == [F(-1, 5), F(7, 5)]
+    slopes = [p.slope for p in res.pieces]
+    assert slopes == sorted(slopes)
+
+    res = parametric_cost([-1, -2], [[1, 1], [1, -1]], [2, 1], [1, 0], ['>=', '<='], t_range=(0, 4))
+    assert res.status == 'unbounded'
+    assert res.pieces[-1].end == 3  # the ray (1, 1) gains t - 3
+
+
+def test_unbounded_start_has_no_pieces():
+    res = parametric_rhs([1, 1], [[1, 1]], [5], [1], ['>='], t_range=(0, 1), backend='fraction')
+    assert res.status == 'unbounded'
+    assert res.pieces == [] and res.value(0) is None
@@ -0,0 +1,131 @@
+"""
+Pytest tests for the presolve stage and postsolve back to the original variables.
+"""
+from fractions import Fraction as F
+
+import pytest
+from scipy import sparse as sp
+from scipy.optimize import linprog
+
+from simplex import simplex, dual_simplex, solve_integer
+from simplex.presolve import presolve
+
+
+CASES = [
+    # singleton equality fixes x2, empty row and empty column with c < 0
+    {'c': [3, 2, -1], 'A': [[1, 2, 0], [0, 1, 0], [0, 0, 0]], 'b': [6, 1, 5], 'senses': ['<=', '==', '<=']},
+    # redundant >= row with non-negative coefficients and b <= 0
+    {'c': [1, 1], 'A': [[1, 1], [2, 3]], 'b': [4, 0], 'senses': ['<=', '>=']},
+    # duplicate rows: the tighter bound stays
+    {'c': [2, 1], 'A': [[1, 1], [1, 1], [1, 0]], 'b': [10, 6, 4], 'senses': None},
+    # chain of singletons after fixing
+    {'c': [1, 2, 3], 'A': [[1, 0, 0], [1, 1, 0], [1, 1, 1]], 'b': [1, 3, 6], 'senses': ['==', '==', '<=']},
+    # nothing to reduce
+    {'c': [3, 5], 'A': [[1, 0], [0, 2], [3, 2]], 'b': [4, 12, 18], 'senses': None},
+    # everything reduces away
+    {'c': [1, 1], 'A': [[1, 0], [0, 2]], 'b': [2, 3], 'senses': ['==', '==']},
+]
+
+
+def scipy_max(case):
+    senses = case['senses'] or ['<='] * len(case['b'])
+    A_ub, b_ub, A_eq, b_eq = [], [], [], []
+    for row, rhs, s in zip(case['A'], case['b'], senses):
+        if s == '<=':
+            A_ub.append(row); b_ub.append(rhs)
+        elif s == '>=':
+            A_ub.append([-v for v in row]); b_ub.append(-rhs)
+        else:
+            A_eq.append(row); b_eq.append(rhs)
+    res = linprog([-v for v in case['c']], A_ub=A_ub or None, b_ub=b_ub or None,
+                  A_eq=A_eq or None, b_eq=b_eq or None, method='highs')
+    return -res.fun
+
+
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+@pytest.mark.parametrize("case", CASES)
+def test_presolve_matches_plain(solver, case):
+    plain = solver(case['c'], case['A'], case['b'], case['senses'])
+    res = solver(case['c'], case['A'], case['b'], case['senses'], presolve=True)
+    assert res.status == plain.status == 'optimal'
+    assert res.objective == pytest.approx(scipy_max(case))
+    assert res.objective == pytest.approx(plain.objective)
+    senses = case['senses'] or ['<='] * len(case['b'])
+    for row, rhs, s in zip(case['A'], case['b'], senses):
+        lhs = sum(a * x for a, x in zip(row, res.x))
+        assert {'<=': lhs <= rhs + 1e-9, '>=': lhs >= rhs - 1e-9, '==': abs(lhs - rhs) <= 1e-9}[s]
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_presolve_integer(case):
+    plain, _ = solve_integer(case['c'], case['A'], case['b'], case['senses'])
+    res, x = solve_integer(case['c'], case['A'], case['b'], case['senses'], presolve=True)
+    assert res.status == plain.status
+    if plain.status == 'optimal':
+        assert res.objective == pytest.approx(plain.objective)
+        assert all(isinstance(v, int) for v in x)
+
+
+def test_reductions_log():
+    case = CASES[0]
+    p = presolve(case['c'], case['A'], case['b'], case['senses'])
+    kinds = [r[0] for r in p.reductions]
+    assert 'empty_row' in kinds and 'fixed' in kinds and 'empty_column' in kinds
+    # x2 == 1 fixes x2, then x1 + 2 <= 6 turns into the bound x1 <= 4
+    assert ('bound_row', 1, 1) in p.reductions and ('bound_row', 0, 0) in p.reductions
+    assert p.fixed == {0: 4, 1: 1, 2: 0}
+    assert p.cols == [] and p.rows == []
+    assert p.offset == 14
+    assert p.postsolve([]) == [4.0, 1.0, 0.0]
+
+
+def test_singleton_rows_become_bounds():
+    p = presolve([2, 1], [[1, 1], [1, 0], [0, -2]], [10, 4, -2])
+    assert p.rows == [0] and p.A == [[1, 1]]
+    assert p.bounds == [(0, 4), (1, None)]
+    res = simplex([2, 1], [[1, 1], [1, 0], [0, -2]], [10, 4, -2], presolve=True)
+    assert res.objective == 14 and res.x == [4.0, 6.0]
+
+
+def test_duplicate_rows_keep_tightest():
+    p = presolve([2, 1, 1], [[1, 1, 1], [1, 1, 1], [1, 0, 2]], [10, 6, 4])
+    assert ('duplicate_row', 1, 0) in p.reductions
+    assert p.rows == [0, 2] and p.b == [6, 4]
+
+
+@pytest.mark.parametrize("case", [
+    {'c': [1, 1], 'A': [[1, 0], [0, 0]], 'b': [1, -1], 'senses': None},          # 0 <= -1
+    {'c': [1, 1], 'A': [[1, 1], [1, 0]], 'b': [2, -1], 'senses': ['<=', '==']},  # x1 == -1
+    {'c': [1, 1], 'A': [[1, 1], [1, 1]], 'b': [2, 3], 'senses': ['==', '==']},   # conflicting duplicates
+    {'c': [1, 1], 'A': [[1, 2]], 'b': [-3], 'senses': None},                     # a >= 0, b < 0
+])
+def test_presolve_detects_infeasible(case):
+    assert presolve(case['c'], case['A'], case['b'], case['senses']).status == 'infeasible'
+    assert simplex(case['c'], case['A'], case['b'], case['senses'], presolve=True).status == 'infeasible'
+
+
+def test_presolve_unbounded_empty_column():
+    res = simplex([1, 1], [[1, 0]], [3], presolve=True)
+    assert res.status == 'unbounded'
+    assert simplex([1, 1], [[1, 0]], [3]).status == 'unbounded'
+
+
+def test_presolve_zero_cost_empty_column_is_alternative():
+    res = simplex([1, 0], [[1, 0]], [3], presolve=True)
+    assert res.status == 'optimal' and res.objective == 3
+    assert res.alternative
+
+
+def test_presolve_fractional_fix_is_integer_infeasible():
+    res, x = solve_integer([1, 1], [[2, 0], [1, 1]], [1, 4], ['==', '<='], presolve=True)
+    assert res.status == 'infeasible' and x is None
+
+
+def test_presolve_keeps_sparse_input_sparse():
+    A = sp.csr_matrix([[1, 2, 1], [0, 1, 0], [0, 0, 0]])
+    p = presolve([3, 2, -1], A, [6, 1, 5], ['<=', '==', '<='])
+    assert isinstance(p.A, tuple)
+    data, indices, indptr = p.A
+    assert data == [F(1), F(1)] and indices == [0, 1] and indptr == [0, 2]
+    res = simplex([3, 2, -1], A, [6, 1, 5], ['<=', '==', '<='], presolve=True)
+    assert res.objective == 14 and res.x == [4, 1.0, 0.0]
@@ -0,0 +1,106 @@
+"""
+Pytest tests for pricing rules (entering variable selection).
+"""
+from fractions import Fraction
+
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from simplex import simplex, dual_simplex
+from simplex.pricing import PRICING, get_pricing
+
+RULES = list(PRICING)
+
+
+@pytest.mark.parametrize("rule", RULES)
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+@pytest.mark.parametrize("case", [
+    {'c': [3, 2, 4], 'A': [[1, 1, 1], [2, 0, 1], [0, 1, 2]], 'b': [5, 6, 5], 'senses': None},
+    {'c': [1, 2], 'A': [[1, 1], [1, 2]], 'b': [5, 8], 'senses': ['>=', '==']},
+    {'c': [1, 1], 'A': [[1, -1]], 'b': [1], 'senses': None},
+    {'c': [1, 0], 'A': [[1, -2], [-1, 1], [0, 1]], 'b': [0, 0, 1], 'senses': None},
+])
+def test_rules_match_bland(rule, solver, case):
+    args = (case['c'], case['A'], case['b'], case['senses'])
+    ref = solver(*args)
+    res = solver(*args, pricing=rule)
+    assert res.status == ref.status
+    if ref.status == 'optimal':
+        assert res.objective == ref.objective
+
+
+@pytest.mark.parametrize("rule", RULES)
+def test_beale_degenerate(rule):
+    """
+    Пример Била: при правиле Данцига без защиты возможно зацикливание,
+    оптимум x1 = x3 = 1, z = 5/4.
+    """
+    c = [Fraction(3, 4), -20, Fraction(1, 2), -6]
+    A = [
+        [Fraction(1, 4), -8, -1, 9],
+        [Fraction(1, 2), -12, Fraction(-1, 2), 3],
+        [0, 0, 1, 0],
+    ]
+    b = [0, 0, 1]
+    res = simplex(c, A, b, pricing=rule)
+    assert res.status == 'optimal'
+    assert res.objective == 1.25
+    assert res.x == [1.0, 0, 1.0, 0]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_rules_need_fewer_pivots(seed):
+    rng = np.random.default_rng(seed)
+    m, n = 30, 40
+    A = rng.uniform(0, 10, size=(m, n))
+    b = rng.uniform(10, 100, size=m)
+    c = rng.uniform(1, 5, size=n)
+    lp = linprog(-c, A_ub=A, b_ub=b, bounds=(0, None), method='highs')
+
+    pivots = {}
+    for rule in RULES:
+        res = simplex(c.tolist(), A.tolist(), b.tolist(), backend='float',
+                      pricing=rule, record_history='pivots')
+        assert res.status == 'optimal'
+        assert pytest.approx(res.objective, rel=1e-9) == -lp.fun
+        pivots[rule] = len(res.history)
+    assert all(pivots[rule] < pivots['bland'] for rule in RULES if rule != 'bland')
+
+
+def test_unknown_pricing():
+    with pytest.raises(ValueError):
+        get_pricing('fastest')
+
+
+def test_stalling_falls_back_to_bland(monkeypatch):
+    from simplex import base
+    case = ([1, 0], [[1, -2], [-1, 1], [0, 1]], [0, 0, 1])
+    bland = simplex(*case, record_history='pivots')
+    # с нулевым порогом каждый шаг считается застоем
+    monkeypatch.setattr(base, 'STALL_LIMIT', 0)
+    res = simplex(*case, pricing='steepest', record_history='pivots')
+    assert list(res.history) == list(bland.history)
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse', 'integer'])
+def test_partial_pricing_reads_one_window(backend, monkeypatch):
+    from simplex.base import get_backend
+    rng = np.random.default_rng(5)
+    m, n = 10, 40
+    A = rng.integers(0, 10, size=(m, n)).tolist()
+    b = rng.integers(10, 100, size=m).tolist()
+    c = rng.integers(1, 5, size=n).tolist()
+    be = get_backend(backend)
+    windows = []
+    original = type(be).negative_costs
+
+    def spy(self, T, start=0, stop=None):
+        windows.append((start, stop))
+        return original(self, T, start, stop)
+
+    monkeypatch.setattr(type(be), 'negative_costs', spy)
+    res = simplex(c, A, b, backend=be, pricing=get_pricing('partial'))
+    assert res.objective == pytest.approx(simplex(c, A, b).objective)
+    # only windows of 8 columns are priced, never the whole cost row at once
+    assert windows and all(stop is not None and stop - start <= 8 for start, stop in windows)
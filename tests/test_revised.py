@@ -0,0 +1,62 @@
+"""
+Pytest tests for the revised simplex engine, comparing against the tableau simplex and SciPy.
+"""
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from simplex import simplex, revised_simplex
+
+
+@pytest.mark.parametrize("case", [
+    {'c': [3, 2], 'A': [[1, 2], [4, 0]], 'b': [4, 12], 'senses': None},
+    {'c': [1, 1], 'A': [[1, -1]], 'b': [1], 'senses': None},
+    {'c': [1, 1], 'A': [[1, 0], [0, 1], [1, 1]], 'b': [1, 1, 2], 'senses': None},
+    {'c': [1, 0], 'A': [[1, -2], [-1, 1], [0, 1]], 'b': [0, 0, 1], 'senses': None},
+    {'c': [3, 2, 4], 'A': [[1, 1, 1], [2, 0, 1], [0, 1, 2]], 'b': [5, 6, 5], 'senses': None},
+    {'c': [1, 2], 'A': [[1, 1], [1, 2]], 'b': [5, 8], 'senses': ['>=', '==']},
+    {'c': [2, 3], 'A': [[1, 1]], 'b': [4], 'senses': ['==']},
+    {'c': [1], 'A': [[1], [1]], 'b': [1, 0], 'senses': ['<=', '>=']},
+    {'c': [1, 1], 'A': [[1, 1]], 'b': [5], 'senses': ['==']},
+])
+def test_revised_matches_tableau(case):
+    exact = simplex(case['c'], case['A'], case['b'], case['senses'])
+    res = revised_simplex(case['c'], case['A'], case['b'], case['senses'])
+    assert res.status == exact.status
+    if exact.status == 'optimal':
+        assert pytest.approx(res.objective, rel=1e-9, abs=1e-9) == exact.objective
+        assert res.alternative == exact.alternative
+        if not exact.alternative:
+            assert res.x == pytest.approx(exact.x, rel=1e-9, abs=1e-9)
+
+
+def test_revised_negative_rhs():
+    # -x1 <= -1 (x1 >= 1), x1 + x2 <= 3
+    res = revised_simplex([-1, 1], [[-1, 0], [1, 1]], [-1, 3])
+    assert res.status == 'optimal'
+    assert pytest.approx(res.objective) == 1.0
+    assert res.x == pytest.approx([1.0, 2.0])
+
+
+@pytest.mark.parametrize("seed", range(4))
+@pytest.mark.parametrize("refactor_every", [1, 5, 50])
+def test_revised_wide_random_against_scipy(seed, refactor_every):
+    rng = np.random.default_rng(seed)
+    m, n = 15, 200
+    A = rng.uniform(0, 10, size=(m, n))
+    b = rng.uniform(50, 100, size=m)
+    c = rng.uniform(1, 5, size=n)
+
+    res = revised_simplex(c, A, b, refactor_every=refactor_every)
+    lp = linprog(-c, A_ub=A, b_ub=b, bounds=(0, None), method='highs')
+
+    assert lp.success
+    assert res.status == 'optimal'
+    assert pytest.approx(res.objective, rel=1e-7) == -lp.fun
+    assert np.all(A @ np.array(res.x) <= b + 1e-7)
+
+
+def test_revised_infeasible():
+    # x <= 1 и x >= 3 несовместны
+    res = revised_simplex([1], [[1], [1]], [1, 3], ['<=', '>='])
+    assert res.status == 'infeasible'
@@ -0,0 +1,128 @@
+"""
+Pytest tests for row/column scaling of badly scaled models in float mode, checked against
+SciPy and the exact Fraction backend.
+"""
+import math
+import random
+from fractions import Fraction as F
+
+import numpy as np
+import pytest
+from scipy.optimize import linprog
+
+from simplex import simplex, dual_simplex
+from simplex.base import get_backend
+from simplex.scaling import scale_factors
+
+
+def badly_scaled(seed, m=8, n=8):
+    """Случайная задача с коэффициентами от 1e-4 до 1e6 (масштабы строк и столбцов)."""
+    rng = random.Random(seed)
+    R = [10.0 ** rng.randint(-4, 5) for _ in range(m)]
+    S = [10.0 ** rng.randint(-2, 2) for _ in range(n)]
+    A = [[R[i] * S[j] * rng.choice([0, rng.randint(1, 9)]) for j in range(n)] for i in range(m)]
+    b = [R[i] * rng.randint(5, 30) for i in range(m)]
+    c = [S[j] * rng.randint(0, 6) for j in range(n)]
+    senses = [rng.choice(['<=', '<=', '>=']) for _ in range(m)]
+    # ограничивающая строка, чтобы задача не уходила на бесконечность
+    A.append([1000.0] * n)
+    b.append(1e6)
+    senses.append('<=')
+    return c, A, b, senses
+
+
+def scipy_objective(c, A, b, senses):
+    sign = [-1 if s == '>=' else 1 for s in senses]
+    res = linprog([-v for v in c], A_ub=[[s * a for a in row] for s, row in zip(sign, A)],
+                  b_ub=[s * v for s, v in zip(sign, b)], method='highs')
+    return -res.fun if res.status == 0 else None
+
+
+def test_factors_are_powers_of_two_and_equilibrate():
+    c, A, b, senses = badly_scaled(0)
+    scaling = scale_factors(A, len(b), len(c))
+    assert scaling is not None
+    for f in list(scaling.row) + list(scaling.col):
+        assert math.log2(f) == int(math.log2(f))
+    original = np.abs(np.array(A))
+    scaled = original * scaling.row[:, None] * scaling.col[None, :]
+    spread = scaled[scaled > 0].max() / scaled[scaled > 0].min()
+    assert spread < 1e-3 * original[original > 0].max() / original[original > 0].min()
+    # после выравнивания наибольший элемент столбца близок к 1 (с точностью до степени двойки)
+    assert np.all(scaled.max(axis=0) >= 0.5) and np.all(scaled.max(axis=0) <= 2)
+
+
+def test_well_scaled_model_is_left_alone():
+    assert scale_factors([[1, 2], [3, 4]], 2, 2) is None
+    assert scale_factors([[0, 0]], 1, 2) is None
+
+
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+@pytest.mark.parametrize("seed", range(12))
+def test_scaled_float_matches_scipy(solver, seed):
+    c, A, b, senses = badly_scaled(seed)
+    ref = scipy_objective(c, A, b, senses)
+    res = solver(c, A, b, senses, backend='float', record_history='none')
+    assert res.status == ('optimal' if ref is not None else 'infeasible')
+    if ref is not None:
+        assert res.objective == pytest.approx(ref, rel=1e-7)
+        assert res.objective == pytest.approx(sum(ci * xi for ci, xi in zip(c, res.x)), rel=1e-7)
+        for row, rhs, s in zip(A, b, senses):
+            lhs = sum(a * x for a, x in zip(row, res.x))
+            assert (lhs <= rhs * (1 + 1e-7) + 1e-7) if s == '<=' else (lhs >= rhs * (1 - 1e-7) - 1e-7)
+
+
+def test_duals_and_basis_are_in_original_units():
+    c, A, b, senses = [3, 2e4], [[1e-3, 2], [4e2, 1e5], [1, 0]], [4, 1.2e6, 3.5], ['<=', '<=', '<=']
+    exact = simplex(c, A, b, senses, backend='fraction')
+    res = simplex(c, A, b, senses, backend='float')
+    assert res.basis is not None and sorted(res.basis) == sorted(exact.basis)
+    assert res.x == pytest.approx(exact.x)
+    assert res.duals == pytest.approx(exact.duals)
+    assert res.reduced_costs == pytest.approx(exact.reduced_costs)
+    # базис подходит как warm_start исходной задачи
+    warm = simplex(c, A, b, senses, backend='fraction', warm_start=res.basis, record_history='pivots')
+    assert warm.objective == exact.objective and 'phase1' not in warm.stats.pivots
+
+
+def test_scaling_with_bounds_and_sparse_input():
+    c, A, b, senses = badly_scaled(3, m=5, n=6)
+    bounds = [(0, 50 / c_j if c_j else None) for c_j in c]
+    exact = simplex(c, A, b, senses, bounds=bounds)
+    res = simplex(c, A, b, senses, backend='float', bounds=bounds)
+    assert res.status == exact.status == 'optimal'
+    assert res.objective == pytest.approx(exact.objective, rel=1e-9)
+    for x, (lo, hi) in zip(res.x, bounds):
+        assert lo - 1e-9 <= x and (hi is None or x <= hi * (1 + 1e-9))
+    assert res.bounds.upper[0] == bounds[0][1]
+    data, indices, indptr = [], [], [0]
+    for row in A:
+        for j, a in enumerate(row):
+            if a:
+                data.append(a)
+                indices.append(j)
+        indptr.append(len(data))
+    sparse = simplex(c, (data, indices, indptr), b, senses, backend='float', bounds=bounds)
+    assert sparse.objective == pytest.approx(exact.objective, rel=1e-9)
+
+
+def test_scaling_switch():
+    c, A, b, senses = badly_scaled(5)
+    plain = simplex(c, A, b, senses, backend='float', scaling=False, record_history='pivots')
+    # журнал без масштабирования восстанавливает таблицу исходной задачи
+    assert np.allclose(plain.history.tableau(), plain.tableau)
+    exact = simplex(c, A, b, senses, backend='fraction', scaling=True)
+    assert exact.objective == pytest.approx(scipy_objective(c, A, b, senses), rel=1e-9)
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'sparse', 'integer'])
+def test_exact_backends_scale_exactly(backend):
+    c = [F(1, 3), 1000, F(2, 7)]
+    A = [[F(1, 3), 3000, 1], [1, F(1, 7), F(5, 3)], [F(1, 9), 0, 2000]]
+    b = [F(10, 3), 5, 7]
+    be = get_backend(backend)
+    plain = simplex(c, A, b, backend=backend)
+    res = simplex(c, A, b, backend=backend, scaling=True)
+    # the scaled problem stays in Fraction: the optimum is exact, not rounded through float
+    assert res.basis == plain.basis
+    assert be.objective(res.tableau) == be.objective(plain.tableau) == F(419990, 188997)
@@ -0,0 +1,142 @@
+"""
+Pytest tests for sensitivity analysis: duals and reduced costs against SciPy (HiGHS),
+ranging intervals by re-solving perturbed problems.
+"""
+import pytest
+from scipy.optimize import linprog
+
+from simplex import simplex, dual_simplex
+
+
+CASES = [
+    {'c': [3, 2], 'A': [[1, 2], [4, 0]], 'b': [4, 12], 'senses': ['<=', '<='], 'bounds': None},
+    {'c': [1, 2], 'A': [[1, 1], [1, 2]], 'b': [5, 8], 'senses': ['>=', '=='], 'bounds': None},
+    {'c': [3, 2, 4], 'A': [[1, 1, 1], [2, 0, 1], [0, 1, 2]], 'b': [5, 6, 5], 'senses': ['<='] * 3, 'bounds': None},
+    {'c': [-2, -3], 'A': [[1, 1], [1, -1]], 'b': [4, 1], 'senses': ['>=', '<='], 'bounds': None},
+    {'c': [2, 3, 1], 'A': [[1, 1, 1], [1, 0, -1]], 'b': [6, 1], 'senses': ['==', '>='],
+     'bounds': [(0, 3), (1, 2), (0, None)]},
+    {'c': [3, 2], 'A': [[1, 1]], 'b': [10], 'senses': ['<='], 'bounds': [(0, 4), (0, 3)]},
+]
+
+
+def scipy_solve(case):
+    A_ub, b_ub, A_eq, b_eq = [], [], [], []
+    for row, rhs, s in zip(case['A'], case['b'], case['senses']):
+        if s == '<=':
+            A_ub.append(row); b_ub.append(rhs)
+        elif s == '>=':
+            A_ub.append([-v for v in row]); b_ub.append(-rhs)
+        else:
+            A_eq.append(row); b_eq.append(rhs)
+    return linprog([-v for v in case['c']], A_ub=A_ub or None, b_ub=b_ub or None,
+                   A_eq=A_eq or None, b_eq=b_eq or None,
+                   bounds=case['bounds'] or [(0, None)] * len(case['c']), method='highs')
+
+
+def solve(case, **kw):
+    return simplex(case['c'], case['A'], case['b'], case['senses'], bounds=case['bounds'], **kw)
+
+
+def inside(interval, base):
+    """Точки внутри интервала по обе стороны от base."""
+    lo, hi = interval
+    points = []
+    if lo is None or lo < base:
+        points.append(base - 1 if lo is None else (lo + base) / 2)
+    if hi is None or hi > base:
+        points.append(base + 1 if hi is None else (hi + base) / 2)
+    return points
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse', 'integer'])
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+@pytest.mark.parametrize("case", CASES)
+def test_duals_and_reduced_costs_against_scipy(backend, solver, case):
+    ref = scipy_solve(case)
+    res = solver(case['c'], case['A'], case['b'], case['senses'], backend=backend, bounds=case['bounds'])
+    ub = iter(ref.ineqlin.marginals)
+    eq = iter(ref.eqlin.marginals)
+    expected = []
+    for s in case['senses']:
+        # SciPy minimizes -c with '>=' rows negated
+        expected.append(-next(eq) if s == '==' else (-next(ub) if s == '<=' else next(ub)))
+    assert res.duals == pytest.approx(expected)
+    assert res.reduced_costs == pytest.approx([-(lo + up) for lo, up in zip(ref.lower.marginals,
+                                                                           ref.upper.marginals)])
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_rhs_ranges_keep_dual_price(case):
+    res = solve(case)
+    sens = res.sensitivity
+    for i, (y, interval) in enumerate(zip(sens.duals, sens.rhs_ranges)):
+        for value in inside(interval, case['b'][i]):
+            b = list(case['b'])
+            b[i] = value
+            moved = solve(dict(case, b=b))
+            assert moved.status == 'optimal'
+            assert moved.objective == pytest.approx(res.objective + y * (value - case['b'][i]))
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_rhs_range_end_is_tight(case):
+    res = solve(case)
+    for i, (lo, hi) in enumerate(res.sensitivity.rhs_ranges):
+        if hi is None:
+            continue
+        b = list(case['b'])
+        b[i] = hi + 1
+        moved = solve(dict(case, b=b))
+        # past the range end the old basis is no longer feasible
+        assert moved.status != 'optimal' or sorted(moved.basis) != sorted(res.basis)
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_cost_ranges_keep_solution(case):
+    res = solve(case)
+    for j, interval in enumerate(res.sensitivity.cost_ranges):
+        assert interval[0] is None or interval[0] <= case['c'][j]
+        assert interval[1] is None or interval[1] >= case['c'][j]
+        for value in inside(interval, case['c'][j]):
+            c = list(case['c'])
+            c[j] = value
+            moved = solve(dict(case, c=c))
+            assert moved.objective == pytest.approx(sum(cj * x for cj, x in zip(c, res.x)))
+
+
+def test_cost_range_end_is_tight():
+    case = CASES[0]
+    res = solve(case)
+    lo, hi = res.sensitivity.cost_ranges[1]
+    c = [case['c'][0], hi + 1]
+    moved = solve(dict(case, c=c))
+    assert moved.objective > sum(cj * x for cj, x in zip(c, res.x)) + 1e-9
+
+
+def test_sensitivity_on_sparse_input():
+    from scipy import sparse as sp
+    case = CASES[2]
+    dense = solve(case).sensitivity
+    res = simplex(case['c'], sp.csr_matrix(case['A']), case['b'], case['senses'])
+    assert res.duals == dense.duals
+    assert res.sensitivity.rhs_ranges == dense.rhs_ranges
+    assert res.sensitivity.cost_ranges == dense.cost_ranges
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_float_result_ranges_match_exact(case):
+    exact = solve(case).sensitivity
+    res = solve(case, backend='float')
+    # the float basis is inverted by numpy, the ranges agree with the Fraction analysis
+    for got, expected in ((res.sensitivity.rhs_ranges, exact.rhs_ranges),
+                          (res.sensitivity.cost_ranges, exact.cost_ranges)):
+        for (lo, hi), (elo, ehi) in zip(got, expected):
+            assert (lo is None) == (elo is None) and (hi is None) == (ehi is None)
+            assert (lo, hi) == (pytest.approx(elo), pytest.approx(ehi))
+
+
+def test_sensitivity_needs_optimal_basis():
+    with pytest.raises(ValueError):
+        simplex([1, 1], [[1, 0], [0, 1]], [-1, -1]).sensitivity
+    with pytest.raises(ValueError):
+        simplex([3, 2], [[1, 2], [4, 0]], [4, 12], presolve=True).duals
@@ -2,7 +2,7 @@
 Pytest tests for simplex implementation, comparing against SciPy and PuLP.
 """
 import pytest
-from simplex import simplex, SimplexResult
+from simplex import simplex, dual_simplex, SimplexResult
 
 try:
     from scipy.optimize import linprog
@@ -164,12 +164,12 @@ from fractions import Fraction
         'objective': 1.0,
         'alternative': False
     },
-    # 2. На самом деле невыполнимая задача
+    # 2. Отрицательная правая часть: x - y >= 1, луч (1, 1) неограничен
     {
         'c': [2, 3],
         'A': [[-1, 1]],
         'b': [-1],
-        'status': 'infeasible'
+        'status': 'unbounded'
     },
     # 3. Рациональные коэффициенты
     {
@@ -427,3 +427,108 @@ def test_linprog_general(c, A, b, signs, exp_status, exp_x, exp_obj):
                 err_msg=f"Expected x={exp_x}, got {res.x}"
             )
         assert pytest.approx(res.fun, rel=1e-6) == exp_obj
+
+
+# ============================== #
+# Тёплый старт из прошлого базиса
+# ============================== #
+from simplex.history import PhaseChange
+
+WARM_C = [3, 2, 4]
+WARM_A = [[1, 1, 1], [2, 0, 1], [0, 1, 2]]
+WARM_B = [5, 6, 5]
+
+
+@pytest.mark.parametrize("backend", [None, 'float', 'sparse'])
+@pytest.mark.parametrize("c, b", [
+    (WARM_C, WARM_B),            # та же задача
+    (WARM_C, [6, 7, 5]),         # новая правая часть, базис остаётся допустимым
+    ([3, 2, 5], WARM_B),         # новая цель — Phase II из прежнего базиса
+    (WARM_C, [5, 12, 5]),        # базис недопустим, но двойственно допустим
+    ([1, 5, 1], [5, 1, 5]),      # ни то ни другое — решаем с нуля
+])
+def test_warm_start_matches_cold(backend, c, b):
+    base_res = simplex(WARM_C, WARM_A, WARM_B, backend=backend)
+    assert base_res.basis is not None and len(base_res.basis) == len(WARM_B)
+
+    cold = simplex(c, WARM_A, b, backend=backend)
+    warm = simplex(c, WARM_A, b, backend=backend, warm_start=base_res.basis, record_history='pivots')
+    assert warm.status == cold.status
+    assert pytest.approx(warm.objective, abs=1e-9) == cold.objective
+    assert warm.x == pytest.approx(cold.x, abs=1e-9)
+
+
+def test_warm_start_skips_phase1():
+    first = simplex(WARM_C, WARM_A, WARM_B)
+    cold = simplex(WARM_C, WARM_A, [6, 7, 5], record_history='pivots')
+    warm = simplex(WARM_C, WARM_A, [6, 7, 5], warm_start=first.basis, record_history='pivots')
+    assert not any(isinstance(e, PhaseChange) for e in warm.history)
+    assert len(warm.history) < len(cold.history)
+    # журнал тёплого старта восстанавливает финальную таблицу
+    assert warm.history.tableau() == warm.tableau
+
+
+def test_warm_start_bad_basis_falls_back():
+    res = simplex(WARM_C, WARM_A, WARM_B, warm_start=[0, 0, 99])
+    assert res.status == 'optimal'
+    assert pytest.approx(res.objective) == 16.0
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse'])
+def test_phase1_artificial_does_not_reenter(backend):
+    # x <= 1 и x >= 3 несовместны: искусственная переменная не должна обнулять цель Phase I
+    assert simplex([1], [[1], [1]], [1, 3], ['<=', '>='], backend=backend).status == 'infeasible'
+    assert simplex([4], [[1], [-2], [1]], [11, 10, 1], ['==', '<=', '<='], backend=backend).status == 'infeasible'
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse', 'integer'])
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+def test_zero_artificial_is_driven_out(backend, solver):
+    # после Phase I искусственная переменная строки '>=' остаётся в базисе на нуле;
+    # если её не вывести, Phase II может уйти в неё с отрицательной стороны
+    res = solver([2, 6], [[5, -1], [4, 0]], [10, 8], ['>=', '<='], backend=backend)
+    assert res.status == 'optimal'
+    assert res.objective == pytest.approx(4.0)
+    assert res.x == pytest.approx([2.0, 0.0])
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse', 'integer'])
+def test_crash_covers_triangular_equalities(backend):
+    # нижнетреугольная система: crash вводит по столбцу на каждую строку, Phase I не нужна
+    res = simplex([1, 1, 1], [[1, 0, 0], [1, 1, 0], [0, 1, 1]], [1, 3, 4], ['=='] * 3, backend=backend)
+    assert res.status == 'optimal'
+    assert res.x == pytest.approx([1, 2, 2])
+    assert res.stats.pivots == {'phase1': 3}
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse', 'integer'])
+def test_slack_basis_skips_phase1(backend):
+    res = simplex(WARM_C, WARM_A, WARM_B, backend=backend)
+    assert res.status == 'optimal'
+    assert 'phase1' not in res.stats.pivots
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse', 'integer'])
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+def test_negative_rhs_against_scipy(backend, solver):
+    import random
+    from simplex.base import get_backend
+    be = get_backend(backend)
+    rng = random.Random(11)
+    for _ in range(25):
+        m, n = rng.randint(2, 5), rng.randint(2, 5)
+        A = [[rng.randint(-4, 6) for _ in range(n)] for _ in range(m)]
+        b = [rng.randint(-8, 12) for _ in range(m)]
+        senses = [rng.choice(['<=', '>=', '==']) for _ in range(m)]
+        c = [rng.randint(-5, 5) for _ in range(n)]
+        # ограничивающая строка, чтобы задача не уходила на бесконечность
+        A.append([1] * n)
+        b.append(30)
+        senses.append('<=')
+        status, _, fun = linprog_solve([-v for v in c], A, b, senses)
+        res = solver(c, A, b, senses, backend=backend, record_history='pivots')
+        assert res.status == ('optimal' if status == 0 else 'infeasible')
+        if res.status == 'optimal':
+            assert float(res.objective) == pytest.approx(-fun, abs=1e-7)
+            # журнал восстанавливает финальную таблицу по задаче с перевёрнутыми строками
+            assert float(be.objective(res.history.tableau())) == pytest.approx(float(res.objective), abs=1e-7)
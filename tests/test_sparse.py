@@ -0,0 +1,96 @@
+"""
+Pytest tests for sparse constraint matrices (scipy.sparse and CSR triples).
+"""
+import numpy as np
+import pytest
+from scipy import sparse as sp
+from scipy.optimize import linprog
+
+from simplex import simplex, dual_simplex, solve_integer, revised_simplex
+from simplex.sparse import SparseRow, append_column, append_row, delete_row
+
+
+def csr_triple(A):
+    M = sp.csr_matrix(A)
+    return list(M.data), list(M.indices), list(M.indptr)
+
+
+CASES = [
+    {'c': [3, 2], 'A': [[1, 2], [4, 0]], 'b': [4, 12], 'senses': None},
+    {'c': [1, 1], 'A': [[1, -1]], 'b': [1], 'senses': None},
+    {'c': [1, 1], 'A': [[1, 0], [0, 1], [1, 1]], 'b': [1, 1, 2], 'senses': None},
+    {'c': [1, 0], 'A': [[1, -2], [-1, 1], [0, 1]], 'b': [0, 0, 1], 'senses': None},
+    {'c': [1, 2], 'A': [[1, 1], [1, 2]], 'b': [5, 8], 'senses': ['>=', '==']},
+    {'c': [2, 3], 'A': [[1, 1]], 'b': [4], 'senses': ['==']},
+]
+
+
+@pytest.mark.parametrize("to_sparse", [sp.csr_matrix, sp.csc_matrix, csr_triple])
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+@pytest.mark.parametrize("case", CASES)
+def test_sparse_matches_dense(to_sparse, solver, case):
+    dense = solver(case['c'], case['A'], case['b'], case['senses'])
+    res = solver(case['c'], to_sparse(case['A']), case['b'], case['senses'])
+    assert res.status == dense.status
+    assert res.objective == dense.objective
+    assert res.x == dense.x
+    assert res.alternative == dense.alternative
+
+
+def test_sparse_tableau_stays_sparse():
+    rng = np.random.default_rng(0)
+    m, n = 30, 60
+    A = sp.random(m, n, density=0.05, random_state=1, format='csr') * 10
+    b = rng.uniform(1, 10, size=m)
+    c = rng.uniform(1, 5, size=n)
+
+    res = simplex(c.tolist(), A, b.tolist())
+    lp = linprog(-c, A_ub=A, b_ub=b, bounds=(0, None), method='highs')
+
+    assert res.status == ('optimal' if lp.status == 0 else 'unbounded')
+    assert all(isinstance(row, SparseRow) for row in res.tableau)
+    if lp.status == 0:
+        assert pytest.approx(res.objective, rel=1e-9) == -lp.fun
+        # далеко не все m * (n + m) клеток хранятся
+        assert sum(len(row) for row in res.tableau) < m * (n + m) // 2
+
+
+def test_sparse_float_and_revised():
+    A = sp.csr_matrix([[1, 1, 1], [2, 0, 1], [0, 1, 2]])
+    for res in (simplex([3, 2, 4], A, [5, 6, 5], backend='float'),
+                revised_simplex([3, 2, 4], A, [5, 6, 5])):
+        assert res.status == 'optimal'
+        assert pytest.approx(res.objective) == 16.0
+        assert res.x == pytest.approx([2.0, 1.0, 2.0])
+
+
+@pytest.mark.parametrize("to_sparse", [sp.csr_matrix, csr_triple])
+def test_sparse_integer(to_sparse):
+    A = [[1, 1, 1], [2, 0, 1], [0, 1, 2]]
+    res, x = solve_integer([3, 2, 4], to_sparse(A), [5, 6, 5])
+    assert res.status == 'optimal'
+    assert x == [2, 1, 2]
+
+
+@pytest.mark.parametrize("A", [((1, 2), (3, 4), (5, 6)), ((1, 2), (0, 1), (0, 2))])
+@pytest.mark.parametrize("backend", [None, 'float'])
+def test_three_row_tuple_is_dense(A, backend):
+    # a dense matrix given as a tuple of three rows is not a CSR triple
+    b = [4, 10, 12]
+    ref = simplex([1, 1], [list(row) for row in A], b)
+    for solver in (simplex, dual_simplex):
+        res = solver([1, 1], A, b, backend=backend)
+        assert res.objective == pytest.approx(ref.objective) and res.x == pytest.approx(ref.x)
+    assert revised_simplex([1, 1], A, b).objective == pytest.approx(ref.objective)
+    assert solve_integer([1, 1], A, b, backend=backend)[0].status == 'optimal'
+
+
+def test_three_row_tuple_edits_stay_dense():
+    A = ((1, 2), (0, 1), (0, 2))
+    assert append_row(A, [3, 4], 3) == [[1, 2], [0, 1], [0, 2], [3, 4]]
+    assert delete_row(A, 1, 3) == [[1, 2], [0, 2]]
+    assert append_column(A, [5, 6, 7], 2) == [[1, 2, 5], [0, 1, 6], [0, 2, 7]]
+    # the same values as a real CSR triple with two rows
+    triple = csr_triple([[1, 0], [0, 2]])
+    assert append_row(triple, [0, 3], 2) == ([1, 2, 3], [0, 1, 1], [0, 1, 2, 3])
+    assert delete_row(triple, 0, 2) == ([2], [1], [0, 1])
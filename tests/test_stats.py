@@ -0,0 +1,113 @@
+"""
+Pytest tests for per-solve statistics (result.stats) and the callback(event) hook.
+"""
+import pytest
+
+from simplex import simplex, dual_simplex, solve_integer
+from simplex.history import Pivot, Flip
+from simplex.stats import SolveEvent, SolveStats
+
+
+CASES = [
+    {'c': [3, 2], 'A': [[1, 2], [4, 0]], 'b': [4, 12], 'senses': None},
+    {'c': [1, 0], 'A': [[1, -2], [-1, 1], [0, 1]], 'b': [0, 0, 1], 'senses': None},
+    {'c': [1, 2], 'A': [[1, 1], [1, 2]], 'b': [5, 8], 'senses': ['>=', '==']},
+    {'c': [1, 1], 'A': [[1, -1]], 'b': [1], 'senses': None},
+]
+
+KNAPSACK = ([10, 13, 18, 31, 7, 15], [[11, 15, 20, 35, 10, 33], [3, 4, 5, 7, 2, 6]], [47, 15])
+
+
+@pytest.mark.parametrize("backend", ['fraction', 'float', 'sparse', 'integer'])
+@pytest.mark.parametrize("solver", [simplex, dual_simplex])
+@pytest.mark.parametrize("case", CASES)
+def test_stats_count_logged_pivots(backend, solver, case):
+    events = []
+    res = solver(case['c'], case['A'], case['b'], case['senses'], backend=backend, record_history='pivots',
+                 callback=events.append)
+    pivots = [e for e in res.history if isinstance(e, Pivot)]
+    assert res.stats.total_pivots == len(pivots)
+    assert [e.detail for e in events if e.kind == 'pivot'] == pivots
+    assert all(isinstance(e, SolveEvent) and e.stats is res.stats for e in events)
+    assert set(res.stats.pivots) <= {'phase1', 'phase2', 'dual'}
+    assert res.stats.time >= sum(res.stats.phase_time.values()) > 0
+
+
+def test_degenerate_pivots():
+    case = CASES[1]
+    res = simplex(case['c'], case['A'], case['b'])
+    assert res.stats.degenerate_pivots > 0
+    assert simplex(*[CASES[0][k] for k in ('c', 'A', 'b')]).stats.degenerate_pivots == 0
+
+
+def test_dual_phase_and_warm_start_counted():
+    c, A = [3, 2], [[1, 1], [0.5, 1]]
+    first = simplex(c, A, [10, 6])
+    # the old basis is dual feasible but x1 = 10 violates the second row
+    res = simplex(c, A, [10, 2], warm_start=first.basis)
+    assert res.stats.pivots['warm'] > 0
+    assert res.stats.pivots['dual'] > 0
+    assert 'dual' in res.stats.phase_time
+
+
+def test_bound_flips_counted():
+    res = simplex([1, 1], [[1, 2], [2, 1]], [8, 8], bounds=[(0, 1), (0, 1)], record_history='pivots')
+    assert res.stats.flips == sum(isinstance(e, Flip) for e in res.history) > 0
+
+
+def test_callback_aborts_solve():
+    case = CASES[2]
+    res = simplex(case['c'], case['A'], case['b'], case['senses'], callback=lambda e: e.kind == 'pivot')
+    assert res.status == 'aborted'
+    assert res.stats.total_pivots == 1
+    assert res.tableau is not None
+
+
+def test_stats_on_every_result():
+    res = simplex([1, 1], [[1, 0], [0, 1]], [-1, -1])
+    assert res.status == 'infeasible' and isinstance(res.stats, SolveStats)
+    res = simplex([1, 1], [[1, 1]], [2], presolve=True, callback=lambda e: None)
+    assert isinstance(res.stats, SolveStats)
+
+
+def test_branch_and_bound_stats():
+    c, A, b = KNAPSACK
+    progress, nodes = [], []
+    res, x = solve_integer(c, A, b, on_progress=progress.append,
+                           callback=lambda e: e.kind == 'node' and nodes.append(e.detail))
+    assert res.status == 'optimal'
+    assert res.stats.nodes == len(progress) == len(nodes)
+    assert nodes == progress
+    assert res.stats.infeasible_nodes > 0
+    # the root relaxation pivots are included
+    assert res.stats.total_pivots > 0
+
+
+@pytest.mark.parametrize("workers", [None, 2])
+def test_branch_and_bound_counts_node_pivots(workers):
+    c, A, b = KNAPSACK
+    root = simplex(c, A, b)
+    events = []
+    res, _ = solve_integer(c, A, b, workers=workers, callback=events.append)
+    # dual reoptimisations of the children are counted on top of the root relaxation
+    assert res.stats.pivots['dual'] > 0
+    assert res.stats.total_pivots > root.stats.total_pivots + res.stats.nodes // 2
+    assert res.stats.flips > 0
+    if workers is None:
+        pivots = [e for e in events if e.kind in ('pivot', 'flip')]
+        assert len(pivots) == res.stats.total_pivots + res.stats.flips
+    # a deeper search costs more pivots
+    shallow, _ = solve_integer(c, A, b, workers=workers, node_limit=3)
+    assert shallow.stats.total_pivots < res.stats.total_pivots
+
+
+def test_branch_and_bound_abort_keeps_incumbent():
+    c, A, b = KNAPSACK
+    full, _ = solve_integer(c, A, b, node_selection='depth')
+    res, x = solve_integer(c, A, b, node_selection='depth',
+                           callback=lambda e: e.kind == 'node' and e.detail.incumbent is not None)
+    assert res.status == 'aborted'
+    assert x is not None and res.objective <= full.objective
+    assert res.stats.nodes < full.stats.nodes
+    res, x = solve_integer(c, A, b, callback=lambda e: True)
+    assert res.status == 'aborted' and x is None